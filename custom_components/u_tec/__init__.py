@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
 import logging
 
 import voluptuous as vol
@@ -12,22 +11,34 @@ from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import aiohttp_client, config_entry_oauth2_flow
 import homeassistant.helpers.config_validation as cv
-from utec_py.api import UHomeApi
 
 from . import api
+from .api import UHomeCommandApi
 from .const import (
+    API_BURST,
+    API_RATE_LIMIT,
+    COMMAND_BATCH_WINDOW,
     CONF_DISCOVERY_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_POLL_CHUNK_SIZE,
+    CONF_POLL_CONCURRENCY,
+    CONF_PUSH_DEDUP_WINDOW,
     CONF_PUSH_DEVICES,
     CONF_PUSH_ENABLED,
     CONF_SCAN_INTERVAL,
     DEFAULT_DISCOVERY_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_CHUNK_SIZE,
+    DEFAULT_POLL_CONCURRENCY,
+    DEFAULT_PUSH_DEDUP_WINDOW,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
     YAML_CONFIG_KEY,
 )
-from .coordinator import UhomeDataUpdateCoordinator
+from .coordinator import UhomeDataUpdateCoordinator, cache_store
+from .governor import ApiGovernor, GovernedUHomeApi
 
 _PLATFORMS: list[Platform] = [
     Platform.LOCK,
@@ -48,6 +59,15 @@ CONFIG_SCHEMA = vol.Schema(
                 vol.Optional(CONF_DISCOVERY_INTERVAL, default=DEFAULT_DISCOVERY_INTERVAL): vol.All(
                     cv.positive_int, vol.Range(min=10)
                 ),
+                vol.Optional(CONF_POLL_CHUNK_SIZE, default=DEFAULT_POLL_CHUNK_SIZE): vol.All(
+                    cv.positive_int, vol.Range(min=1)
+                ),
+                vol.Optional(CONF_POLL_CONCURRENCY, default=DEFAULT_POLL_CONCURRENCY): vol.All(
+                    cv.positive_int, vol.Range(min=1)
+                ),
+                vol.Optional(
+                    CONF_PUSH_DEDUP_WINDOW, default=DEFAULT_PUSH_DEDUP_WINDOW
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
             }
         )
     },
@@ -92,6 +112,12 @@ def _resolve_scan_interval(hass: HomeAssistant, entry: ConfigEntry) -> int:
     return max(MIN_SCAN_INTERVAL, min(MAX_SCAN_INTERVAL, value))
 
 
+def _resolve_max_poll_interval(entry: ConfigEntry) -> int:
+    """Return the push-healthy poll ceiling, clamped like scan_interval."""
+    value = int(entry.options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL))
+    return max(MIN_SCAN_INTERVAL, min(MAX_SCAN_INTERVAL, value))
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Uhome from a config entry."""
     implementation = (
@@ -106,7 +132,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         aiohttp_client.async_get_clientsession(hass), session
     )
 
-    Uhomeapi = UHomeApi(auth_data)
+    # Every caller shares one rate governor so background traffic cannot
+    # starve user commands.
+    governor = ApiGovernor(API_RATE_LIMIT, API_BURST)
+    entry.async_on_unload(governor.async_stop)
+    Uhomeapi = GovernedUHomeApi(
+        UHomeCommandApi(auth_data),
+        governor,
+        command_batch_window=COMMAND_BATCH_WINDOW,
+    )
+    entry.async_on_unload(Uhomeapi.async_stop)
 
     # Explicit UI option > configuration.yaml > built-in default.
     yaml_config = hass.data.get(DOMAIN, {}).get(YAML_CONFIG_KEY, {})
@@ -121,14 +156,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         config_entry=entry,
         scan_interval=scan_interval,
         discovery_interval=discovery_interval,
+        max_poll_interval=_resolve_max_poll_interval(entry),
+        poll_chunk_size=yaml_config.get(CONF_POLL_CHUNK_SIZE, DEFAULT_POLL_CHUNK_SIZE),
+        poll_concurrency=yaml_config.get(
+            CONF_POLL_CONCURRENCY, DEFAULT_POLL_CONCURRENCY
+        ),
+        push_dedup_window=yaml_config.get(
+            CONF_PUSH_DEDUP_WINDOW, DEFAULT_PUSH_DEDUP_WINDOW
+        ),
     )
 
-    # Initial discovery populates self.devices before the first state poll.
-    await coordinator.async_discover_devices()
-    _LOGGER.debug("Initial device discovery complete")
+    # With a persisted cache, entities are built from the last known devices
+    # and states, and discovery plus the first poll reconcile them once the
+    # platforms are up. Without one, block on the cloud as before.
+    restored = await coordinator.async_restore_from_cache()
+    if not restored:
+        # Initial discovery populates self.devices before the first state poll.
+        await coordinator.async_discover_devices()
+        _LOGGER.debug("Initial device discovery complete")
 
-    await coordinator.async_config_entry_first_refresh()
-    _LOGGER.debug("First Refresh Completed")
+        await coordinator.async_config_entry_first_refresh()
+        _LOGGER.debug("First Refresh Completed")
 
     # Periodic re-discovery runs on a long interval to pick up added/removed devices.
     await coordinator.async_start_periodic_discovery()
@@ -172,6 +220,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entry.async_on_unload(webhook_handler.unregister_webhook)
     # Stop periodic discovery when the entry is unloaded
     entry.async_on_unload(coordinator.async_stop_periodic_discovery)
+    entry.async_on_unload(coordinator.async_cancel_pending_pushes)
+    entry.async_on_unload(coordinator.async_stop_push_consumer)
+
+    if restored:
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_reconcile_cache(),
+            f"{DOMAIN} reconcile cached devices {entry.entry_id}",
+        )
 
     return True
 
@@ -184,6 +241,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the persisted device/state cache of a deleted entry."""
+    await cache_store(hass, entry.entry_id).async_remove()
+
+
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update.
 
@@ -209,19 +271,15 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
             await webhook_handler.unregister_webhook()
         entry_data["push_enabled"] = new_push_enabled
 
-    # Apply poll interval without a full reload. Setting update_interval alone
-    # may not reschedule an already-pending timer on all HA versions, so call
-    # _schedule_refresh when available (private HA API; getattr guards crashes).
-    if CONF_SCAN_INTERVAL in entry.options:
-        new_interval = max(
-            MIN_SCAN_INTERVAL,
-            min(MAX_SCAN_INTERVAL, int(entry.options[CONF_SCAN_INTERVAL])),
+    # Apply poll intervals without a full reload. The coordinator restarts
+    # from the base interval and re-stretches once push proves healthy again.
+    if CONF_SCAN_INTERVAL in entry.options or CONF_MAX_POLL_INTERVAL in entry.options:
+        new_interval = _resolve_scan_interval(hass, entry)
+        max_interval = _resolve_max_poll_interval(entry)
+        coordinator.set_scan_interval(new_interval, max_interval)
+        _LOGGER.debug(
+            "Updated poll interval to %ds (max %ds)", new_interval, max_interval
         )
-        coordinator.update_interval = timedelta(seconds=new_interval)
-        schedule = getattr(coordinator, "_schedule_refresh", None)
-        if callable(schedule):
-            schedule()
-        _LOGGER.debug("Updated poll interval to %ds", new_interval)
 
 
 async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
@@ -1,9 +1,9 @@
 """API for Uhome bound to Home Assistant OAuth."""
 
-import json
 import logging
 import secrets
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import Any
 
 from aiohttp import ClientSession, web
 
@@ -12,7 +12,9 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_entry_oauth2_flow, network
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.network import NoURLAvailableError
-from utec_py.api import AbstractAuth, UHomeApi
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+from utec_py.api import AbstractAuth, ApiNamespace, ApiOperation, UHomeApi
 from utec_py.exceptions import ApiError, UHomeError
 
 from .const import DOMAIN, WEBHOOK_HANDLER, WEBHOOK_ID_PREFIX
@@ -21,6 +23,9 @@ _LOGGER = logging.getLogger(__name__)
 
 # Re-register the webhook with a fresh secret every 24 hours
 _REREGISTER_INTERVAL = timedelta(hours=24)
+# After a rotation the previous secret stays valid this long, so pushes U-Tec
+# sent (or queued) before it switched over are not rejected.
+_SECRET_GRACE_PERIOD = timedelta(minutes=5)
 
 
 class AsyncConfigEntryAuth(AbstractAuth):
@@ -41,6 +46,22 @@ class AsyncConfigEntryAuth(AbstractAuth):
         return self._oauth_session.token["access_token"]
 
 
+class UHomeCommandApi(UHomeApi):
+    """UHomeApi that can also send several devices' commands in one request."""
+
+    async def send_commands(self, commands: list[dict[str, Any]]) -> dict[str, Any]:
+        """Send one Command request carrying a command for each device.
+
+        Each entry is {"id": device_id, "command": {...}}, the same shape
+        send_command builds for its single device.
+        """
+        payload = await self.async_create_request(
+            ApiNamespace.DEVICE, ApiOperation.COMMAND, {"devices": commands}
+        )
+        _LOGGER.debug("Sending commands to %d devices", len(commands))
+        return await self._async_make_request(json=payload)
+
+
 class AsyncPushUpdateHandler:
     """Handle webhook registration and processing for Uhome API."""
 
@@ -53,6 +74,8 @@ class AsyncPushUpdateHandler:
         self._unregister_webhook = None
         self._cancel_reregister = None
         self._push_secret: str | None = None
+        self._previous_secret: str | None = None
+        self._previous_secret_expires: datetime | None = None
         self.api = api
         self._auth_data = None
         self._used_cloudhook = False
@@ -154,7 +177,11 @@ class AsyncPushUpdateHandler:
         return webhook.async_generate_url(self.hass, self.webhook_id)
 
     async def async_register_webhook(self, auth_data) -> bool:
-        """Register webhook with Home Assistant and the Uhome API."""
+        """Register webhook with Home Assistant and the Uhome API.
+
+        Also used by the daily re-registration, so the URL is resolved on
+        every call and a changed external or cloud URL is picked up.
+        """
         self._auth_data = auth_data
 
         webhook_url = await self._resolve_webhook_url()
@@ -185,16 +212,7 @@ class AsyncPushUpdateHandler:
                 webhook_url,
             )
 
-        # Generate a fresh secret for this registration
-        self._push_secret = self._generate_secret()
-        _LOGGER.debug("Generated new push secret for webhook registration")
-
-        try:
-            _LOGGER.debug("Registering webhook URL: %s", webhook_url)
-            result = await self.api.set_push_status(webhook_url, self._push_secret)
-            _LOGGER.debug("Webhook registration result: %s", result)
-        except ApiError as err:
-            _LOGGER.error("Failed to register webhook with U-Tec API: %s", err)
+        if not await self._async_rotate_secret(webhook_url):
             return False
 
         # Register HA-side webhook handler (only once). webhook.async_register
@@ -226,13 +244,47 @@ class AsyncPushUpdateHandler:
 
         return True
 
+    async def _async_rotate_secret(self, webhook_url: str) -> bool:
+        """Register webhook_url with U-Tec under a fresh secret.
+
+        The new secret is accepted from the moment it is sent, and the one it
+        replaces for _SECRET_GRACE_PERIOD more. If U-Tec rejects the
+        registration, the old secret stays current.
+        """
+        old_secret = self._push_secret
+        self._push_secret = self._generate_secret()
+        if old_secret is not None:
+            self._previous_secret = old_secret
+            self._previous_secret_expires = dt_util.utcnow() + _SECRET_GRACE_PERIOD
+        _LOGGER.debug("Generated new push secret for webhook registration")
+
+        try:
+            _LOGGER.debug("Registering webhook URL: %s", webhook_url)
+            result = await self.api.set_push_status(webhook_url, self._push_secret)
+            _LOGGER.debug("Webhook registration result: %s", result)
+        except ApiError as err:
+            _LOGGER.error("Failed to register webhook with U-Tec API: %s", err)
+            self._push_secret = old_secret
+            self._previous_secret = self._previous_secret_expires = None
+            return False
+        return True
+
+    def _is_valid_secret(self, token: str) -> bool:
+        """Return True for the current secret, or the previous one in its grace."""
+        if secrets.compare_digest(token, self._push_secret):
+            return True
+        return (
+            self._previous_secret is not None
+            and self._previous_secret_expires is not None
+            and dt_util.utcnow() < self._previous_secret_expires
+            and secrets.compare_digest(token, self._previous_secret)
+        )
+
     @callback
     def _async_reregister(self, _now) -> None:
         """Trigger webhook re-registration with a fresh secret (called by scheduler)."""
         _LOGGER.debug("Daily webhook re-registration triggered")
-        self.hass.async_create_task(
-            self.async_register_webhook(self._auth_data)
-        )
+        self.hass.async_create_task(self.async_register_webhook(self._auth_data))
 
     async def unregister_webhook(self) -> None:
         """Unregister the webhook and cancel the re-registration scheduler.
@@ -258,37 +310,28 @@ class AsyncPushUpdateHandler:
     async def _parse_request_body(self, request) -> dict | list:
         """Parse JSON body from either aiohttp Request or cloud MockRequest.
 
-        Nabu Casa cloudhooks deliver a MockRequest that exposes ``json()`` but
-        not ``read()``. Local webhook deliveries use a full aiohttp Request
-        with both. Prefer ``json()`` when available; fall back to ``read()``.
+        Local webhook deliveries are a full aiohttp Request: the raw bytes are
+        read once and decoded with orjson (via HA's json_loads), never parsed
+        twice. Nabu Casa cloudhooks deliver a MockRequest that exposes
+        ``json()`` but not ``read()``; its ``json()`` uses the same decoder.
 
         Accept both object and array top-level JSON — the coordinator already
         normalises list-shaped U-Tec push payloads (issue #30).
         """
-        # Prefer json() — works for cloud MockRequest and aiohttp Request.
-        json_method = getattr(request, "json", None)
-        if callable(json_method):
-            try:
-                data = await json_method()
-                if isinstance(data, (dict, list)):
-                    return data
-            except Exception:  # noqa: BLE001
-                # Fall through to read() path.
-                pass
-
         read_method = getattr(request, "read", None)
         if callable(read_method):
             raw_body = await read_method()
-            if isinstance(raw_body, bytes):
-                data = json.loads(raw_body)
-            elif isinstance(raw_body, str):
-                data = json.loads(raw_body)
-            else:
+            if not isinstance(raw_body, (bytes, str)):
                 raise ValueError("Request body is not valid JSON")
-            if isinstance(data, (dict, list)):
-                return data
+            data = json_loads(raw_body)
+        elif callable(json_method := getattr(request, "json", None)):
+            data = await json_method()
+        else:
+            raise ValueError("Request body is not valid JSON")
 
-        raise ValueError("Request body is not valid JSON")
+        if not isinstance(data, (dict, list)):
+            raise ValueError("Request body is not valid JSON")
+        return data
 
     async def _handle_webhook(
         self, hass: HomeAssistant, webhook_id, request
@@ -305,12 +348,19 @@ class AsyncPushUpdateHandler:
                 _LOGGER.error("Failed to parse webhook JSON: %s", json_err)
                 return web.Response(status=400)
 
-            _LOGGER.debug(
-                "Webhook hit received: method=%s headers=%s data=%s",
-                request.method,
-                dict(getattr(request, "headers", {}) or {}),
-                data,
-            )
+            headers = getattr(request, "headers", None) or {}
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                # Only build the header copy when it is going to be logged,
+                # and never log the push secret.
+                _LOGGER.debug(
+                    "Webhook hit received: method=%s headers=%s data=%s",
+                    request.method,
+                    {
+                        name: "**REDACTED**" if name.lower() == "authorization" else value
+                        for name, value in headers.items()
+                    },
+                    data,
+                )
 
             # Validate the push secret via the Authorization header.
             # U-Tec sends it as "Bearer <access_token>" in the HTTP header.
@@ -321,29 +371,27 @@ class AsyncPushUpdateHandler:
                     "Webhook received before push secret was initialised -- rejecting"
                 )
                 return web.Response(status=401)
-            auth_header = (getattr(request, "headers", {}) or {}).get(
-                "Authorization", ""
-            )
+            auth_header = headers.get("Authorization", "")
             incoming_token = auth_header.removeprefix("Bearer ").strip()
             if not incoming_token:
                 _LOGGER.warning(
                     "Webhook received with no Authorization header -- rejecting"
                 )
                 return web.Response(status=401)
-            if not secrets.compare_digest(incoming_token, self._push_secret):
+            if not self._is_valid_secret(incoming_token):
                 _LOGGER.error(
                     "Webhook received with invalid Bearer token -- rejecting"
                 )
                 return web.Response(status=403)
 
-            _LOGGER.debug("Received webhook data: %s", data)
-
             if self.entry_id not in hass.data.get(DOMAIN, {}):
                 _LOGGER.error("Unknown entry_id in webhook: %s", self.entry_id)
                 return web.Response(status=404)
 
+            # Acknowledge at once; the coordinator applies the push in the
+            # background so slow entity updates never hold U-Tec's request.
             coordinator = hass.data[DOMAIN][self.entry_id]["coordinator"]
-            await coordinator.update_push_data(data)
+            coordinator.enqueue_push_data(data)
 
         except UHomeError as err:
             _LOGGER.error("Error processing webhook: %s", err)
@@ -7,14 +7,20 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from utec_py.devices.lock import Lock as UhomeLock
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    SIGNAL_DEVICE_UPDATE,
+    SIGNAL_NEW_CAPABILITIES,
+    SIGNAL_NEW_DEVICE,
+)
 from .coordinator import UhomeDataUpdateCoordinator
+from .entity import UhomeDeviceEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,24 +33,48 @@ async def async_setup_entry(
     coordinator: UhomeDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
 
     # Add door sensors for locks that have them
-    async_add_entities(
-        UhomeDoorSensor(coordinator, device_id)
-        for device_id, device in coordinator.devices.items()
-        if isinstance(device, UhomeLock) and device.has_door_sensor
-    )
+    async_add_entities(_create_door_sensors(coordinator, coordinator.devices))
+
+    @callback
+    def async_add_new_devices(device_ids: list[str]) -> None:
+        """Add door sensors for locks found, or given one, by a later discovery."""
+        async_add_entities(_create_door_sensors(coordinator, device_ids))
+
+    for signal in (SIGNAL_NEW_DEVICE, SIGNAL_NEW_CAPABILITIES):
+        entry.async_on_unload(
+            async_dispatcher_connect(
+                hass, f"{signal}_{entry.entry_id}", async_add_new_devices
+            )
+        )
+
+
+def _create_door_sensors(coordinator, device_ids):
+    """Create door sensors for the given locks that have none yet."""
+    entities = []
+    for device_id in device_ids:
+        device = coordinator.devices.get(device_id)
+        unique_id = f"{DOMAIN}_door_{device_id}"
+        if (
+            isinstance(device, UhomeLock)
+            and device.has_door_sensor
+            and unique_id not in coordinator.added_sensor_entities
+        ):
+            entities.append(UhomeDoorSensor(coordinator, device_id))
+            coordinator.added_sensor_entities.add(unique_id)
+    return entities
 
 
-class UhomeDoorSensor(CoordinatorEntity, BinarySensorEntity):
+class UhomeDoorSensor(UhomeDeviceEntity, BinarySensorEntity):
     """Representation of a Uhome door sensor."""
 
     _attr_device_class = BinarySensorDeviceClass.DOOR
+    _name_suffix = " Door"
 
     def __init__(self, coordinator: UhomeDataUpdateCoordinator, device_id: str) -> None:
         """Initialize the door sensor."""
         super().__init__(coordinator)
         self._device = cast(UhomeLock, coordinator.devices[device_id])
         self._attr_unique_id = f"{DOMAIN}_door_{device_id}"
-        self._attr_name = f"{self._device.name} Door"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._device.device_id)},
             name=self._device.name,
@@ -54,12 +84,9 @@ class UhomeDoorSensor(CoordinatorEntity, BinarySensorEntity):
         )
 
     @property
-    def available(self) -> bool:
-        """Return True if entity is available.
-
-        Unavailable only when the device is offline or two consecutive polls failed.
-        """
-        return self.coordinator.poll_healthy_enough and self._device.available
+    def assumed_state(self) -> bool:
+        """Return True while the value is restored from the startup cache."""
+        return self._device.device_id in self.coordinator.restored_device_ids
 
     @property
     def is_on(self) -> bool | None:
@@ -69,3 +96,25 @@ class UhomeDoorSensor(CoordinatorEntity, BinarySensorEntity):
             if self._device.is_door_closed is not None
             else None
         )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the update touched this device."""
+        if self.coordinator.device_changed(self._device.device_id):
+            super()._handle_coordinator_update()
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{SIGNAL_DEVICE_UPDATE}_{self._device.device_id}",
+                self._handle_push_update,
+            )
+        )
+
+    @callback
+    def _handle_push_update(self, push_data) -> None:
+        """Update door state from push data."""
+        self.async_write_ha_state()
@@ -40,16 +40,28 @@ from utec_py.devices.lock import Lock as UhomeLock
 from utec_py.devices.switch import Switch as UhomeSwitch
 
 from .const import (
+    CONF_CONFIRMED_STATE_MAX_AGE,
     CONF_HA_DEVICES,
+    CONF_MAX_POLL_INTERVAL,
     CONF_OPTIMISTIC_LIGHTS,
     CONF_OPTIMISTIC_LOCKS,
     CONF_OPTIMISTIC_SWITCHES,
+    CONF_PUSH_AWARE_POLLING,
+    CONF_PUSH_COALESCE_WINDOW,
     CONF_PUSH_DEVICES,
     CONF_PUSH_ENABLED,
     CONF_SCAN_INTERVAL,
+    CONF_SKIP_REDUNDANT_COMMANDS,
     DEFAULT_API_SCOPE,
+    DEFAULT_CONFIRMED_STATE_MAX_AGE,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_PUSH_AWARE_POLLING,
+    DEFAULT_PUSH_COALESCE_WINDOW,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SKIP_REDUNDANT_COMMANDS,
     DOMAIN,
+    MAX_CONFIRMED_STATE_MAX_AGE,
+    MAX_PUSH_COALESCE_WINDOW,
     MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
     OAUTH2_AUTHORIZE,
@@ -311,13 +323,31 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         user_input: dict[str, Any] | None = None,
     ) -> ConfigFlowResult:
         """Configure how often device state is polled from the U-Tec API."""
+        interval = vol.All(
+            vol.Coerce(int),
+            vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+        )
         if user_input is not None:
-            self.options[CONF_SCAN_INTERVAL] = vol.All(
-                vol.Coerce(int),
-                vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
-            )(user_input[CONF_SCAN_INTERVAL])
+            self.options[CONF_SCAN_INTERVAL] = interval(user_input[CONF_SCAN_INTERVAL])
+            if CONF_MAX_POLL_INTERVAL in user_input:
+                self.options[CONF_MAX_POLL_INTERVAL] = interval(
+                    user_input[CONF_MAX_POLL_INTERVAL]
+                )
+            if CONF_PUSH_AWARE_POLLING in user_input:
+                self.options[CONF_PUSH_AWARE_POLLING] = user_input[
+                    CONF_PUSH_AWARE_POLLING
+                ]
             return self.async_create_entry(title="", data=self.options)
 
+        seconds_selector = NumberSelector(
+            NumberSelectorConfig(
+                min=MIN_SCAN_INTERVAL,
+                max=MAX_SCAN_INTERVAL,
+                step=5,
+                unit_of_measurement="seconds",
+                mode=NumberSelectorMode.BOX,
+            )
+        )
         return self.async_show_form(
             step_id="polling_interval",
             data_schema=vol.Schema(
@@ -325,15 +355,19 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Required(
                         CONF_SCAN_INTERVAL,
                         default=self._default_scan_interval(),
-                    ): NumberSelector(
-                        NumberSelectorConfig(
-                            min=MIN_SCAN_INTERVAL,
-                            max=MAX_SCAN_INTERVAL,
-                            step=5,
-                            unit_of_measurement="seconds",
-                            mode=NumberSelectorMode.BOX,
-                        )
-                    ),
+                    ): seconds_selector,
+                    vol.Required(
+                        CONF_MAX_POLL_INTERVAL,
+                        default=self.options.get(
+                            CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+                        ),
+                    ): seconds_selector,
+                    vol.Required(
+                        CONF_PUSH_AWARE_POLLING,
+                        default=self.options.get(
+                            CONF_PUSH_AWARE_POLLING, DEFAULT_PUSH_AWARE_POLLING
+                        ),
+                    ): BooleanSelector(),
                 }
             ),
         )
@@ -346,6 +380,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             self.options[CONF_PUSH_ENABLED] = user_input[CONF_PUSH_ENABLED]
+            if CONF_PUSH_COALESCE_WINDOW in user_input:
+                self.options[CONF_PUSH_COALESCE_WINDOW] = int(
+                    user_input[CONF_PUSH_COALESCE_WINDOW]
+                )
 
             if user_input[CONF_PUSH_ENABLED]:
                 return await self.async_step_push_device_selection()
@@ -360,6 +398,20 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_PUSH_ENABLED,
                         default=self.options.get(CONF_PUSH_ENABLED, True),
                     ): BooleanSelector(),
+                    vol.Required(
+                        CONF_PUSH_COALESCE_WINDOW,
+                        default=self.options.get(
+                            CONF_PUSH_COALESCE_WINDOW, DEFAULT_PUSH_COALESCE_WINDOW
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=MAX_PUSH_COALESCE_WINDOW,
+                            step=50,
+                            unit_of_measurement="ms",
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
                 }
             ),
         )
@@ -404,7 +456,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self,
         user_input: dict[str, Any] | None = None,
     ) -> ConfigFlowResult:
-        """Configure optimistic updates per device type."""
+        """Configure optimistic updates per device type, and redundant-command skipping."""
         mode_selector = SelectSelector(
             SelectSelectorConfig(
                 options=OPTIMISTIC_MODES,
@@ -414,6 +466,14 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         )
 
         if user_input is not None:
+            if CONF_SKIP_REDUNDANT_COMMANDS in user_input:
+                self.options[CONF_SKIP_REDUNDANT_COMMANDS] = user_input[
+                    CONF_SKIP_REDUNDANT_COMMANDS
+                ]
+            if CONF_CONFIRMED_STATE_MAX_AGE in user_input:
+                self.options[CONF_CONFIRMED_STATE_MAX_AGE] = int(
+                    user_input[CONF_CONFIRMED_STATE_MAX_AGE]
+                )
             self._pending_pickers = []
             for conf_key, field in (
                 (CONF_OPTIMISTIC_LIGHTS, "lights_mode"),
@@ -440,6 +500,28 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Required("lights_mode", default=lights_default): mode_selector,
                     vol.Required("switches_mode", default=switches_default): mode_selector,
                     vol.Required("locks_mode", default=locks_default): mode_selector,
+                    vol.Required(
+                        CONF_SKIP_REDUNDANT_COMMANDS,
+                        default=self.options.get(
+                            CONF_SKIP_REDUNDANT_COMMANDS,
+                            DEFAULT_SKIP_REDUNDANT_COMMANDS,
+                        ),
+                    ): BooleanSelector(),
+                    vol.Required(
+                        CONF_CONFIRMED_STATE_MAX_AGE,
+                        default=self.options.get(
+                            CONF_CONFIRMED_STATE_MAX_AGE,
+                            DEFAULT_CONFIRMED_STATE_MAX_AGE,
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=1,
+                            max=MAX_CONFIRMED_STATE_MAX_AGE,
+                            step=1,
+                            unit_of_measurement="seconds",
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
                 }
             ),
         )
@@ -22,6 +22,22 @@ DOMAIN = "u_tec"
 # https://github.com/LF2b2w/Uhome-HA/issues/58
 OPTIMISTIC_TIMEOUT = timedelta(seconds=30)
 
+# Opt-in: a lock/unlock or on/off command whose target the device already
+# reports is answered without calling U-Tec, provided that state arrived by
+# push or poll within confirmed_state_max_age seconds and no other command on
+# the device is still awaiting confirmation. Never applies to Passage-mode
+# locks or to light commands that set brightness or colour.
+CONF_SKIP_REDUNDANT_COMMANDS = "skip_redundant_commands"
+CONF_CONFIRMED_STATE_MAX_AGE = "confirmed_state_max_age"
+DEFAULT_SKIP_REDUNDANT_COMMANDS = False
+DEFAULT_CONFIRMED_STATE_MAX_AGE = 30  # seconds
+MAX_CONFIRMED_STATE_MAX_AGE = 300  # seconds
+
+# After a command, only the commanded device is polled to confirm it: first
+# after CONFIRM_POLL_FIRST_DELAY, then with doubling delays until the commanded
+# state is seen or OPTIMISTIC_TIMEOUT has passed.
+CONFIRM_POLL_FIRST_DELAY = 1  # seconds
+
 # How many consecutive coordinator poll failures are allowed before entities
 # report unavailable. One failure is treated as a transient blip; two in a
 # row (or a device that reports offline) marks entities unavailable.
@@ -33,9 +49,90 @@ CONF_DISCOVERY_INTERVAL = "discovery_interval"
 
 DEFAULT_SCAN_INTERVAL = 10  # seconds
 DEFAULT_DISCOVERY_INTERVAL = 300  # seconds (5 minutes)
+# Consecutive discoveries a known device must be missing from before it (and
+# its entities) is removed, so one truncated cloud answer deletes nothing.
+DISCOVERY_MISSES_BEFORE_REMOVAL = 3
 MIN_SCAN_INTERVAL = 10
 MAX_SCAN_INTERVAL = 3600
 
+# Large accounts are polled in chunks of at most poll_chunk_size devices, with
+# up to poll_concurrency chunk requests in flight at once. A failed chunk only
+# counts against the devices it carried. configuration.yaml only.
+CONF_POLL_CHUNK_SIZE = "poll_chunk_size"
+CONF_POLL_CONCURRENCY = "poll_concurrency"
+DEFAULT_POLL_CHUNK_SIZE = 50
+DEFAULT_POLL_CONCURRENCY = 4
+
+# Ceiling the coordinator may stretch the poll interval to while the push
+# channel is delivering state. Polling snaps back to scan_interval as soon as
+# push goes quiet for PUSH_STALE_AFTER.
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+DEFAULT_MAX_POLL_INTERVAL = 300  # seconds
+PUSH_STALE_AFTER = timedelta(minutes=15)
+
+# Opt-in polling mode: devices that pushed within PUSH_STALE_AFTER are left out
+# of the bulk poll and only re-polled on the slow fallback cadence, so the
+# request scales with the number of devices push does not cover.
+CONF_PUSH_AWARE_POLLING = "push_aware_polling"
+DEFAULT_PUSH_AWARE_POLLING = False
+PUSH_FALLBACK_POLL_INTERVAL = timedelta(minutes=10)
+
+# Circuit breaker for polling. After BREAKER_FAILURE_THRESHOLD consecutive
+# failed polls (API errors or timeouts; auth failures go to reauth instead)
+# polling backs off exponentially with jitter, up to BREAKER_MAX_BACKOFF. When
+# the backoff has elapsed, a single-device probe decides whether full polls
+# resume.
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_MAX_BACKOFF = timedelta(minutes=10)
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Optional push coalescing: pushes for one device that arrive within this many
+# milliseconds of the first are merged and applied as a single state write.
+# U-Tec often sends several webhooks (bolt, lock state, door, battery) for one
+# physical event. 0 applies every push as it arrives.
+CONF_PUSH_COALESCE_WINDOW = "push_coalesce_window"
+DEFAULT_PUSH_COALESCE_WINDOW = 0  # milliseconds
+MAX_PUSH_COALESCE_WINDOW = 2000  # milliseconds
+
+# Byte-identical redeliveries of a device's push within CONF_PUSH_DEDUP_WINDOW
+# seconds are acknowledged and dropped. The last PUSH_DEDUP_SIZE payload
+# digests are remembered per device. 0 disables. configuration.yaml only.
+CONF_PUSH_DEDUP_WINDOW = "push_dedup_window"
+DEFAULT_PUSH_DEDUP_WINDOW = 60  # seconds
+PUSH_DEDUP_SIZE = 8
+
+# The webhook only validates a push and queues it; a background consumer
+# applies queued pushes in order. When PUSH_QUEUE_SIZE pushes are waiting, the
+# oldest is dropped to make room.
+PUSH_QUEUE_SIZE = 100
+
+# Reasons reported alongside the coordinator's effective poll interval.
+POLL_REASON_PUSH_DISABLED = "push_disabled"
+POLL_REASON_NO_PUSH = "no_push_received"
+POLL_REASON_PUSH_STALE = "push_stale"
+POLL_REASON_PARTIAL_PUSH = "partial_push_coverage"
+POLL_REASON_PUSH_HEALTHY = "push_healthy"
+
+# Every request to the U-Tec cloud draws a token from a per-entry bucket
+# holding API_BURST tokens and refilling at API_RATE_LIMIT per second. Queued
+# requests are released by priority: commands, confirmations, polls, then
+# discovery/diagnostics.
+API_RATE_LIMIT = 2.0  # requests per second
+API_BURST = 10
+
+# Device commands issued within this window of the first (a scene or
+# automation acting on many devices) go out as one multi-device request.
+COMMAND_BATCH_WINDOW = 0.005  # seconds
+
+# Per-entry Store holding the last discovery records and device states, so a
+# restart builds entities immediately and reconciles with the cloud in the
+# background. Writes are debounced by STORAGE_SAVE_DELAY.
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.cache"
+STORAGE_SAVE_DELAY = 30  # seconds
+
 # Key used inside hass.data[DOMAIN] for yaml-sourced config (separate from entry IDs).
 YAML_CONFIG_KEY = "_yaml_config"
 
@@ -49,8 +146,18 @@ DEFAULT_API_SCOPE = "openapi"
 
 API_BASE_URL = "https://api.u-tec.com/action"
 
+# Per-entry signal carrying the list of device ids a discovery added.
 SIGNAL_NEW_DEVICE = f"{DOMAIN}_new_device"
+# Per-entry signal carrying the ids of known devices that a discovery gave
+# new capabilities, for platforms whose entities depend on a capability.
+SIGNAL_NEW_CAPABILITIES = f"{DOMAIN}_new_capabilities"
+# Per-device signal sent after a push was applied, carrying only the states
+# the push itself delivered ({capability: {name: value}}); the device already
+# holds the merged full state.
 SIGNAL_DEVICE_UPDATE = f"{DOMAIN}_device_update"
+# Per-entry "a push arrived" notification for coordinator-level entities, sent
+# instead of waking every coordinator listener on each push.
+SIGNAL_PUSH_RECEIVED = f"{DOMAIN}_push_received"
 
 WEBHOOK_ID_PREFIX = "u_tec_push_"
 WEBHOOK_HANDLER = 'u_tec_webhook_handler'
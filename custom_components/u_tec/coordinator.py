@@ -1,21 +1,71 @@
 """Data coordinator for Uhome integration."""
 
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Callable
 from datetime import datetime, timedelta
+import hashlib
+import json
 import logging
+import random
+from typing import Any
+
+from aiohttp import ClientError
 
 from custom_components.u_tec.const import (
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_HALF_OPEN,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_OPEN,
+    CONF_CONFIRMED_STATE_MAX_AGE,
+    CONF_PUSH_AWARE_POLLING,
+    CONF_PUSH_COALESCE_WINDOW,
+    CONF_PUSH_ENABLED,
+    CONF_SKIP_REDUNDANT_COMMANDS,
+    CONFIRM_POLL_FIRST_DELAY,
+    DEFAULT_CONFIRMED_STATE_MAX_AGE,
     DEFAULT_DISCOVERY_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_CHUNK_SIZE,
+    DEFAULT_POLL_CONCURRENCY,
+    DEFAULT_PUSH_AWARE_POLLING,
+    DEFAULT_PUSH_COALESCE_WINDOW,
+    DEFAULT_PUSH_DEDUP_WINDOW,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SKIP_REDUNDANT_COMMANDS,
+    DISCOVERY_MISSES_BEFORE_REMOVAL,
+    DOMAIN,
     MAX_CONSECUTIVE_UPDATE_FAILURES,
+    OPTIMISTIC_TIMEOUT,
+    POLL_REASON_NO_PUSH,
+    POLL_REASON_PARTIAL_PUSH,
+    POLL_REASON_PUSH_DISABLED,
+    POLL_REASON_PUSH_HEALTHY,
+    POLL_REASON_PUSH_STALE,
+    PUSH_DEDUP_SIZE,
+    PUSH_FALLBACK_POLL_INTERVAL,
+    PUSH_QUEUE_SIZE,
+    PUSH_STALE_AFTER,
     SIGNAL_DEVICE_UPDATE,
+    SIGNAL_NEW_CAPABILITIES,
     SIGNAL_NEW_DEVICE,
+    SIGNAL_PUSH_RECEIVED,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
 )
+from custom_components.u_tec.governor import LANE_CONFIRM, api_lane
+from custom_components.u_tec.optimistic import OptimisticLedger
+from custom_components.u_tec.push_stats import PushStats
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 from utec_py.api import UHomeApi
@@ -23,7 +73,7 @@ from utec_py.devices.device import BaseDevice
 from utec_py.devices.light import Light
 from utec_py.devices.lock import Lock
 from utec_py.devices.switch import Switch
-from utec_py.exceptions import ApiError, AuthenticationError
+from utec_py.exceptions import ApiError, AuthenticationError, DeviceError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,6 +106,84 @@ def _raise_for_error_payload(response, *, auth_only: bool = False) -> None:
         raise UpdateFailed(f"U-Tec API error {code}: {message}")
 
 
+def _device_class_for(handle_type: str) -> type[BaseDevice] | None:
+    """Return the utec_py device class for a discovery handleType, if supported."""
+    handle_type = handle_type.lower()
+    # "dimmer" check must come before "switch" since "utec-dimmer"
+    # contains neither "light" nor "switch".
+    if "lock" in handle_type:
+        return Lock
+    if "dimmer" in handle_type or "light" in handle_type or "bulb" in handle_type:
+        return Light
+    if "switch" in handle_type:
+        return Switch
+    return None
+
+
+# BaseDevice attributes derived from its discovery record. State and the API
+# client are not among them, so a device can take a fresh record in place.
+_DISCOVERY_FIELDS = (
+    "_discovery_data",
+    "_name",
+    "_handle_type",
+    "_category",
+    "_device_info",
+    "_attributes",
+    "_supported_capabilities",
+)
+
+
+def _update_device_from_discovery(device: BaseDevice, fresh: BaseDevice) -> None:
+    """Copy the discovery-derived fields of ``fresh`` onto ``device``.
+
+    utec_py devices have no way to take a new discovery record, and entities
+    hold on to the device object, so the fields are copied across instead.
+    """
+    for name in _DISCOVERY_FIELDS:
+        setattr(device, name, getattr(fresh, name))
+
+
+def _fingerprint(data) -> str:
+    """Return a stable digest of JSON-compatible data."""
+    return hashlib.sha1(
+        json.dumps(data, sort_keys=True, default=str).encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+def _merge_device_states(base: dict, update: dict) -> dict:
+    """Merge two state payloads for one device; ``update`` wins per state.
+
+    States are keyed by (capability, name), so a later push only replaces the
+    states it carries.
+    """
+    states = {
+        (state.get("capability"), state.get("name")): state
+        for payload in (base, update)
+        for state in payload.get("states") or []
+        if isinstance(state, dict)
+    }
+    return {**base, **update, "states": list(states.values())}
+
+
+def _states_by_capability(device_data: dict) -> dict[str, dict[str, Any]]:
+    """Return a state payload as {capability: {name: value}}.
+
+    Same shape as BaseDevice.get_state_data().
+    """
+    states: dict[str, dict[str, Any]] = {}
+    for state in device_data.get("states") or []:
+        if isinstance(state, dict) and state.get("capability") and state.get("name"):
+            states.setdefault(state["capability"], {})[state["name"]] = state.get(
+                "value"
+            )
+    return states
+
+
+def cache_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the Store persisting an entry's discovery records and states."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+
+
 class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Uhome data."""
 
@@ -66,6 +194,10 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
         config_entry: ConfigEntry,
         scan_interval: int = DEFAULT_SCAN_INTERVAL,
         discovery_interval: int = DEFAULT_DISCOVERY_INTERVAL,
+        max_poll_interval: int = DEFAULT_MAX_POLL_INTERVAL,
+        poll_chunk_size: int = DEFAULT_POLL_CHUNK_SIZE,
+        poll_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        push_dedup_window: int = DEFAULT_PUSH_DEDUP_WINDOW,
     ) -> None:
         """Initialize the coordinator."""
         super().__init__(
@@ -78,9 +210,28 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
         self.config_entry = config_entry
         self.devices: dict[str, BaseDevice] = {}
         self.added_sensor_entities = set()
+        # Consecutive discoveries each known device has been missing from.
+        self._discovery_misses: dict[str, int] = {}
         self.push_devices = []
         self.blacklisted_devices = []
         self.last_push_received: datetime | None = None
+        self.push_stats = PushStats()
+        # When the most recent poll started; with update_interval it tells
+        # how long a pushed change would have waited for the next poll.
+        self.last_poll_started: datetime | None = None
+        # Per-device time of the last authenticated push carrying its state.
+        self.device_push_received: dict[str, datetime] = {}
+        # Per-device time of the last successful poll that included it.
+        self.device_polled_at: dict[str, datetime] = {}
+        # update_interval is the *effective* interval and is stretched towards
+        # the ceiling while push is healthy; the base is what it snaps back to.
+        self.base_update_interval = timedelta(seconds=scan_interval)
+        self.max_update_interval = timedelta(
+            seconds=max(scan_interval, max_poll_interval)
+        )
+        self.poll_interval_reason = POLL_REASON_NO_PUSH
+        self._poll_chunk_size = max(1, poll_chunk_size)
+        self._poll_concurrency = max(1, poll_concurrency)
         self._discovery_interval = timedelta(seconds=discovery_interval)
         self._cancel_discovery: callable | None = None
         # Consecutive failed polls. Entities stay available through a single
@@ -88,9 +239,71 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
         # unavailable. Auth failures set the counter to the threshold immediately
         # because HA stops rescheduling after ConfigEntryAuthFailed.
         self.consecutive_update_failures = 0
+        # Consecutive failed polls per device. Only the devices carried by a
+        # failed poll chunk are counted, so one bad chunk does not blank the
+        # rest of the fleet.
+        self.device_update_failures: dict[str, int] = {}
+        # Poll circuit breaker; see BREAKER_FAILURE_THRESHOLD. Unlike
+        # consecutive_update_failures this is not reset by pushes, which say
+        # nothing about the health of the polling endpoint.
+        self.breaker_state = BREAKER_CLOSED
+        self.breaker_next_attempt: datetime | None = None
+        self.breaker_failures = 0
+        # Devices whose state (or poll health) changed in the most recent
+        # update published to listeners; None means "treat every device as
+        # changed" (first refresh, failures, recovery).
+        self._changed_device_ids: set[str] | None = None
+        # Devices whose optimistic state was confirmed since the last publish.
+        # Confirmation can leave the device's state unchanged (a no-op
+        # command), so they are published alongside the changed devices.
+        self._confirmed_device_ids: set[str] = set()
+        # Raw discovery records and last state payloads, persisted so the next
+        # startup can build entities before the cloud answers.
+        self._store = cache_store(hass, config_entry.entry_id)
+        self._discovery_records: dict[str, dict] = {}
+        # Fingerprint of the last discovery payload that was fully applied.
+        self._discovery_fingerprint: str | None = None
+        self._state_payloads: dict[str, dict] = {}
+        # Commanded states not yet confirmed by the device, shared by every
+        # entity and persisted with the cache.
+        self.optimistic = OptimisticLedger(on_change=self._async_schedule_cache_save)
+        # Devices whose state so far only comes from the cache; the first poll
+        # or push carrying a device confirms it.
+        self.restored_device_ids: set[str] = set()
+        # Loop time each device capability was last received, by push or by a
+        # poll (stamped with the time the poll was sent). Polls never replace
+        # a capability with data older than this.
+        self._capability_received: dict[str, dict[str, float]] = {}
+        # In-flight get_device_state requests, keyed by each device they carry.
+        self._state_fetches: dict[str, asyncio.Future[None]] = {}
+        # Running post-command confirmation polls, one per device.
+        self._confirmations: dict[str, asyncio.Task[None]] = {}
+        # Commands answered from fresh confirmed state without calling U-Tec.
+        self.commands_skipped = 0
+        # Digests of each device's recent pushes (oldest first), with the time
+        # each was last seen and the states it carried, for dropping
+        # redeliveries.
+        self._push_dedup_window = timedelta(seconds=push_dedup_window)
+        self._push_digests: dict[
+            str, OrderedDict[str, tuple[datetime, frozenset[tuple]]]
+        ] = {}
+        self.push_duplicates_suppressed = 0
+        # Pushes acknowledged by the webhook but not yet applied, each with the
+        # loop time it was queued at, and the task applying them.
+        self._push_queue: deque[tuple[float, Any]] = deque(maxlen=PUSH_QUEUE_SIZE)
+        self._push_queue_event = asyncio.Event()
+        self._push_consumer: asyncio.Task[None] | None = None
+        self.push_queue_processed = 0
+        self.push_queue_dropped = 0
+        self.push_queue_last_lag = 0.0
+        self.push_queue_max_lag = 0.0
+        # Pushes held back by the coalescing window, and their flush timers.
+        self._pending_pushes: dict[str, dict] = {}
+        self._push_flush_timers: dict[str, CALLBACK_TYPE] = {}
         _LOGGER.info(
-            "Uhome data coordinator initialized (poll=%ds, discovery=%ds)",
+            "Uhome data coordinator initialized (poll=%ds, max poll=%ds, discovery=%ds)",
             scan_interval,
+            self.max_update_interval.total_seconds(),
             discovery_interval,
         )
 
@@ -103,6 +316,113 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
         """
         return self.consecutive_update_failures < MAX_CONSECUTIVE_UPDATE_FAILURES
 
+    def device_poll_healthy(self, device_id: str) -> bool:
+        """Return True if the poll chunks carrying this device keep succeeding.
+
+        Complements poll_healthy_enough: a chunk that fails while others
+        succeed only marks its own devices unavailable.
+        """
+        return (
+            self.device_update_failures.get(device_id, 0)
+            < MAX_CONSECUTIVE_UPDATE_FAILURES
+        )
+
+    def device_available(self, device_id: str) -> bool:
+        """Return True if this device's entities should be available.
+
+        Unavailable only when the device itself is offline, or two consecutive
+        polls failed, either for the whole account or for the poll chunk
+        carrying this device (a single transient failure is tolerated).
+        """
+        device = self.devices.get(device_id)
+        return (
+            device is not None
+            and self.poll_healthy_enough
+            and self.device_poll_healthy(device_id)
+            and device.available
+        )
+
+    def device_changed(self, device_id: str) -> bool:
+        """Return True if the last published update touched this device.
+
+        Entities use this to skip state writes for devices an update did not
+        change, so a poll costs O(changed devices) rather than O(entities).
+        """
+        return self._changed_device_ids is None or device_id in self._changed_device_ids
+
+    def _changed_since_last_update(self, snapshot: dict[str, dict]) -> set[str]:
+        """Return the devices whose state differs from the published data."""
+        previous = self.data or {}
+        return {
+            device_id
+            for device_id, state in snapshot.items()
+            if previous.get(device_id) != state
+        }
+
+    @property
+    def effective_scan_interval(self) -> int:
+        """Return the poll interval currently in effect, in seconds."""
+        return int(self.update_interval.total_seconds())
+
+    def set_scan_interval(self, scan_interval: int, max_poll_interval: int) -> None:
+        """Apply new base/ceiling poll intervals and restart from the base.
+
+        Setting update_interval alone may not reschedule an already-pending
+        timer on all HA versions, so call _schedule_refresh when available
+        (private HA API; getattr guards crashes). Like async_set_updated_data,
+        only reschedule while entities are listening.
+        """
+        self.base_update_interval = timedelta(seconds=scan_interval)
+        self.max_update_interval = timedelta(
+            seconds=max(scan_interval, max_poll_interval)
+        )
+        self.update_interval = self.base_update_interval
+        schedule = getattr(self, "_schedule_refresh", None)
+        if callable(schedule) and getattr(self, "_listeners", None):
+            schedule()
+
+    def _adapt_update_interval(self) -> None:
+        """Stretch or reset the poll interval according to push health.
+
+        While authenticated pushes keep arriving, every successful poll doubles
+        the interval up to max_update_interval. The stretch is also capped at
+        the time left before push would be considered stale, so the poll that
+        notices a dead push channel fires the moment it goes stale and snaps
+        the interval back to the base.
+        """
+        base = self.base_update_interval
+        interval = base
+        if not self.config_entry.options.get(CONF_PUSH_ENABLED, True):
+            reason = POLL_REASON_PUSH_DISABLED
+        elif self.last_push_received is None:
+            reason = POLL_REASON_NO_PUSH
+        else:
+            push_age = dt_util.utcnow() - self.last_push_received
+            if push_age >= PUSH_STALE_AFTER:
+                reason = POLL_REASON_PUSH_STALE
+            elif self.push_devices and any(
+                device_id not in self.push_devices for device_id in self.devices
+            ):
+                # Devices deselected from push only ever learn state by polling.
+                reason = POLL_REASON_PARTIAL_PUSH
+            else:
+                reason = POLL_REASON_PUSH_HEALTHY
+                interval = max(
+                    base,
+                    min(
+                        self.update_interval * 2,
+                        self.max_update_interval,
+                        PUSH_STALE_AFTER - push_age,
+                    ),
+                )
+
+        if interval != self.update_interval or reason != self.poll_interval_reason:
+            _LOGGER.debug(
+                "Poll interval now %ds (%s)", interval.total_seconds(), reason
+            )
+        self.update_interval = interval
+        self.poll_interval_reason = reason
+
     async def async_start_periodic_discovery(self) -> None:
         """Start periodic device discovery separate from state polling."""
         if self._cancel_discovery:
@@ -138,107 +458,788 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
         # (which wipes every entity to unavailable on reload).
         _raise_for_error_payload(discovery_data, auth_only=True)
 
-        devices_data = discovery_data.get("payload", {}).get("devices", [])
+        devices_data = [
+            device_data
+            for device_data in discovery_data.get("payload", {}).get("devices", [])
+            if isinstance(device_data, dict)
+        ]
+        fingerprint = _fingerprint(devices_data)
+        if fingerprint == self._discovery_fingerprint:
+            _LOGGER.debug("Discovery unchanged (%d devices)", len(devices_data))
+            return
         _LOGGER.debug("Found %s devices in discovery data", len(devices_data))
+        if not devices_data and self.devices:
+            # Never read an empty answer as "every device was removed".
+            _LOGGER.warning(
+                "Discovery returned no devices; keeping the %d known devices",
+                len(self.devices),
+            )
+            return
 
+        seen: set[str] = set()
         new_device_ids: list[str] = []
+        updated_device_ids: list[str] = []
+        expanded_device_ids: list[str] = []
         for device_data in devices_data:
             device_id = device_data.get("id")
-            if not device_id or device_id in self.devices:
+            if not device_id:
                 continue
 
-            handle_type = device_data.get("handleType", "").lower()
-            # "dimmer" check must come before "switch" since "utec-dimmer"
-            # contains neither "light" nor "switch".
-            if "lock" in handle_type:
-                _LOGGER.info("Adding new lock device: %s", device_id)
-                device = Lock(device_data, self.api)
-            elif "dimmer" in handle_type or "light" in handle_type or "bulb" in handle_type:
-                _LOGGER.info("Adding new light/dimmer device: %s [%s]", device_id, handle_type)
-                device = Light(device_data, self.api)
-            elif "switch" in handle_type:
-                _LOGGER.info("Adding new switch device: %s", device_id)
-                device = Switch(device_data, self.api)
-            else:
+            handle_type = device_data.get("handleType", "")
+            device_cls = _device_class_for(handle_type)
+            if device_cls is None:
                 _LOGGER.debug(
                     "Skipping device %s with unsupported handle type: %s",
                     device_id,
                     handle_type,
                 )
                 continue
+            seen.add(device_id)
 
+            device = self.devices.get(device_id)
+            if isinstance(device, device_cls):
+                capabilities = set(device.supported_capabilities)
+                if self._apply_discovery_record(device, device_data):
+                    updated_device_ids.append(device_id)
+                    if device.supported_capabilities - capabilities:
+                        expanded_device_ids.append(device_id)
+                continue
+            if device is not None:
+                # The handle type moved to another device class.
+                self._async_remove_device(device_id)
+
+            device = self._build_device(device_data)
+            if device is None:
+                continue
+            _LOGGER.info(
+                "Adding new %s device: %s [%s]",
+                device_cls.__name__.lower(),
+                device_id,
+                handle_type,
+            )
             self.devices[device_id] = device
+            self._remember_discovery_record(device_data)
             new_device_ids.append(device_id)
 
+        for device_id in seen:
+            self._discovery_misses.pop(device_id, None)
+        for device_id in [d for d in self.devices if d not in seen]:
+            misses = self._discovery_misses.get(device_id, 0) + 1
+            if misses < DISCOVERY_MISSES_BEFORE_REMOVAL:
+                _LOGGER.debug(
+                    "Uhome device %s missing from discovery (%d of %d)",
+                    device_id,
+                    misses,
+                    DISCOVERY_MISSES_BEFORE_REMOVAL,
+                )
+                self._discovery_misses[device_id] = misses
+                continue
+            _LOGGER.info("Removing Uhome device %s: no longer discovered", device_id)
+            self._async_remove_device(device_id)
+        # While a device is pending removal an identical answer must still
+        # be counted, so the fingerprint is only kept once nothing is missing.
+        self._discovery_fingerprint = None if self._discovery_misses else fingerprint
+
+        if updated_device_ids and self.data is not None:
+            # Entities read names from the device, so this write renames them.
+            self._changed_device_ids = set(updated_device_ids)
+            self.async_update_listeners()
+        if expanded_device_ids:
+            async_dispatcher_send(
+                self.hass,
+                f"{SIGNAL_NEW_CAPABILITIES}_{self.config_entry.entry_id}",
+                expanded_device_ids,
+            )
+
         if new_device_ids:
             # Fetch initial state for all new devices in a single bulk call.
-            try:
-                response = await self.api.get_device_state(new_device_ids, None)
-                if response and "payload" in response:
-                    for device_data in response["payload"].get("devices", []):
-                        device_id = device_data.get("id")
-                        if device_id and device_id in self.devices:
-                            await self.devices[device_id].update_state_data(device_data)
-            except (ApiError, AuthenticationError) as err:
-                _LOGGER.error("Error fetching initial state for new devices: %s", err)
-            for device_id in new_device_ids:
-                async_dispatcher_send(self.hass, SIGNAL_NEW_DEVICE)
+            # Before the first refresh there is nothing to fetch for: that
+            # refresh polls every device moments later anyway.
+            if self.data is not None:
+                try:
+                    await self.async_fetch_device_states(new_device_ids)
+                except (ConfigEntryAuthFailed, UpdateFailed) as err:
+                    _LOGGER.error(
+                        "Error fetching initial state for new devices: %s", err
+                    )
+            # One signal per discovery; platforms add entities for just these ids.
+            async_dispatcher_send(
+                self.hass,
+                f"{SIGNAL_NEW_DEVICE}_{self.config_entry.entry_id}",
+                new_device_ids,
+            )
+
+    def _build_device(self, device_data: dict) -> BaseDevice | None:
+        """Build the utec_py device for a discovery record, or None if unusable."""
+        device_cls = _device_class_for(device_data.get("handleType", ""))
+        if device_cls is None:
+            return None
+        try:
+            return device_cls(device_data, self.api)
+        except (DeviceError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning(
+                "Ignoring device %s with unusable discovery data: %s",
+                device_data.get("id"),
+                err,
+            )
+            return None
+
+    def _apply_discovery_record(self, device: BaseDevice, device_data: dict) -> bool:
+        """Apply a changed discovery record to a known device, in place.
+
+        Entities keep their reference to the device object, so the fresh
+        discovery fields are copied onto it while its state is kept. The
+        device registry entry follows renames and model changes. Returns True
+        if the record changed.
+        """
+        previous = self._discovery_records.get(device.device_id)
+        self._remember_discovery_record(device_data)
+        if previous is None or previous == device_data:
+            return False
+        fresh = self._build_device(device_data)
+        if fresh is None:
+            return False
+        _update_device_from_discovery(device, fresh)
+        _LOGGER.info("Updated Uhome device %s from discovery", device.device_id)
+        dev_reg = dr.async_get(self.hass)
+        if device_entry := dev_reg.async_get_device(
+            identifiers={(DOMAIN, device.device_id)}
+        ):
+            dev_reg.async_update_device(
+                device_entry.id,
+                name=device.name,
+                manufacturer=device.manufacturer,
+                model=device.model,
+                hw_version=device.hw_version,
+            )
+        return True
+
+    @callback
+    def _async_remove_device(self, device_id: str) -> None:
+        """Forget a device and drop it (and its entities) from the registries."""
+        self.devices.pop(device_id, None)
+        self._discovery_records.pop(device_id, None)
+        self._discovery_misses.pop(device_id, None)
+        self._state_payloads.pop(device_id, None)
+        self.device_push_received.pop(device_id, None)
+        self.device_polled_at.pop(device_id, None)
+        self._push_digests.pop(device_id, None)
+        self._capability_received.pop(device_id, None)
+        self.push_stats.forget_device(device_id)
+        self.optimistic.clear(device_id)
+        self._confirmed_device_ids.discard(device_id)
+        self.device_update_failures.pop(device_id, None)
+        self.restored_device_ids.discard(device_id)
+        self.added_sensor_entities.discard(f"{DOMAIN}_battery_{device_id}")
+        self.added_sensor_entities.discard(f"{DOMAIN}_door_{device_id}")
+        if self.data is not None:
+            self.data.pop(device_id, None)
+        if confirmation := self._confirmations.pop(device_id, None):
+            confirmation.cancel()
+        if cancel_flush := self._push_flush_timers.pop(device_id, None):
+            cancel_flush()
+        self._pending_pushes.pop(device_id, None)
+        self._async_schedule_cache_save()
+
+        dev_reg = dr.async_get(self.hass)
+        if device_entry := dev_reg.async_get_device(identifiers={(DOMAIN, device_id)}):
+            # Removing the entry's link deletes the device once no other
+            # entry uses it, and the entity registry removes its entities.
+            dev_reg.async_update_device(
+                device_entry.id, remove_config_entry_id=self.config_entry.entry_id
+            )
+
+    def _remember_discovery_record(self, device_data: dict) -> None:
+        """Keep a device's discovery record for the persisted cache."""
+        if self._discovery_records.get(device_data["id"]) != device_data:
+            self._discovery_records[device_data["id"]] = device_data
+            self._async_schedule_cache_save()
+
+    def _remember_state_payload(self, device_data: dict) -> None:
+        """Keep a device's last state payload and mark it confirmed."""
+        device_id = device_data["id"]
+        self.restored_device_ids.discard(device_id)
+        if self._state_payloads.get(device_id) != device_data:
+            self._state_payloads[device_id] = device_data
+            self._async_schedule_cache_save()
+
+    def _async_schedule_cache_save(self) -> None:
+        """Persist the cache after STORAGE_SAVE_DELAY, coalescing bursts."""
+        self._store.async_delay_save(self._cache_data, STORAGE_SAVE_DELAY)
+
+    def _cache_data(self) -> dict:
+        """Return the cache contents for the known devices."""
+        return {
+            "devices": [
+                record
+                for device_id, record in self._discovery_records.items()
+                if device_id in self.devices
+            ],
+            "states": {
+                device_id: payload
+                for device_id, payload in self._state_payloads.items()
+                if device_id in self.devices
+            },
+            "optimistic": {
+                device_id: entries
+                for device_id, entries in self.optimistic.as_dict().items()
+                if device_id in self.devices
+            },
+        }
+
+    async def async_restore_from_cache(self) -> bool:
+        """Build devices and their last known state from the persisted cache.
+
+        Returns True if any device was restored. Restored devices are listed
+        in restored_device_ids until a poll or push confirms their state, and
+        coordinator data is published without touching the U-Tec cloud.
+        """
+        cache = await self._store.async_load()
+        if not cache:
+            return False
+
+        for device_data in cache.get("devices", []):
+            device_id = device_data.get("id")
+            if not device_id or device_id in self.devices:
+                continue
+            if (device := self._build_device(device_data)) is None:
+                continue
+            self.devices[device_id] = device
+            self._discovery_records[device_id] = device_data
+            self.restored_device_ids.add(device_id)
+
+        for device_id, state_data in cache.get("states", {}).items():
+            if device_id in self.devices:
+                await self.devices[device_id].update_state_data(state_data)
+                self._state_payloads[device_id] = state_data
+        self.optimistic.load(cache.get("optimistic", {}), set(self.devices))
+
+        if not self.devices:
+            return False
+        _LOGGER.debug("Restored %d Uhome devices from cache", len(self.devices))
+        self._changed_device_ids = None
+        self.data = self._snapshot()
+        return True
+
+    async def async_reconcile_cache(self) -> None:
+        """Run discovery and a first poll behind entities restored from cache."""
+        try:
+            await self.async_discover_devices()
+        except ConfigEntryAuthFailed as err:
+            _LOGGER.warning("Background discovery needs reauthentication: %s", err)
+            self.config_entry.async_start_reauth(self.hass)
+            return
+        await self.async_refresh()
 
     async def _async_scheduled_discovery(self, _now) -> None:
         """Callback from the periodic discovery timer."""
         await self.async_discover_devices()
 
-    async def _async_update_data(self) -> dict[str, dict]:
-        """Fetch state for all known devices in a single bulk API call."""
-        if not self.devices:
-            self.consecutive_update_failures = 0
-            return {}
+    def _device_ids_to_poll(self) -> list[str]:
+        """Return the devices the next bulk poll should ask U-Tec about.
+
+        With push-aware polling off (the default) that is every device. With
+        it on, a device whose state arrived by push within PUSH_STALE_AFTER is
+        skipped until it is due for its PUSH_FALLBACK_POLL_INTERVAL check, which
+        still catches drift the push channel silently missed.
+        """
+        if not self.config_entry.options.get(
+            CONF_PUSH_AWARE_POLLING, DEFAULT_PUSH_AWARE_POLLING
+        ):
+            return list(self.devices)
+
+        now = dt_util.utcnow()
+        due: list[str] = []
+        for device_id in self.devices:
+            pushed_at = self.device_push_received.get(device_id)
+            polled_at = self.device_polled_at.get(device_id)
+            if (
+                pushed_at is None
+                or now - pushed_at >= PUSH_STALE_AFTER
+                or polled_at is None
+                or now - polled_at >= PUSH_FALLBACK_POLL_INTERVAL
+            ):
+                due.append(device_id)
+        return due
+
+    def _snapshot(self) -> dict[str, dict]:
+        """Return the current state of every known device."""
+        return {
+            device_id: device.get_state_data()
+            for device_id, device in self.devices.items()
+        }
+
+    async def _async_apply_state_response(self, response, requested_at: float) -> None:
+        """Apply every device state carried by a get_device_state response.
+
+        ``requested_at`` is the loop time the request was sent. Capabilities
+        that a push (or a later-sent poll) delivered after that are kept as
+        they are rather than regressed to the response's older values.
+        """
+        if response and "payload" in response:
+            for device_data in response["payload"].get("devices", []):
+                device_id = device_data.get("id")
+                if device_id and device_id in self.devices:
+                    device_data = self._without_stale_states(device_data, requested_at)
+                    self._stamp_capabilities(device_id, device_data, requested_at)
+                    await self.devices[device_id].update_state_data(device_data)
+                    self._remember_state_payload(device_data)
+                    self._confirm_optimistic(device_id)
+
+    def _confirm_optimistic(self, device_id: str) -> None:
+        """Drop the optimistic states a device's fresh state confirms."""
+        if self.optimistic.entries(device_id) and (
+            confirmed := self.optimistic.confirm(device_id, self.devices[device_id])
+        ):
+            _LOGGER.debug(
+                "Device %s confirmed %s", device_id, ", ".join(sorted(confirmed))
+            )
+            self._confirmed_device_ids.add(device_id)
+
+    def _take_confirmed_device_ids(self) -> set[str]:
+        """Return and reset the devices confirmed since the last publish."""
+        confirmed, self._confirmed_device_ids = self._confirmed_device_ids, set()
+        return confirmed
 
-        _LOGGER.debug("Polling state for %d Uhome devices (bulk)", len(self.devices))
+    def _stamp_capabilities(
+        self, device_id: str, device_data: dict, received_at: float
+    ) -> None:
+        """Record when each capability in a state payload was last received."""
+        stamps = self._capability_received.setdefault(device_id, {})
+        for state in device_data.get("states") or []:
+            if isinstance(state, dict) and (capability := state.get("capability")):
+                stamps[capability] = max(stamps.get(capability, 0.0), received_at)
+
+    def _without_stale_states(self, device_data: dict, requested_at: float) -> dict:
+        """Swap polled states that newer data superseded for the known ones."""
+        device_id = device_data["id"]
+        stale = {
+            capability
+            for capability, received_at in self._capability_received.get(
+                device_id, {}
+            ).items()
+            if received_at > requested_at
+        }
+        if not stale:
+            return device_data
+        _LOGGER.debug(
+            "Ignoring polled %s of device %s: newer state already received",
+            ", ".join(sorted(stale)),
+            device_id,
+        )
+        known = self._state_payloads.get(device_id, {}).get("states") or []
+        return {
+            **device_data,
+            "states": [
+                state
+                for state in device_data.get("states") or []
+                if not isinstance(state, dict) or state.get("capability") not in stale
+            ]
+            + [
+                state
+                for state in known
+                if isinstance(state, dict) and state.get("capability") in stale
+            ],
+        }
+
+    async def async_fetch_device_states(self, device_ids: list[str]) -> None:
+        """Fetch and apply the state of devices, sharing in-flight requests.
+
+        Devices a concurrent caller is already fetching are not requested
+        again; this call waits for that request instead, so overlapping
+        polls, discovery and entity refreshes cost one get_device_state call
+        per device. Raises ConfigEntryAuthFailed or UpdateFailed, shared by
+        every caller waiting on the failed request.
+
+        The request runs in a task of its own rather than in the caller that
+        started it, so cancelling any caller (a confirmation poll replaced by
+        a newer command) only stops that caller's wait.
+        """
+        pending = {
+            self._state_fetches[device_id]
+            for device_id in device_ids
+            if device_id in self._state_fetches
+        }
+        missing = [
+            device_id for device_id in device_ids if device_id not in self._state_fetches
+        ]
+        if missing:
+            fetch = self.hass.async_create_task(
+                self._async_request_device_states(missing),
+                f"{DOMAIN} state fetch",
+                eager_start=False,
+            )
+            for device_id in missing:
+                self._state_fetches[device_id] = fetch
+
+            def _release(task: asyncio.Task[None]) -> None:
+                # Mark a failure as retrieved even when nobody waited on it.
+                task.cancelled() or task.exception()
+                for device_id in missing:
+                    if self._state_fetches.get(device_id) is task:
+                        del self._state_fetches[device_id]
+
+            fetch.add_done_callback(_release)
+            pending.add(fetch)
+        for fetch in pending:
+            # Shielded so a cancelled waiter does not cancel the shared request.
+            await asyncio.shield(fetch)
+
+    async def _async_request_device_states(self, device_ids: list[str]) -> None:
+        """Request state for devices from U-Tec and apply the response."""
+        requested_at = self.hass.loop.time()
         try:
-            device_ids = list(self.devices.keys())
             response = await self.api.get_device_state(device_ids, None)
-
             # U-Tec returns HTTP 200 with an error envelope (e.g. INVALID_TOKEN) that
             # get_device_state does not raise on — surface it instead of treating an
             # error response as an empty-but-successful poll.
             _raise_for_error_payload(response)
-
-            if response and "payload" in response:
-                for device_data in response["payload"].get("devices", []):
-                    device_id = device_data.get("id")
-                    if device_id and device_id in self.devices:
-                        await self.devices[device_id].update_state_data(device_data)
-
-            self.consecutive_update_failures = 0
-            return {
-                device_id: device.get_state_data()
-                for device_id, device in self.devices.items()
-            }
         except AuthenticationError as err:
-            # HA stops rescheduling after ConfigEntryAuthFailed, so a single
-            # increment would leave entities "available" with stale state.
-            self.consecutive_update_failures = MAX_CONSECUTIVE_UPDATE_FAILURES
             raise ConfigEntryAuthFailed(f"Credentials expired: {err}") from err
-        except ConfigEntryAuthFailed:
-            self.consecutive_update_failures = MAX_CONSECUTIVE_UPDATE_FAILURES
-            raise
-        except ApiError as err:
-            self.consecutive_update_failures += 1
+        except (ApiError, ClientError, TimeoutError) as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        await self._async_apply_state_response(response, requested_at)
+
+    @callback
+    def skip_redundant_command(
+        self, device_id: str, capability: str, satisfied: bool
+    ) -> bool:
+        """Return True if a command can be answered without calling U-Tec.
+
+        Only with CONF_SKIP_REDUNDANT_COMMANDS on. satisfied says whether the
+        device's state already matches the command; that state must have
+        arrived by push or poll within CONF_CONFIRMED_STATE_MAX_AGE, and no
+        earlier command on the device may still be awaiting confirmation, nor
+        a push still be waiting in the coalescing window to change the state.
+        Skips are counted in commands_skipped.
+        """
+        options = self.config_entry.options
+        if not satisfied or not options.get(
+            CONF_SKIP_REDUNDANT_COMMANDS, DEFAULT_SKIP_REDUNDANT_COMMANDS
+        ):
+            return False
+        if (
+            device_id in self._confirmations
+            or device_id in self._pending_pushes
+            or self.optimistic.entries(device_id)
+        ):
+            return False
+        received = self._capability_received.get(device_id, {}).get(capability)
+        max_age = options.get(
+            CONF_CONFIRMED_STATE_MAX_AGE, DEFAULT_CONFIRMED_STATE_MAX_AGE
+        )
+        if received is None or self.hass.loop.time() - received > max_age:
+            return False
+        self.commands_skipped += 1
+        _LOGGER.debug(
+            "Skipping %s command for %s: device already in the requested state",
+            capability,
+            device_id,
+        )
+        return True
+
+    @callback
+    def async_confirm_device_state(
+        self, device_id: str, confirmed: Callable[[], bool]
+    ) -> None:
+        """Poll just this device until a command's result is confirmed.
+
+        Called by entities after a successful command. The device is polled
+        after CONFIRM_POLL_FIRST_DELAY and then with doubling delays until
+        confirmed() holds or OPTIMISTIC_TIMEOUT passes, instead of waiting for
+        the next fleet-wide poll. A newer command replaces a running
+        confirmation for the same device.
+        """
+        if running := self._confirmations.pop(device_id, None):
+            running.cancel()
+        task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_confirm_device_state(device_id, confirmed),
+            f"{self.name} confirm {device_id}",
+        )
+        # Tasks start eagerly and may already be done.
+        if not task.done():
+            self._confirmations[device_id] = task
+
+    async def _async_confirm_device_state(
+        self, device_id: str, confirmed: Callable[[], bool]
+    ) -> None:
+        """Run the confirmation polls scheduled by async_confirm_device_state."""
+        task = asyncio.current_task()
+        deadline = dt_util.utcnow() + OPTIMISTIC_TIMEOUT
+        delay = float(CONFIRM_POLL_FIRST_DELAY)
+        try:
+            while True:
+                await asyncio.sleep(delay)
+                # A push may have confirmed the command while we slept.
+                if device_id not in self.devices or confirmed():
+                    return
+                try:
+                    with api_lane(LANE_CONFIRM):
+                        await self.async_fetch_device_states([device_id])
+                except (ConfigEntryAuthFailed, UpdateFailed) as err:
+                    # The regular poll owns failure handling and reauth.
+                    _LOGGER.debug("Confirmation poll for %s failed: %s", device_id, err)
+                else:
+                    self._async_publish_device(device_id)
+                    if confirmed():
+                        _LOGGER.debug("Command on %s confirmed by poll", device_id)
+                        return
+                remaining = (deadline - dt_util.utcnow()).total_seconds()
+                if remaining <= 0:
+                    _LOGGER.debug(
+                        "Command on %s unconfirmed after %s", device_id, OPTIMISTIC_TIMEOUT
+                    )
+                    return
+                delay = min(delay * 2, remaining)
+        finally:
+            if self._confirmations.get(device_id) is task:
+                del self._confirmations[device_id]
+
+    @callback
+    def _async_publish_device(self, device_id: str) -> None:
+        """Publish one device's fresh state if it changed or was confirmed."""
+        state = self.devices[device_id].get_state_data()
+        confirmed = device_id in self._confirmed_device_ids
+        self._confirmed_device_ids.discard(device_id)
+        if self.data is None or (self.data.get(device_id) == state and not confirmed):
+            return
+        self.data[device_id] = state
+        self._changed_device_ids = {device_id}
+        self.async_update_listeners()
+
+    async def _async_poll_chunk(
+        self, semaphore: asyncio.Semaphore, device_ids: list[str]
+    ) -> None:
+        """Poll one chunk of devices and merge its states as soon as it lands."""
+        async with semaphore:
+            await self.async_fetch_device_states(device_ids)
+
+    def _record_poll_failure(self) -> None:
+        """Count a failed poll, opening the breaker once the threshold is hit.
+
+        Each further failure doubles the backoff (starting at twice the base
+        interval, capped at BREAKER_MAX_BACKOFF), and the actual delay is
+        drawn from its upper half so many installs do not retry in lockstep.
+        """
+        self.breaker_failures += 1
+        if self.breaker_failures < BREAKER_FAILURE_THRESHOLD:
+            return
+        exponent = min(self.breaker_failures - BREAKER_FAILURE_THRESHOLD + 1, 16)
+        ceiling = min(BREAKER_MAX_BACKOFF, self.base_update_interval * 2**exponent)
+        backoff = ceiling * random.uniform(0.5, 1.0)
+        if self.breaker_state == BREAKER_CLOSED:
+            _LOGGER.warning(
+                "U-Tec polling failed %d times in a row; backing off",
+                self.breaker_failures,
+            )
+        self.breaker_state = BREAKER_OPEN
+        self.breaker_next_attempt = dt_util.utcnow() + backoff
+        self.update_interval = backoff
+        _LOGGER.debug("Next U-Tec poll attempt in %ds", backoff.total_seconds())
+
+    async def _async_probe_breaker(self) -> None:
+        """Short-circuit polls while the breaker is open; probe once it may close.
+
+        Raises UpdateFailed without touching the API until the backoff has
+        elapsed, then polls a single device. Success closes the breaker so
+        the caller goes on to poll the whole fleet.
+        """
+        now = dt_util.utcnow()
+        if self.breaker_state == BREAKER_OPEN and now < self.breaker_next_attempt:
+            self.update_interval = self.breaker_next_attempt - now
+            raise UpdateFailed(
+                "U-Tec polling paused after repeated failures; next attempt at "
+                f"{self.breaker_next_attempt.isoformat()}"
+            )
+        self.breaker_state = BREAKER_HALF_OPEN
+        probe_id = next(iter(self.devices))
+        _LOGGER.debug("Probing U-Tec API with device %s", probe_id)
+        try:
+            await self.async_fetch_device_states([probe_id])
         except UpdateFailed:
             self.consecutive_update_failures += 1
+            self._changed_device_ids = None
+            self._record_poll_failure()
             raise
-        except Exception:
+        _LOGGER.info("U-Tec API probe succeeded; resuming polling")
+        self.breaker_state = BREAKER_CLOSED
+        self.breaker_next_attempt = None
+        self.breaker_failures = 0
+
+    async def _async_update_data(self) -> dict[str, dict]:
+        """Fetch state for all due devices in concurrent bulk API calls."""
+        if not self.devices:
+            self.consecutive_update_failures = 0
+            self._changed_device_ids = None
+            return {}
+
+        if self.breaker_state != BREAKER_CLOSED:
+            await self._async_probe_breaker()
+
+        self.last_poll_started = dt_util.utcnow()
+        device_ids = self._device_ids_to_poll()
+        if not device_ids:
+            _LOGGER.debug("Every Uhome device is covered by recent push; skipping poll")
+            self._adapt_update_interval()
+            snapshot = self._snapshot()
+            self._changed_device_ids = (
+                self._changed_since_last_update(snapshot)
+                | self._take_confirmed_device_ids()
+            )
+            return snapshot
+
+        size = self._poll_chunk_size
+        chunks = [device_ids[i : i + size] for i in range(0, len(device_ids), size)]
+        _LOGGER.debug(
+            "Polling state for %d of %d Uhome devices (%d bulk requests)",
+            len(device_ids),
+            len(self.devices),
+            len(chunks),
+        )
+        restored_before = set(self.restored_device_ids)
+        semaphore = asyncio.Semaphore(self._poll_concurrency)
+        results = await asyncio.gather(
+            *(self._async_poll_chunk(semaphore, chunk) for chunk in chunks),
+            return_exceptions=True,
+        )
+
+        errors: list[Exception] = []
+        # Devices whose per-device poll health moved, or whose cached state
+        # this poll confirmed; their entities need a write even when their
+        # state did not change.
+        health_changed: set[str] = restored_before - self.restored_device_ids
+        polled_at = dt_util.utcnow()
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                errors.append(result)
+                for device_id in chunk:
+                    self.device_update_failures[device_id] = (
+                        self.device_update_failures.get(device_id, 0) + 1
+                    )
+                health_changed.update(chunk)
+                continue
+            for device_id in chunk:
+                if self.device_update_failures.pop(device_id, None):
+                    health_changed.add(device_id)
+                self.device_polled_at[device_id] = polled_at
+
+        for err in errors:
+            if isinstance(err, ConfigEntryAuthFailed):
+                # HA stops rescheduling after ConfigEntryAuthFailed, so a single
+                # increment would leave entities "available" with stale state.
+                self.consecutive_update_failures = MAX_CONSECUTIVE_UPDATE_FAILURES
+                self._changed_device_ids = None
+                raise err
+
+        if len(errors) == len(chunks):
             self.consecutive_update_failures += 1
-            raise
+            self._changed_device_ids = None
+            self._record_poll_failure()
+            raise errors[0]
+
+        if errors:
+            _LOGGER.warning(
+                "%d of %d Uhome poll requests failed; affected devices keep "
+                "their last state: %s",
+                len(errors),
+                len(chunks),
+                errors[0],
+            )
+
+        snapshot = self._snapshot()
+        confirmed = self._take_confirmed_device_ids()
+        if self.consecutive_update_failures:
+            # Recovering from account-wide failures can flip every entity back
+            # to available.
+            self._changed_device_ids = None
+        else:
+            self._changed_device_ids = (
+                self._changed_since_last_update(snapshot) | health_changed | confirmed
+            )
+        self.consecutive_update_failures = 0
+        self.breaker_failures = 0
+        self._adapt_update_interval()
+        return snapshot
+
+    @callback
+    def enqueue_push_data(self, push_data: Any) -> None:
+        """Queue a validated push for the background consumer to apply.
+
+        Lets the webhook answer at once instead of holding the sender's
+        request open while entities update. A full queue drops its oldest push.
+        """
+        if self._push_consumer is None or self._push_consumer.done():
+            # Start the consumer before queueing, so its eager first run
+            # parks on the event instead of applying the push inline.
+            self._push_consumer = self.config_entry.async_create_background_task(
+                self.hass, self._async_consume_pushes(), f"{DOMAIN} push consumer"
+            )
+        if len(self._push_queue) == self._push_queue.maxlen:
+            self.push_queue_dropped += 1
+            _LOGGER.warning(
+                "Push queue full (%d pushes); dropping the oldest",
+                self._push_queue.maxlen,
+            )
+        self._push_queue.append((self.hass.loop.time(), push_data))
+        self._push_queue_event.set()
+
+    async def _async_consume_pushes(self) -> None:
+        """Apply queued pushes in arrival order, forever."""
+        while True:
+            await self._push_queue_event.wait()
+            self._push_queue_event.clear()
+            while self._push_queue:
+                queued_at, push_data = self._push_queue.popleft()
+                lag = self.hass.loop.time() - queued_at
+                self.push_queue_last_lag = lag
+                self.push_queue_max_lag = max(self.push_queue_max_lag, lag)
+                try:
+                    await self.update_push_data(push_data)
+                except Exception:  # noqa: BLE001
+                    # One bad push must not stop every later one.
+                    _LOGGER.exception("Unexpected error applying push update")
+                self.push_queue_processed += 1
+
+    def push_queue_metrics(self) -> dict[str, Any]:
+        """Return depth, lag and drop counters of the push queue."""
+        return {
+            "depth": len(self._push_queue),
+            "max_size": self._push_queue.maxlen,
+            "processed": self.push_queue_processed,
+            "dropped": self.push_queue_dropped,
+            "last_lag": round(self.push_queue_last_lag, 3),
+            "max_lag": round(self.push_queue_max_lag, 3),
+        }
+
+    @callback
+    def async_stop_push_consumer(self) -> None:
+        """Stop applying queued pushes and discard them (on unload)."""
+        if self._push_consumer is not None:
+            self._push_consumer.cancel()
+            self._push_consumer = None
+        self._push_queue.clear()
 
     async def update_push_data(self, push_data):
-        """Process push update from webhook."""
+        """Process push update from webhook.
+
+        Pushes take a targeted path: only the entities of the pushed devices
+        write state (via SIGNAL_DEVICE_UPDATE_<id>), and coordinator-level
+        entities get a cheap SIGNAL_PUSH_RECEIVED. Coordinator listeners are
+        only woken when the push restores availability after poll failures.
+        With a push coalescing window set, a device's pushes are merged and
+        applied once the window after the first has passed.
+        """
         # Reaching here means the handler already passed Bearer-token auth, so a
         # genuine push was delivered. Stamp before payload guards so even an empty
         # keepalive counts as "push channel alive".
         self.last_push_received = dt_util.utcnow()
+        self.push_stats.record_push(self.last_push_received)
+        async_dispatcher_send(
+            self.hass, f"{SIGNAL_PUSH_RECEIVED}_{self.config_entry.entry_id}"
+        )
 
         _LOGGER.debug("Processing push update: %s", push_data)
 
@@ -276,6 +1277,13 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("No device data found in push update")
                 return
 
+            coalesce_window = (
+                self.config_entry.options.get(
+                    CONF_PUSH_COALESCE_WINDOW, DEFAULT_PUSH_COALESCE_WINDOW
+                )
+                / 1000
+            )
+
             for device_data in devices_data:
                 if not isinstance(device_data, dict):
                     _LOGGER.warning("Skipping non-dict device entry in push update: %s", device_data)
@@ -296,20 +1304,19 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
                     continue
 
                 if device_id in self.devices:
-                    device = self.devices[device_id]
-                    await device.update_state_data(device_data)
-
-                    _LOGGER.debug(
-                        "Updated device %s with push data: %s",
-                        device_id,
-                        device_data,
-                    )
-
-                    async_dispatcher_send(
-                        self.hass,
-                        f"{SIGNAL_DEVICE_UPDATE}_{device_id}",
-                        device.get_state_data(),
-                    )
+                    self.device_push_received[device_id] = self.last_push_received
+                    if self._is_duplicate_push(device_id, device_data):
+                        self.push_duplicates_suppressed += 1
+                        self.push_stats.record_device_duplicate(device_id)
+                        _LOGGER.debug(
+                            "Dropping duplicate push for device %s", device_id
+                        )
+                        continue
+                    self.push_stats.record_device_push(device_id)
+                    if coalesce_window:
+                        self._queue_push(device_id, device_data, coalesce_window)
+                    else:
+                        await self._async_apply_push(device_id, device_data)
                 else:
                     _LOGGER.debug(
                         "Received update for unknown device: %s", device_id
@@ -318,10 +1325,130 @@ class UhomeDataUpdateCoordinator(DataUpdateCoordinator):
             # A successful authenticated push proves the channel is alive —
             # reset the poll-failure counter so entities stay available during
             # transient poll outages while push continues to deliver state.
+            recovered = bool(
+                self.consecutive_update_failures or self.device_update_failures
+            )
             self.consecutive_update_failures = 0
+            self.device_update_failures.clear()
 
-            # Trigger data update for all entities
-            self.async_set_updated_data(self.data)
+            if recovered:
+                # Every entity may flip back to available, so this is the one
+                # push that has to reach all coordinator listeners.
+                self._changed_device_ids = None
+                self.async_set_updated_data(self._snapshot())
 
         except (ValueError, TypeError, AttributeError) as err:
             _LOGGER.error("Error processing push update: %s", err)
+
+    def _is_duplicate_push(self, device_id: str, device_data: dict) -> bool:
+        """Return True if this exact payload was pushed within the dedup window.
+
+        Each device keeps the digests of its last PUSH_DEDUP_SIZE distinct
+        payloads, least recently seen evicted first. A payload that changes
+        any state a remembered one carried supersedes it, so a state that
+        flips back (locked, unlocked, locked) is never taken for a redelivery.
+        """
+        if not self._push_dedup_window:
+            return False
+        now = self.last_push_received or dt_util.utcnow()
+        digest = _fingerprint(device_data)
+        digests = self._push_digests.setdefault(device_id, OrderedDict())
+        if (seen := digests.get(digest)) is not None:
+            digests.move_to_end(digest)
+            digests[digest] = (now, seen[1])
+            if now - seen[0] <= self._push_dedup_window:
+                return True
+
+        keys = {
+            (state.get("capability"), state.get("name"))
+            for state in device_data.get("states") or []
+            if isinstance(state, dict)
+        }
+        for old_digest, (_, old_keys) in list(digests.items()):
+            if old_digest != digest and old_keys & keys:
+                del digests[old_digest]
+        digests[digest] = (now, frozenset(keys))
+        while len(digests) > PUSH_DEDUP_SIZE:
+            digests.popitem(last=False)
+        return False
+
+    async def _async_apply_push(self, device_id: str, device_data: dict) -> None:
+        """Apply one device's pushed state and notify its entities.
+
+        Pushes are often partial (a battery or door-sensor event alone), while
+        utec_py replaces a device's state wholesale. The push is therefore
+        merged into the device's last known full state first, so capabilities
+        it does not carry keep their values. Entities are sent only the states
+        the push itself carried.
+        """
+        device = self.devices.get(device_id)
+        if device is None:  # removed while the push was being coalesced
+            return
+        # Stamped only once applied: while a push waits in the coalescing
+        # window the device still holds the older state.
+        self._stamp_capabilities(device_id, device_data, self.hass.loop.time())
+        pushed_states = _states_by_capability(device_data)
+        if (known := self._state_payloads.get(device_id)) is not None:
+            device_data = _merge_device_states(known, device_data)
+        await device.update_state_data(device_data)
+        self._remember_state_payload(device_data)
+        self._confirm_optimistic(device_id)
+        # The push signal below writes the device's entities.
+        self._confirmed_device_ids.discard(device_id)
+
+        _LOGGER.debug("Updated device %s with push data: %s", device_id, device_data)
+
+        state = device.get_state_data()
+        if (
+            self.data is not None
+            and self.data.get(device_id) != state
+            and self.last_poll_started is not None
+        ):
+            next_poll = self.last_poll_started + self.update_interval
+            self.push_stats.record_lead((next_poll - dt_util.utcnow()).total_seconds())
+            # The receive signal went out before this push was applied, so the
+            # stats sensors would still show the previous lead.
+            async_dispatcher_send(
+                self.hass, f"{SIGNAL_PUSH_RECEIVED}_{self.config_entry.entry_id}"
+            )
+        # Keep the published snapshot current so the next poll only reports
+        # what the push did not already deliver.
+        if self.data is not None:
+            self.data[device_id] = state
+        async_dispatcher_send(
+            self.hass,
+            f"{SIGNAL_DEVICE_UPDATE}_{device_id}",
+            pushed_states,
+        )
+
+    @callback
+    def _queue_push(self, device_id: str, device_data: dict, window: float) -> None:
+        """Merge a push into the device's pending one, flushed after window."""
+        if (pending := self._pending_pushes.get(device_id)) is not None:
+            self._pending_pushes[device_id] = _merge_device_states(
+                pending, device_data
+            )
+            return
+        self._pending_pushes[device_id] = device_data
+
+        @callback
+        def _flush(_now) -> None:
+            self._push_flush_timers.pop(device_id, None)
+            if (merged := self._pending_pushes.pop(device_id, None)) is not None:
+                self.config_entry.async_create_background_task(
+                    self.hass,
+                    self._async_apply_push(device_id, merged),
+                    f"{DOMAIN} push flush {device_id}",
+                )
+
+        self._push_flush_timers[device_id] = async_call_later(
+            self.hass, window, _flush
+        )
+
+    @callback
+    def async_cancel_pending_pushes(self) -> None:
+        """Drop coalesced pushes that have not been applied yet (on unload)."""
+        for cancel in self._push_flush_timers.values():
+            cancel()
+        self._push_flush_timers.clear()
+        self._pending_pushes.clear()
@@ -12,6 +12,7 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .coordinator import UhomeDataUpdateCoordinator
+from .governor import GovernedUHomeApi
 
 # Keys to redact from diagnostic data
 REDACT_KEYS = {
@@ -106,7 +107,29 @@ async def async_get_config_entry_diagnostics(
             "last_update_success": coordinator.last_update_success,
             "consecutive_update_failures": coordinator.consecutive_update_failures,
             "poll_healthy_enough": coordinator.poll_healthy_enough,
+            "effective_scan_interval": coordinator.effective_scan_interval,
+            "poll_interval_reason": coordinator.poll_interval_reason,
+            "last_push_received": coordinator.last_push_received,
+            "push_duplicates_suppressed": coordinator.push_duplicates_suppressed,
+            "push_queue": coordinator.push_queue_metrics(),
+            "push_stats": coordinator.push_stats.as_dict(),
+            "optimistic": coordinator.optimistic.as_dict(),
+            "commands_skipped": coordinator.commands_skipped,
             "device_count": len(coordinator.devices),
+            "restored_device_count": len(coordinator.restored_device_ids),
+            "poll_circuit": {
+                "state": coordinator.breaker_state,
+                "consecutive_failures": coordinator.breaker_failures,
+                "next_attempt": coordinator.breaker_next_attempt,
+            },
+            "api_governor": {
+                **api.governor.metrics(),
+                "command_batches": api.command_batches,
+                "batched_commands": api.batched_commands,
+                "superseded_commands": api.superseded_commands,
+            }
+            if isinstance(api, GovernedUHomeApi)
+            else None,
         },
         "devices": async_redact_data(device_data, REDACT_KEYS),
         "discovery_data": async_redact_data(discovery_data, REDACT_KEYS),
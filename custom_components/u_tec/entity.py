@@ -0,0 +1,129 @@
+"""Base entities for Uhome devices."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+from utec_py.exceptions import DeviceError
+
+from .const import OPTIMISTIC_TIMEOUT
+from .governor import is_superseded
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UhomeDeviceEntity(CoordinatorEntity):
+    """Coordinator entity backed by one Uhome device.
+
+    Subclasses set _device, and _name_suffix when the entity is one aspect
+    of its device (a battery, a door sensor).
+    """
+
+    _name_suffix = ""
+
+    @property
+    def name(self) -> str:
+        """Return the name, following renames picked up by discovery."""
+        return f"{self._device.name}{self._name_suffix}"
+
+    @property
+    def available(self) -> bool:
+        """Return True if entity is available."""
+        return self.coordinator.device_available(self._device.device_id)
+
+
+class UhomeOptimisticEntity(UhomeDeviceEntity):
+    """Coordinator entity whose optimistic state expires on its own timer.
+
+    Optimism lives in the coordinator's ledger; this class bounds it. The
+    timer fires OPTIMISTIC_TIMEOUT after optimism was set, so unconfirmed
+    optimism is released on time rather than at the next poll after the
+    timeout. Subclasses set _device and _optimistic_set_at, and name the
+    ledger capability they own in _optimistic_capability (None for all of
+    the device's entries).
+    """
+
+    _optimistic_capability: str | None = None
+    # Class-level default ensures this always exists even if HA restores
+    # the entity from cache without calling __init__ again.
+    _optimistic_expiry: CALLBACK_TYPE | None = None
+
+    def _has_optimism(self) -> bool:
+        """Return True if the ledger holds optimism this entity owns."""
+        device_id = self._device.device_id
+        if self._optimistic_capability is None:
+            return bool(self.coordinator.optimistic.entries(device_id))
+        return (
+            self.coordinator.optimistic.get(device_id, self._optimistic_capability)
+            is not None
+        )
+
+    async def _async_send(self, command: Awaitable[Any]) -> bool:
+        """Await a device command; return False if a newer one superseded it.
+
+        A superseded command is not an error: the command that replaced it
+        owns optimism and confirmation, so the caller just returns. Any other
+        DeviceError propagates.
+        """
+        try:
+            await command
+        except DeviceError as err:
+            if is_superseded(err):
+                return False
+            raise
+        return True
+
+    @callback
+    def _schedule_optimistic_expiry(self) -> None:
+        """Start the timer that releases optimism OPTIMISTIC_TIMEOUT after it was set."""
+        self._cancel_optimistic_expiry()
+        if self.hass is None:
+            # Not added yet; _handle_coordinator_update still bounds it.
+            return
+        # Measured from when optimism started, which for state restored
+        # from the cache may be well before this entity was added.
+        elapsed = dt_util.utcnow() - (self._optimistic_set_at or dt_util.utcnow())
+        self._optimistic_expiry = async_call_later(
+            self.hass,
+            max(OPTIMISTIC_TIMEOUT - elapsed, timedelta(0)),
+            HassJob(self._async_optimistic_expired, cancel_on_shutdown=True),
+        )
+
+    @callback
+    def _cancel_optimistic_expiry(self) -> None:
+        if self._optimistic_expiry is not None:
+            self._optimistic_expiry()
+            self._optimistic_expiry = None
+
+    @callback
+    def _clear_optimistic(self) -> None:
+        """Drop optimistic state and its expiry timer."""
+        self.coordinator.optimistic.clear(
+            self._device.device_id, self._optimistic_capability
+        )
+        self._cancel_optimistic_expiry()
+
+    @callback
+    def _async_optimistic_expired(self, _now: datetime) -> None:
+        """Release optimism the device did not confirm within OPTIMISTIC_TIMEOUT.
+
+        State is written even when the optimism is already gone: it may have
+        been confirmed or cleared elsewhere without this entity writing, and
+        assumed_state must not stay stale.
+        """
+        self._optimistic_expiry = None
+        if self._has_optimism():
+            _LOGGER.debug(
+                "Optimistic state for %s unconfirmed after %s; trusting device",
+                self._device.device_id,
+                OPTIMISTIC_TIMEOUT,
+            )
+            self._clear_optimistic()
+        self.async_write_ha_state()
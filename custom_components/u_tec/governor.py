@@ -0,0 +1,496 @@
+"""Rate governor for requests to the U-Tec cloud."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import heapq
+import itertools
+import logging
+from typing import TYPE_CHECKING, Any
+
+from utec_py.devices.device_const import DeviceCapability
+from utec_py.exceptions import ApiError
+
+if TYPE_CHECKING:
+    from .api import UHomeCommandApi
+
+_LOGGER = logging.getLogger(__name__)
+
+# Priority lanes, highest priority first. When tokens run out, queued requests
+# are released strictly in this order (FIFO within a lane).
+LANE_COMMAND = "command"
+LANE_CONFIRM = "confirm"
+LANE_POLL = "poll"
+LANE_BACKGROUND = "background"
+LANES = (LANE_COMMAND, LANE_CONFIRM, LANE_POLL, LANE_BACKGROUND)
+
+# Commands that set a value rather than trigger an action. While one is in
+# flight, a newer command for the same device and capability replaces any
+# still waiting (a dragged brightness slider), so only the final value is sent.
+_LATEST_WINS_CAPABILITIES = frozenset(
+    {
+        DeviceCapability.BRIGHTNESS,
+        DeviceCapability.SWITCH_LEVEL,
+        DeviceCapability.COLOR,
+        DeviceCapability.COLOR_TEMPERATURE,
+    }
+)
+
+
+class CommandSuperseded(Exception):
+    """A latest-wins command was replaced by a newer one before it was sent."""
+
+
+def is_superseded(err: BaseException | None) -> bool:
+    """Return True if err is, or was raised from, a CommandSuperseded.
+
+    utec_py wraps every send_command failure in a DeviceError, so entities
+    see the CommandSuperseded as that error's cause.
+    """
+    while err is not None:
+        if isinstance(err, CommandSuperseded):
+            return True
+        err = err.__cause__
+    return False
+
+
+_current_lane: ContextVar[str | None] = ContextVar("u_tec_api_lane", default=None)
+
+
+@contextmanager
+def api_lane(lane: str) -> Iterator[None]:
+    """Run the enclosed API calls in the given lane.
+
+    Overrides the per-method default, e.g. to mark state fetches issued by a
+    post-command confirmation or by discovery.
+    """
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+@dataclass
+class _PendingCommand:
+    """A device command waiting for its batch to be sent."""
+
+    device_id: str
+    capability: str
+    name: str
+    arguments: dict[str, Any] | None
+    future: asyncio.Future[dict[str, Any]]
+
+
+@dataclass
+class _LaneStats:
+    """Counters for one priority lane."""
+
+    requests: int = 0
+    queued: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    last_wait: float = 0.0
+
+    def record(self, wait: float) -> None:
+        """Count one request that waited ``wait`` seconds for its token."""
+        self.requests += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.last_wait = wait
+
+
+def _command_entry(pending: _PendingCommand) -> dict[str, Any]:
+    """Return the request entry for one device command."""
+    command: dict[str, Any] = {"capability": pending.capability, "name": pending.name}
+    if pending.arguments:
+        command["arguments"] = pending.arguments
+    return {"id": pending.device_id, "command": command}
+
+
+def _command_errors(response: Any, device_ids: list[str]) -> dict[str, ApiError]:
+    """Return the per-device errors of a multi-device Command response.
+
+    An error envelope for the whole request fails every device in it.
+    """
+    payload = response.get("payload") if isinstance(response, dict) else None
+    if not isinstance(payload, dict):
+        return {}
+    if isinstance(error := payload.get("error"), dict):
+        return {
+            device_id: ApiError(error.get("code"), error.get("message", ""))
+            for device_id in device_ids
+        }
+    return {
+        device.get("id"): ApiError(error.get("code"), error.get("message", ""))
+        for device in payload.get("devices") or []
+        if isinstance(device, dict) and isinstance(error := device.get("error"), dict)
+    }
+
+
+class ApiGovernor:
+    """Token bucket shared by every request to the U-Tec cloud.
+
+    Up to ``burst`` requests go out immediately; after that, tokens refill at
+    ``rate`` per second and are handed to waiting requests in lane priority
+    order, so a burst of background traffic cannot delay a lock command.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the governor."""
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._tokens = float(self._burst)
+        self._updated: float | None = None
+        self._waiters: list[tuple[int, int, str, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._stats = {lane: _LaneStats() for lane in LANES}
+
+    def _refill(self, now: float) -> None:
+        if self._updated is not None:
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+        self._updated = now
+
+    async def acquire(self, lane: str) -> None:
+        """Wait until a request in this lane may be sent."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self._refill(start)
+        stats = self._stats[lane]
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            stats.record(0.0)
+            return
+
+        future: asyncio.Future[None] = loop.create_future()
+        heapq.heappush(
+            self._waiters, (LANES.index(lane), next(self._sequence), lane, future)
+        )
+        stats.queued += 1
+        self._schedule_release(loop)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as the caller gave up: hand the token back.
+                self._tokens += 1
+            raise
+        wait = loop.time() - start
+        stats.record(wait)
+        _LOGGER.debug("U-Tec %s request waited %.2fs for a rate token", lane, wait)
+
+    def _schedule_release(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._wakeup is None:
+            delay = max(0.0, (1 - self._tokens) / self._rate)
+            self._wakeup = loop.call_later(delay, self._release, loop)
+
+    def _release(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._wakeup = None
+        self._refill(loop.time())
+        while self._waiters and self._tokens >= 1:
+            *_, future = heapq.heappop(self._waiters)
+            if future.done():  # caller was cancelled while queued
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+        if self._waiters:
+            self._schedule_release(loop)
+
+    def queue_depth(self, lane: str) -> int:
+        """Return how many requests in a lane are waiting for a token."""
+        return sum(
+            1
+            for _, _, waiter_lane, future in self._waiters
+            if waiter_lane == lane and not future.done()
+        )
+
+    def metrics(self) -> dict[str, Any]:
+        """Return queue depth and wait-time metrics per lane."""
+        return {
+            "rate": self._rate,
+            "burst": self._burst,
+            "tokens": round(self._tokens, 2),
+            "lanes": {
+                lane: {
+                    "queue_depth": self.queue_depth(lane),
+                    "requests": stats.requests,
+                    "queued": stats.queued,
+                    "avg_wait": round(stats.total_wait / stats.requests, 3)
+                    if stats.requests
+                    else 0.0,
+                    "max_wait": round(stats.max_wait, 3),
+                    "last_wait": round(stats.last_wait, 3),
+                }
+                for lane, stats in self._stats.items()
+            },
+        }
+
+    def async_stop(self) -> None:
+        """Cancel the refill timer and every queued request."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        for *_, future in self._waiters:
+            future.cancel()
+        self._waiters.clear()
+
+
+class GovernedUHomeApi:
+    """UHomeApi wrapper that routes every cloud request through an ApiGovernor.
+
+    Each method has a default lane; api_lane() overrides it for the calls it
+    encloses. Anything not wrapped here is passed through to the client.
+
+    With a command_batch_window, device commands issued within that many
+    seconds of each other (a scene switching off every light) are sent as one
+    multi-device Command request. Each caller still gets its own result or
+    exception.
+    """
+
+    def __init__(
+        self,
+        api: UHomeCommandApi,
+        governor: ApiGovernor,
+        command_batch_window: float = 0,
+    ) -> None:
+        """Initialize the wrapper."""
+        self._api = api
+        self.governor = governor
+        self._command_batch_window = command_batch_window
+        self._pending_commands: list[_PendingCommand] = []
+        self._command_flush: asyncio.TimerHandle | None = None
+        self._command_sender: asyncio.Task[None] | None = None
+        self.command_batches = 0
+        self.batched_commands = 0
+        # Latest-wins commands: (device, capability) pairs with a command in
+        # flight, and the newest command waiting behind each.
+        self._busy_commands: set[tuple[str, str]] = set()
+        self._waiting_commands: dict[tuple[str, str], _PendingCommand] = {}
+        self._command_tasks: set[asyncio.Task[None]] = set()
+        self.superseded_commands = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._api, name)
+
+    def async_stop(self) -> None:
+        """Cancel commands that have not been sent, or are being sent."""
+        if self._command_flush is not None:
+            self._command_flush.cancel()
+            self._command_flush = None
+        if self._command_sender is not None:
+            # Cancels the futures of the batch in flight.
+            self._command_sender.cancel()
+            self._command_sender = None
+        for pending in (*self._pending_commands, *self._waiting_commands.values()):
+            pending.future.cancel()
+        self._pending_commands.clear()
+        self._waiting_commands.clear()
+        for task in self._command_tasks:
+            task.cancel()
+
+    async def _acquire(self, default_lane: str) -> None:
+        await self.governor.acquire(_current_lane.get() or default_lane)
+
+    async def send_command(
+        self,
+        device_id: str,
+        capability: str,
+        command: str,
+        arguments: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a command to a device (command lane).
+
+        Value-setting commands are latest-wins per device and capability: a
+        caller whose command was replaced before it could be sent gets
+        CommandSuperseded instead of a result.
+        """
+        if capability not in _LATEST_WINS_CAPABILITIES:
+            return await self._async_send_command(
+                device_id, capability, command, arguments
+            )
+
+        key = (device_id, str(capability))
+        if key not in self._busy_commands:
+            self._busy_commands.add(key)
+            try:
+                return await self._async_send_command(
+                    device_id, capability, command, arguments
+                )
+            finally:
+                self._send_waiting_command(key)
+
+        if (replaced := self._waiting_commands.pop(key, None)) is not None:
+            if not replaced.future.done():
+                replaced.future.set_exception(CommandSuperseded())
+                self.superseded_commands += 1
+                _LOGGER.debug(
+                    "Dropping superseded %s %s command for %s",
+                    capability,
+                    replaced.name,
+                    device_id,
+                )
+        pending = _PendingCommand(
+            device_id,
+            capability,
+            command,
+            arguments,
+            asyncio.get_running_loop().create_future(),
+        )
+        self._waiting_commands[key] = pending
+        return await pending.future
+
+    def _send_waiting_command(self, key: tuple[str, str]) -> None:
+        """Send the newest command waiting behind the one that just finished."""
+        pending = self._waiting_commands.pop(key, None)
+        if pending is None or pending.future.done():
+            self._busy_commands.discard(key)
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._async_send_waiting_command(key, pending)
+        )
+        self._command_tasks.add(task)
+        task.add_done_callback(self._command_tasks.discard)
+
+    async def _async_send_waiting_command(
+        self, key: tuple[str, str], pending: _PendingCommand
+    ) -> None:
+        try:
+            response = await self._async_send_command(
+                pending.device_id, pending.capability, pending.name, pending.arguments
+            )
+        except Exception as err:  # noqa: BLE001
+            if not pending.future.done():
+                pending.future.set_exception(err)
+        else:
+            if not pending.future.done():
+                pending.future.set_result(response)
+        finally:
+            self._send_waiting_command(key)
+
+    async def _async_send_command(
+        self,
+        device_id: str,
+        capability: str,
+        command: str,
+        arguments: dict[str, Any] | None,
+    ) -> dict[str, Any]:
+        """Send a command, batched with others if batching is enabled."""
+        if self._command_batch_window <= 0:
+            await self._acquire(LANE_COMMAND)
+            response = await self._api.send_command(
+                device_id, capability, command, arguments
+            )
+            errors = _command_errors(response, [device_id])
+            if (error := errors.get(device_id)) is not None:
+                raise error
+            return response
+
+        loop = asyncio.get_running_loop()
+        pending = _PendingCommand(
+            device_id, capability, command, arguments, loop.create_future()
+        )
+        self._pending_commands.append(pending)
+        if self._command_flush is None and (
+            self._command_sender is None or self._command_sender.done()
+        ):
+            self._command_flush = loop.call_later(
+                self._command_batch_window, self._start_command_sender
+            )
+        return await pending.future
+
+    def _start_command_sender(self) -> None:
+        self._command_flush = None
+        self._command_sender = asyncio.get_running_loop().create_task(
+            self._async_send_pending_commands()
+        )
+
+    async def _async_send_pending_commands(self) -> None:
+        """Send pending commands, at most one per device in each request.
+
+        A device's later commands wait for the next request, so each device
+        still sees its commands in the order they were issued.
+        """
+        while self._pending_commands:
+            batch: dict[str, _PendingCommand] = {}
+            waiting: list[_PendingCommand] = []
+            for pending in self._pending_commands:
+                if pending.future.done():  # caller gave up while queued
+                    continue
+                if pending.device_id in batch:
+                    waiting.append(pending)
+                else:
+                    batch[pending.device_id] = pending
+            self._pending_commands = waiting
+            if batch:
+                await self._async_send_command_batch(list(batch.values()))
+
+    async def _async_send_command_batch(self, batch: list[_PendingCommand]) -> None:
+        try:
+            await self._acquire(LANE_COMMAND)
+            if len(batch) == 1:
+                (pending,) = batch
+                response = await self._api.send_command(
+                    pending.device_id,
+                    pending.capability,
+                    pending.name,
+                    pending.arguments,
+                )
+            else:
+                _LOGGER.debug("Sending %d device commands in one request", len(batch))
+                self.command_batches += 1
+                self.batched_commands += len(batch)
+                response = await self._api.send_commands(
+                    [_command_entry(pending) for pending in batch]
+                )
+        except asyncio.CancelledError:
+            for pending in batch:
+                pending.future.cancel()
+            raise
+        except Exception as err:  # noqa: BLE001
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(err)
+            return
+
+        device_errors = _command_errors(
+            response, [pending.device_id for pending in batch]
+        )
+        for pending in batch:
+            if pending.future.done():
+                continue
+            if (error := device_errors.get(pending.device_id)) is not None:
+                pending.future.set_exception(error)
+            else:
+                pending.future.set_result(response)
+
+    async def get_device_state(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Fetch device states in bulk (poll lane)."""
+        await self._acquire(LANE_POLL)
+        return await self._api.get_device_state(*args, **kwargs)
+
+    async def query_device(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Query a single device (background lane)."""
+        await self._acquire(LANE_BACKGROUND)
+        return await self._api.query_device(*args, **kwargs)
+
+    async def discover_devices(self) -> dict[str, Any]:
+        """Discover devices (background lane)."""
+        await self._acquire(LANE_BACKGROUND)
+        return await self._api.discover_devices()
+
+    async def validate_auth(self) -> bool:
+        """Validate authentication (background lane)."""
+        await self._acquire(LANE_BACKGROUND)
+        return await self._api.validate_auth()
+
+    async def set_push_status(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Register the push URL (background lane)."""
+        await self._acquire(LANE_BACKGROUND)
+        return await self._api.set_push_status(*args, **kwargs)
@@ -17,7 +17,6 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import value_to_brightness
 from utec_py.devices.light import Light as UhomeLight
@@ -28,10 +27,12 @@ from .const import (
     DOMAIN,
     OPTIMISTIC_TIMEOUT,
     SIGNAL_DEVICE_UPDATE,
+    SIGNAL_NEW_DEVICE,
     is_optimistic_enabled,
     push_asserts_state,
 )
 from .coordinator import UhomeDataUpdateCoordinator
+from .entity import UhomeOptimisticEntity
 
 # use module-level logger
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +43,12 @@ _LOGGER = logging.getLogger(__name__)
 # confirm/timeout path (see _handle_push_update).
 # https://github.com/LF2b2w/Uhome-HA/issues/58
 
+# Capabilities the light's optimistic on/off state and brightness are
+# recorded under in the ledger. The brightness entry's value is the U-Tec
+# level (1-100) we sent; its display is the 0-255 brightness HA asked for.
+SWITCH_CAPABILITY = "st.switch"
+LEVEL_CAPABILITY = "st.switchLevel"
+
 # U-Tec reports brightness as 1-100, not 0-100.
 BRIGHTNESS_SCALE = (1, 100)
 
@@ -62,23 +69,30 @@ async def async_setup_entry(
         if isinstance(device, UhomeLight)
     )
 
+    @callback
+    def async_add_new_devices(device_ids: list[str]) -> None:
+        """Add entities for devices found by a later discovery."""
+        async_add_entities(
+            UhomeLightEntity(coordinator, device_id)
+            for device_id in device_ids
+            if isinstance(coordinator.devices.get(device_id), UhomeLight)
+        )
 
-class UhomeLightEntity(CoordinatorEntity, LightEntity):
-    """Representation of a Uhome light."""
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, f"{SIGNAL_NEW_DEVICE}_{entry.entry_id}", async_add_new_devices
+        )
+    )
 
-    # Class-level defaults ensure these always exist even if HA restores
-    # the entity from cache without calling __init__ again.
-    _optimistic_is_on: bool | None = None
-    _optimistic_brightness: int | None = None
-    _pending_brightness_utec: int | None = None
-    _optimistic_set_at: datetime | None = None
+
+class UhomeLightEntity(UhomeOptimisticEntity, LightEntity):
+    """Representation of a Uhome light."""
 
     def __init__(self, coordinator: UhomeDataUpdateCoordinator, device_id: str) -> None:
         """Initialize the light."""
         super().__init__(coordinator)
         self._device = cast(UhomeLight, coordinator.devices[device_id])
         self._attr_unique_id = f"{DOMAIN}_{device_id}"
-        self._attr_name = self._device.name
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._device.device_id)},
             name=self._device.name,
@@ -87,12 +101,6 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
             hw_version=self._device.hw_version,
         )
         self._attr_has_entity_name = True
-        self._optimistic_is_on: bool | None = None
-        self._optimistic_brightness: int | None = None
-        # The U-Tec brightness value (1-100) we last sent, used to detect
-        # when the device has confirmed the change so we can clear optimistic state.
-        self._pending_brightness_utec: int | None = None
-        self._optimistic_set_at: datetime | None = None
 
         # Set supported color modes based on device capabilities
         self._attr_supported_color_modes = set()
@@ -138,13 +146,65 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
             self._device.device_id,
         )
 
+    def _optimistic_entry(self, capability: str):
+        return self.coordinator.optimistic.get(self._device.device_id, capability)
+
     @property
-    def available(self) -> bool:
-        """Return True if entity is available.
+    def _optimistic_is_on(self) -> bool | None:
+        """Return the commanded on/off state awaiting confirmation, if any."""
+        entry = self._optimistic_entry(SWITCH_CAPABILITY)
+        return entry.value if entry else None
+
+    @_optimistic_is_on.setter
+    def _optimistic_is_on(self, value: bool | None) -> None:
+        self.coordinator.optimistic.update(
+            self._device.device_id, SWITCH_CAPABILITY, value=value
+        )
 
-        Unavailable only when the device is offline or two consecutive polls failed.
-        """
-        return self.coordinator.poll_healthy_enough and self._device.available
+    @property
+    def _pending_brightness_utec(self) -> int | None:
+        """Return the U-Tec brightness (1-100) sent and awaiting confirmation."""
+        entry = self._optimistic_entry(LEVEL_CAPABILITY)
+        return entry.value if entry else None
+
+    @_pending_brightness_utec.setter
+    def _pending_brightness_utec(self, value: int | None) -> None:
+        self.coordinator.optimistic.update(
+            self._device.device_id, LEVEL_CAPABILITY, value=value
+        )
+
+    @property
+    def _optimistic_brightness(self) -> int | None:
+        """Return the 0-255 brightness shown until the device confirms."""
+        entry = self._optimistic_entry(LEVEL_CAPABILITY)
+        return entry.display if entry else None
+
+    @_optimistic_brightness.setter
+    def _optimistic_brightness(self, value: int | None) -> None:
+        self.coordinator.optimistic.update(
+            self._device.device_id, LEVEL_CAPABILITY, display=value
+        )
+
+    @property
+    def _optimistic_set_at(self) -> datetime | None:
+        """Return when the outstanding optimism started (one clock for both tracks)."""
+        stamps = [
+            entry.set_at
+            for entry in self.coordinator.optimistic.entries(
+                self._device.device_id
+            ).values()
+            if entry.set_at is not None
+        ]
+        return min(stamps, default=None)
+
+    @_optimistic_set_at.setter
+    def _optimistic_set_at(self, value: datetime | None) -> None:
+        for capability in list(
+            self.coordinator.optimistic.entries(self._device.device_id)
+        ):
+            self.coordinator.optimistic.update(
+                self._device.device_id, capability, set_at=value
+            )
 
     @property
     def is_on(self) -> bool:
@@ -164,7 +224,13 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
 
     @property
     def assumed_state(self) -> bool:
-        """Return True if the current reported state is optimistic and unconfirmed."""
+        """Return True if the reported state is unconfirmed.
+
+        That is an optimistic command result, or state restored from the
+        startup cache that no poll or push has confirmed yet.
+        """
+        if self._device.device_id in self.coordinator.restored_device_ids:
+            return True
         return self._is_optimistic() and (
             self._optimistic_is_on is not None
             or self._optimistic_brightness is not None
@@ -177,50 +243,31 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
         first poll (which often still returns the old value), but we also do not
         wait forever: optimism is held for at most OPTIMISTIC_TIMEOUT, then
         released so a command the device never fulfils cannot pin the entity.
-        A single shared clock covers both tracks of a turn_on call.
-        """
-        timed_out = (
-            self._optimistic_set_at is not None
-            and dt_util.utcnow() - self._optimistic_set_at > OPTIMISTIC_TIMEOUT
-        )
+        A single shared clock covers both tracks of a turn_on call; its expiry
+        timer releases them on time, and the check here only backs it up.
 
-        if timed_out and (
-            self._optimistic_is_on is not None
-            or self._pending_brightness_utec is not None
-        ):
+        The coordinator drops whichever track the device confirmed before
+        listeners are told of the update. Updates that did not touch this
+        device are skipped unless optimism is outstanding.
+        """
+        if self._optimistic_is_on is None and self._pending_brightness_utec is None:
+            # Also drops a brightness shown without a level awaiting confirmation.
+            self._clear_optimistic()
+            if not self.coordinator.device_changed(self._device.device_id):
+                return
+        elif self._optimistic_set_at is None:
+            # Optimism set without a timestamp: start the clock rather than
+            # clearing, so the timeout can bound it on a later pass.
+            self._optimistic_set_at = dt_util.utcnow()
+            self._schedule_optimistic_expiry()
+        elif dt_util.utcnow() - self._optimistic_set_at > OPTIMISTIC_TIMEOUT:
             _LOGGER.debug(
                 "Optimistic state for %s unconfirmed after %s; trusting device",
                 self._device.device_id,
                 OPTIMISTIC_TIMEOUT,
             )
-
-        if self._optimistic_is_on is not None:
-            if self._optimistic_is_on == self._device.is_on:
-                self._optimistic_is_on = None
-            elif timed_out:
-                self._optimistic_is_on = None
-            # else: keep optimistic state until device catches up
-
-        pending = self._pending_brightness_utec
-        if pending is not None:
-            actual = self._device.brightness
-            if actual is not None and actual == pending:
-                self._optimistic_brightness = None
-                self._pending_brightness_utec = None
-            elif timed_out:
-                self._optimistic_brightness = None
-                self._pending_brightness_utec = None
-            # else: keep optimistic brightness until device catches up
-        else:
-            self._optimistic_brightness = None
-
-        # Shared clock: clear it once nothing optimistic remains; start it if
-        # optimism is outstanding but was set without a timestamp (e.g. cache
-        # restore), so the timeout above can bound it on a later pass.
-        if self._optimistic_is_on is None and self._pending_brightness_utec is None:
-            self._optimistic_set_at = None
-        elif self._optimistic_set_at is None:
-            self._optimistic_set_at = dt_util.utcnow()
+            self._clear_optimistic()
+        # else: keep optimistic state until the device catches up
 
         super()._handle_coordinator_update()
 
@@ -237,7 +284,16 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
         return self._device.color_temp
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the light on."""
+        """Turn the light on.
+
+        Only a plain turn_on may be skipped as redundant; one that sets
+        brightness or colour is always sent.
+        """
+        if not kwargs and self.coordinator.skip_redundant_command(
+            self._device.device_id, SWITCH_CAPABILITY, self._device.is_on
+        ):
+            self.async_write_ha_state()
+            return
         _LOGGER.debug("Turning on light %s kwargs=%s", self._device.device_id, kwargs)
         try:
             turn_on_args = {}
@@ -253,7 +309,14 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
             if ATTR_COLOR_TEMP_KELVIN in kwargs:
                 turn_on_args["color_temp"] = kwargs[ATTR_COLOR_TEMP_KELVIN]
 
-            await self._device.turn_on(**turn_on_args)
+            if not await self._async_send(self._device.turn_on(**turn_on_args)):
+                return
+            target_brightness = turn_on_args.get("brightness")
+            self.coordinator.async_confirm_device_state(
+                self._device.device_id,
+                lambda: self._device.is_on
+                and target_brightness in (None, self._device.brightness),
+            )
 
             if self._is_optimistic():
                 self._optimistic_is_on = True
@@ -261,6 +324,7 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
                     self._optimistic_brightness = kwargs[ATTR_BRIGHTNESS]
                     self._pending_brightness_utec = turn_on_args["brightness"]
                 self._optimistic_set_at = dt_util.utcnow()
+                self._schedule_optimistic_expiry()
                 self.async_write_ha_state()
 
         except DeviceError as err:
@@ -269,12 +333,22 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
+        if self.coordinator.skip_redundant_command(
+            self._device.device_id, SWITCH_CAPABILITY, not self._device.is_on
+        ):
+            self.async_write_ha_state()
+            return
         _LOGGER.debug("Turning off light %s", self._device.device_id)
         try:
-            await self._device.turn_off()
+            if not await self._async_send(self._device.turn_off()):
+                return
+            self.coordinator.async_confirm_device_state(
+                self._device.device_id, lambda: not self._device.is_on
+            )
             if self._is_optimistic():
                 self._optimistic_is_on = False
                 self._optimistic_set_at = dt_util.utcnow()
+                self._schedule_optimistic_expiry()
                 self.async_write_ha_state()
         except DeviceError as err:
             _LOGGER.error(
@@ -286,6 +360,9 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
         """Register callbacks."""
         await super().async_added_to_hass()
 
+        self.async_on_remove(self._cancel_optimistic_expiry)
+        if self.coordinator.optimistic.entries(self._device.device_id):
+            self._schedule_optimistic_expiry()  # restored mid-command
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
@@ -298,12 +375,14 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
     def _handle_push_update(self, push_data) -> None:
         """Update device from push data, clearing on/off optimism on disagreement.
 
-        The coordinator applies the push before dispatching, so
-        self._device.is_on reflects the pushed state. We only act when the push
-        actually carried switch state (pushes are full-state replaces and
-        Light.is_on falls back to False when the switch capability is absent, so
-        a partial push must not read as a spurious "off"). A contradicting push
-        then drops on/off optimism now instead of waiting out OPTIMISTIC_TIMEOUT.
+        The coordinator merges the push into the device's full state, and drops
+        optimism it confirmed, before dispatching, so self._device.is_on is
+        current. push_data holds only the
+        states the push carried, and we only act when it carried switch state:
+        a partial push leaves the earlier on/off value in place, which must not
+        read as the device contradicting a command in flight. A contradicting
+        push then drops on/off optimism now instead of waiting out
+        OPTIMISTIC_TIMEOUT.
 
         Brightness is intentionally NOT cleared here: a push during a dimming
         ramp can carry an intermediate value, so a brightness mismatch is not
@@ -317,6 +396,6 @@ class UhomeLightEntity(CoordinatorEntity, LightEntity):
             self._optimistic_is_on = None
 
         if self._optimistic_is_on is None and self._pending_brightness_utec is None:
-            self._optimistic_set_at = None
+            self._clear_optimistic()
 
         self.async_write_ha_state()
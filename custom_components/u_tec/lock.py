@@ -11,8 +11,8 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
+from utec_py.devices.device_const import LockState
 from utec_py.devices.lock import Lock as UhomeLock
 from utec_py.exceptions import DeviceError
 
@@ -21,10 +21,12 @@ from .const import (
     DOMAIN,
     OPTIMISTIC_TIMEOUT,
     SIGNAL_DEVICE_UPDATE,
+    SIGNAL_NEW_DEVICE,
     is_optimistic_enabled,
     push_asserts_state,
 )
 from .coordinator import UhomeDataUpdateCoordinator
+from .entity import UhomeOptimisticEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +40,9 @@ _LOGGER = logging.getLogger(__name__)
 # In this mode the device ignores lock/unlock commands outright.
 PASSAGE_MODE = "Passage"
 
+# Capability the lock's optimistic state is recorded under in the ledger.
+LOCK_CAPABILITY = "st.lock"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -55,12 +60,26 @@ async def async_setup_entry(
         if isinstance(device, UhomeLock)
     )
 
+    @callback
+    def async_add_new_devices(device_ids: list[str]) -> None:
+        """Add entities for devices found by a later discovery."""
+        async_add_entities(
+            UhomeLockEntity(coordinator, device_id)
+            for device_id in device_ids
+            if isinstance(coordinator.devices.get(device_id), UhomeLock)
+        )
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, f"{SIGNAL_NEW_DEVICE}_{entry.entry_id}", async_add_new_devices
+        )
+    )
+
 
-class UhomeLockEntity(CoordinatorEntity, LockEntity):
+class UhomeLockEntity(UhomeOptimisticEntity, LockEntity):
     """Representation of a Uhome lock."""
 
-    _optimistic_is_locked: bool | None = None
-    _optimistic_set_at: datetime | None = None
+    _optimistic_capability = LOCK_CAPABILITY
     _force_next_write: bool = False
 
     def __init__(self, coordinator: UhomeDataUpdateCoordinator, device_id: str) -> None:
@@ -68,7 +87,6 @@ class UhomeLockEntity(CoordinatorEntity, LockEntity):
         super().__init__(coordinator)
         self._device = cast(UhomeLock, coordinator.devices[device_id])
         self._attr_unique_id = f"{DOMAIN}_{device_id}"
-        self._attr_name = self._device.name
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._device.device_id)},
             name=self._device.name,
@@ -77,8 +95,6 @@ class UhomeLockEntity(CoordinatorEntity, LockEntity):
             hw_version=self._device.hw_version,
         )
         self._attr_has_entity_name = True
-        self._optimistic_is_locked: bool | None = None
-        self._optimistic_set_at: datetime | None = None
         self._force_next_write = False
 
     @property
@@ -136,14 +152,29 @@ class UhomeLockEntity(CoordinatorEntity, LockEntity):
         )
 
     @property
-    def available(self) -> bool:
-        """Return True if entity is available.
+    def _optimistic_is_locked(self) -> bool | None:
+        """Return the commanded lock state awaiting confirmation, if any."""
+        entry = self.coordinator.optimistic.get(self._device.device_id, LOCK_CAPABILITY)
+        return entry.value if entry else None
+
+    @_optimistic_is_locked.setter
+    def _optimistic_is_locked(self, value: bool | None) -> None:
+        self.coordinator.optimistic.update(
+            self._device.device_id, LOCK_CAPABILITY, value=value
+        )
+
+    @property
+    def _optimistic_set_at(self) -> datetime | None:
+        """Return when the outstanding optimism started."""
+        entry = self.coordinator.optimistic.get(self._device.device_id, LOCK_CAPABILITY)
+        return entry.set_at if entry else None
 
-        Unavailable only when the device itself is offline, or the coordinator
-        has failed two consecutive API polls (a single transient failure is
-        tolerated).
-        """
-        return self.coordinator.poll_healthy_enough and self._device.available
+    @_optimistic_set_at.setter
+    def _optimistic_set_at(self, value: datetime | None) -> None:
+        if self._optimistic_is_locked is not None:
+            self.coordinator.optimistic.update(
+                self._device.device_id, LOCK_CAPABILITY, set_at=value
+            )
 
     @property
     def is_locked(self) -> bool:
@@ -159,7 +190,13 @@ class UhomeLockEntity(CoordinatorEntity, LockEntity):
 
     @property
     def assumed_state(self) -> bool:
-        """Return True if the current reported state is optimistic and unconfirmed."""
+        """Return True if the reported state is unconfirmed.
+
+        That is an optimistic command result, or state restored from the
+        startup cache that no poll or push has confirmed yet.
+        """
+        if self._device.device_id in self.coordinator.restored_device_ids:
+            return True
         return self._is_optimistic() and self._optimistic_is_locked is not None
 
     def _handle_coordinator_update(self) -> None:
@@ -169,32 +206,36 @@ class UhomeLockEntity(CoordinatorEntity, LockEntity):
         clear the optimistic state on the first poll, which may still return the
         old value. But we cannot wait forever either: if the device never
         reaches the commanded state the entity would stay wrong indefinitely.
-        So optimism is held for OPTIMISTIC_TIMEOUT and then released.
+        So optimism is held for OPTIMISTIC_TIMEOUT and then released, by the
+        expiry timer started with it; the check here only backs that up.
+
+        The coordinator drops optimism the device confirmed before listeners
+        are told of the update. Updates that did not touch this device are
+        skipped unless optimism is outstanding.
         """
-        if self._optimistic_is_locked is not None:
-            if self._device.lock_mode == PASSAGE_MODE:
-                # The lock entered Passage mode while optimism was outstanding.
-                # It will never confirm, and _is_optimistic() now reports False,
-                # so holding on would make is_locked return an assumed value
-                # while assumed_state claims it is confirmed. Drop it now.
-                self._optimistic_is_locked = None
-                self._optimistic_set_at = None
-            elif self._optimistic_is_locked == self._device.is_locked:
-                self._optimistic_is_locked = None
-                self._optimistic_set_at = None
-            elif self._optimistic_set_at is None:
-                # Optimistic value with no timestamp: start the clock now
-                # rather than clearing, so the grace period is preserved.
-                self._optimistic_set_at = dt_util.utcnow()
-            elif dt_util.utcnow() - self._optimistic_set_at > OPTIMISTIC_TIMEOUT:
-                _LOGGER.debug(
-                    "Optimistic state for %s unconfirmed after %s; trusting device",
-                    self._device.device_id,
-                    OPTIMISTIC_TIMEOUT,
-                )
-                self._optimistic_is_locked = None
-                self._optimistic_set_at = None
-            # else: still within the grace period while the bolt moves
+        if self._optimistic_is_locked is None:
+            self._cancel_optimistic_expiry()
+            if not self.coordinator.device_changed(self._device.device_id):
+                return
+        elif self._device.lock_mode == PASSAGE_MODE:
+            # The lock entered Passage mode while optimism was outstanding.
+            # It will never confirm, and _is_optimistic() now reports False,
+            # so holding on would make is_locked return an assumed value
+            # while assumed_state claims it is confirmed. Drop it now.
+            self._clear_optimistic()
+        elif self._optimistic_set_at is None:
+            # Optimistic value with no timestamp: start the clock now
+            # rather than clearing, so the grace period is preserved.
+            self._optimistic_set_at = dt_util.utcnow()
+            self._schedule_optimistic_expiry()
+        elif dt_util.utcnow() - self._optimistic_set_at > OPTIMISTIC_TIMEOUT:
+            _LOGGER.debug(
+                "Optimistic state for %s unconfirmed after %s; trusting device",
+                self._device.device_id,
+                OPTIMISTIC_TIMEOUT,
+            )
+            self._clear_optimistic()
+        # else: still within the grace period while the bolt moves
         super()._handle_coordinator_update()
 
     @property
@@ -211,14 +252,39 @@ class UhomeLockEntity(CoordinatorEntity, LockEntity):
             attributes["is_door_open"] = self._device.is_door_open
         return attributes
 
+    def _skip_redundant(self, target: LockState) -> bool:
+        """Return True if the lock already reports target and the command can be skipped.
+
+        Never in Passage mode: the device ignores commands there, and the lock
+        path relies on sending one to resync listeners.
+        """
+        if self._device.lock_mode == PASSAGE_MODE:
+            return False
+        return self.coordinator.skip_redundant_command(
+            self._device.device_id,
+            LOCK_CAPABILITY,
+            self._device.lock_state == target,
+        )
+
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the device."""
+        if self._skip_redundant(LockState.LOCKED):
+            # No command, so no state change follows; listeners waiting on
+            # one (HomeKit's "Locking...") still need an event.
+            self._resync_listeners()
+            return
         _LOGGER.debug("Locking device %s", self._device.device_id)
         try:
-            await self._device.lock()
+            if not await self._async_send(self._device.lock()):
+                return
+            if self._device.lock_mode != PASSAGE_MODE:
+                self.coordinator.async_confirm_device_state(
+                    self._device.device_id, lambda: self._device.is_locked
+                )
             if self._is_optimistic():
                 self._optimistic_is_locked = True
                 self._optimistic_set_at = dt_util.utcnow()
+                self._schedule_optimistic_expiry()
                 self.async_write_ha_state()
             elif self._device.lock_mode == PASSAGE_MODE:
                 # Passage mode ignores the command, so no state change will
@@ -242,12 +308,20 @@ class UhomeLockEntity(CoordinatorEntity, LockEntity):
         command leaves consumers' target and current states in agreement and
         nothing can hang. Only the lock direction can diverge.
         """
+        if self._skip_redundant(LockState.UNLOCKED):
+            self._resync_listeners()
+            return
         _LOGGER.debug("Unlocking device %s", self._device.device_id)
         try:
-            await self._device.unlock()
+            if not await self._async_send(self._device.unlock()):
+                return
+            self.coordinator.async_confirm_device_state(
+                self._device.device_id, lambda: not self._device.is_locked
+            )
             if self._is_optimistic():
                 self._optimistic_is_locked = False
                 self._optimistic_set_at = dt_util.utcnow()
+                self._schedule_optimistic_expiry()
                 self.async_write_ha_state()
         except DeviceError as err:
             _LOGGER.error("Failed to unlock device %s: %s", self._device.device_id, err)
@@ -257,6 +331,9 @@ class UhomeLockEntity(CoordinatorEntity, LockEntity):
         """Register callbacks."""
         await super().async_added_to_hass()
 
+        self.async_on_remove(self._cancel_optimistic_expiry)
+        if self._optimistic_is_locked is not None:  # restored mid-command
+            self._schedule_optimistic_expiry()
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
@@ -269,26 +346,26 @@ class UhomeLockEntity(CoordinatorEntity, LockEntity):
     def _handle_push_update(self, push_data):
         """Update device from push data, clearing optimistic state on disagreement.
 
-        By the time this fires, the coordinator has already applied the push to
-        the device (coordinator.update_push_data calls device.update_state_data
-        before dispatching), so self._device.is_locked reflects the pushed
-        state. A push that authoritatively contradicts an outstanding optimistic
+        By the time this fires, the coordinator has already merged the push
+        into the device's full state, so self._device.is_locked is current,
+        and dropped optimism the push confirmed. A push that authoritatively
+        contradicts an outstanding optimistic
         value drops the optimism immediately rather than waiting out
         OPTIMISTIC_TIMEOUT -- this corrects the #58 auto-lock case (device
         re-locks itself after an unlock) within seconds.
 
-        We only act when the push actually carried lock state: pushes are
-        full-state replaces, and Lock.is_locked falls back to False when the
-        lock capability is absent, so a partial push (e.g. a door-sensor event)
-        would otherwise read as a spurious "unlocked" and clear optimism
-        mid-command. A push that agrees, omits lock state, or leaves it
-        unchanged stays on the confirm/timeout path.
+        push_data holds only the states the push carried, and we only act when
+        it carried lock state: after a partial push (e.g. a door-sensor event)
+        is_locked still shows the earlier lock state, which must not clear
+        optimism mid-command. A push that agrees, omits lock state, or leaves
+        it unchanged stays on the confirm/timeout path.
         """
         if (
             self._optimistic_is_locked is not None
             and push_asserts_state(push_data, "st.lock", "lockState")
             and self._optimistic_is_locked != self._device.is_locked
         ):
-            self._optimistic_is_locked = None
-            self._optimistic_set_at = None
+            self._clear_optimistic()
+        elif self._optimistic_is_locked is None:
+            self._cancel_optimistic_expiry()
         self.async_write_ha_state()
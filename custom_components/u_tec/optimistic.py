@@ -1,4 +1,4 @@
-"""Optimistic-update configuration resolver.
+"""Optimistic-update configuration resolver and ledger.
 
 Standalone module with no project or Home Assistant imports, so it can be
 unit-tested without loading the integration package or Home Assistant.
@@ -6,13 +6,23 @@ unit-tested without loading the integration package or Home Assistant.
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Callable, Mapping
 
 CONF_OPTIMISTIC_LIGHTS = "optimistic_lights"
 CONF_OPTIMISTIC_SWITCHES = "optimistic_switches"
 CONF_OPTIMISTIC_LOCKS = "optimistic_locks"
 DEFAULT_OPTIMISTIC = True
 
+# The device accessor each optimistic capability is confirmed against. Ledger
+# values are in the accessor's terms (is_locked, not the raw lockState).
+OPTIMISTIC_ACCESSORS = {
+    "st.lock": "is_locked",
+    "st.switch": "is_on",
+    "st.switchLevel": "brightness",
+}
+
 
 def is_optimistic_enabled(
     options: Mapping[str, Any],
@@ -36,19 +46,138 @@ def is_optimistic_enabled(
 def push_asserts_state(push_data: Any, capability: str, attribute: str) -> bool:
     """Return True if a push payload actually carries the given capability state.
 
-    U-Tec pushes are full-state replaces (utec_py update_state_data assigns the
-    payload wholesale), and the device accessors fall back to a default when a
-    capability is absent -- e.g. Lock.is_locked and Switch.is_on both return
-    False when their capability is missing, which is indistinguishable from a
-    real "unlocked"/"off". A partial push (a door-sensor or battery event that
-    omits the lock/switch state) would therefore read as an authoritative
-    "off"/"unlocked" and wrongly clear optimistic state mid-command.
-
-    push_data is the {capability: {attribute: value}} dict produced by
-    device.get_state_data(); only treat a push as asserting the state when the
-    relevant capability/attribute is actually present in it.
+    The coordinator merges partial pushes into the device's last known full
+    state, so the device accessors can be trusted after every push. Whether
+    the push said anything about a capability is a separate question: a
+    door-sensor or battery event leaves the lock/switch state as it was, and
+    that earlier state must not clear optimistic state mid-command as if the
+    device had just reported it.
+
+    push_data is the {capability: {attribute: value}} dict of the states the
+    push carried (SIGNAL_DEVICE_UPDATE); only treat a push as asserting the
+    state when the relevant capability/attribute is actually present in it.
     """
     if not isinstance(push_data, dict):
         return False
     cap = push_data.get(capability)
     return isinstance(cap, dict) and attribute in cap
+
+
+@dataclass
+class OptimisticEntry:
+    """A commanded state the device has not confirmed yet.
+
+    value is what the device accessor will report once the command lands;
+    display, when set, is what the entity shows meanwhile (a light's 0-255
+    brightness for a 1-100 device level).
+    """
+
+    value: Any = None
+    display: Any = None
+    set_at: datetime | None = None
+
+
+class OptimisticLedger:
+    """Outstanding optimistic states, keyed by device and capability.
+
+    Entities record what they commanded; the coordinator confirms entries
+    once per incoming state update and persists the ledger, so optimism
+    survives a restart mid-command. on_change is called after every change.
+    """
+
+    def __init__(self, on_change: Callable[[], None] | None = None) -> None:
+        """Initialize an empty ledger."""
+        self._entries: dict[str, dict[str, OptimisticEntry]] = {}
+        self._on_change = on_change
+
+    def __len__(self) -> int:
+        """Return the number of outstanding entries."""
+        return sum(len(entries) for entries in self._entries.values())
+
+    def _changed(self) -> None:
+        if self._on_change is not None:
+            self._on_change()
+
+    def get(self, device_id: str, capability: str) -> OptimisticEntry | None:
+        """Return the outstanding entry for a device capability, if any."""
+        return self._entries.get(device_id, {}).get(capability)
+
+    def entries(self, device_id: str) -> Mapping[str, OptimisticEntry]:
+        """Return a device's outstanding entries by capability."""
+        return self._entries.get(device_id, {})
+
+    def update(self, device_id: str, capability: str, **changes: Any) -> None:
+        """Create or change an entry; one with neither value nor display is dropped."""
+        current = self.get(device_id, capability) or OptimisticEntry()
+        entry = replace(current, **changes)
+        if entry == current and capability in self.entries(device_id):
+            return
+        if entry.value is None and entry.display is None:
+            self.clear(device_id, capability)
+            return
+        self._entries.setdefault(device_id, {})[capability] = entry
+        self._changed()
+
+    def clear(self, device_id: str, capability: str | None = None) -> bool:
+        """Drop one capability's entry, or all of a device's; True if any existed."""
+        entries = self._entries.get(device_id)
+        if not entries:
+            return False
+        if capability is None:
+            del self._entries[device_id]
+        else:
+            if entries.pop(capability, None) is None:
+                return False
+            if not entries:
+                del self._entries[device_id]
+        self._changed()
+        return True
+
+    def confirm(self, device_id: str, device: Any) -> list[str]:
+        """Drop the entries a device's current state satisfies.
+
+        Returns the confirmed capabilities. Entries for capabilities without
+        a known accessor, or still waiting for a value, are left alone.
+        """
+        confirmed = [
+            capability
+            for capability, entry in self.entries(device_id).items()
+            if entry.value is not None
+            and capability in OPTIMISTIC_ACCESSORS
+            and getattr(device, OPTIMISTIC_ACCESSORS[capability], None) == entry.value
+        ]
+        for capability in confirmed:
+            self.clear(device_id, capability)
+        return confirmed
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Return the ledger in a JSON-serializable form, for storage and diagnostics."""
+        return {
+            device_id: {
+                capability: {
+                    "value": entry.value,
+                    "display": entry.display,
+                    "set_at": entry.set_at.isoformat() if entry.set_at else None,
+                }
+                for capability, entry in entries.items()
+            }
+            for device_id, entries in self._entries.items()
+        }
+
+    def load(self, data: Mapping[str, Any], device_ids: set[str]) -> None:
+        """Restore entries saved by as_dict for the given devices."""
+        for device_id, entries in data.items():
+            if device_id not in device_ids or not isinstance(entries, dict):
+                continue
+            for capability, entry in entries.items():
+                try:
+                    set_at = entry.get("set_at")
+                    restored = OptimisticEntry(
+                        value=entry.get("value"),
+                        display=entry.get("display"),
+                        set_at=datetime.fromisoformat(set_at) if set_at else None,
+                    )
+                except (AttributeError, TypeError, ValueError):
+                    continue
+                if restored.value is not None or restored.display is not None:
+                    self._entries.setdefault(device_id, {})[capability] = restored
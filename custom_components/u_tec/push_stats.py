@@ -0,0 +1,93 @@
+"""Rolling statistics on push delivery.
+
+Standalone module with no project or Home Assistant imports, so it can be
+unit-tested without loading the integration package or Home Assistant.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from datetime import datetime
+from statistics import fmean, median
+from typing import Any
+
+# Samples kept per rolling series.
+PUSH_STATS_SAMPLES = 100
+
+
+def _summary(samples: deque[float]) -> dict[str, Any]:
+    """Return count, mean, median, p95 and max of a series, in seconds."""
+    if not samples:
+        return {"count": 0, "mean": None, "median": None, "p95": None, "max": None}
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean": round(fmean(ordered), 2),
+        "median": round(median(ordered), 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+class PushStats:
+    """Rolling push statistics for one config entry.
+
+    - interarrival: seconds between consecutive pushes (any device).
+    - lead: for pushes that changed a device's state, how many seconds before
+      the next scheduled poll the change was known; what push saves over
+      polling alone.
+    - per-device counts since startup of pushes applied, and of duplicate
+      pushes dropped by deduplication.
+    """
+
+    def __init__(self, samples: int = PUSH_STATS_SAMPLES) -> None:
+        """Initialize empty series."""
+        self._interarrival: deque[float] = deque(maxlen=samples)
+        self._lead: deque[float] = deque(maxlen=samples)
+        self._last_push: datetime | None = None
+        self.device_pushes: Counter[str] = Counter()
+        self.device_duplicates: Counter[str] = Counter()
+
+    def record_push(self, received_at: datetime) -> None:
+        """Record the arrival of a push."""
+        if self._last_push is not None:
+            self._interarrival.append(
+                max(0.0, (received_at - self._last_push).total_seconds())
+            )
+        self._last_push = received_at
+
+    def record_device_push(self, device_id: str) -> None:
+        """Count a push that carried a device's state and was applied."""
+        self.device_pushes[device_id] += 1
+
+    def record_device_duplicate(self, device_id: str) -> None:
+        """Count a push for a device that deduplication dropped."""
+        self.device_duplicates[device_id] += 1
+
+    def record_lead(self, seconds: float) -> None:
+        """Record how far ahead of the next poll a push revealed a change."""
+        self._lead.append(max(0.0, seconds))
+
+    @property
+    def interarrival(self) -> dict[str, Any]:
+        """Return the inter-arrival summary."""
+        return _summary(self._interarrival)
+
+    @property
+    def lead(self) -> dict[str, Any]:
+        """Return the lead-over-polling summary."""
+        return _summary(self._lead)
+
+    def forget_device(self, device_id: str) -> None:
+        """Drop a removed device's counters."""
+        self.device_pushes.pop(device_id, None)
+        self.device_duplicates.pop(device_id, None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every statistic, for diagnostics."""
+        return {
+            "interarrival": self.interarrival,
+            "lead_over_poll": self.lead,
+            "pushes_per_device": dict(self.device_pushes),
+            "duplicates_per_device": dict(self.device_duplicates),
+        }
@@ -1,6 +1,7 @@
 """Support for Uhome Battery Sensors."""
 
-from typing import cast
+from abc import abstractmethod
+from typing import Any, cast
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -8,7 +9,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, EntityCategory
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
@@ -17,8 +18,18 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from utec_py.devices.device_const import DeviceCapability
 from utec_py.devices.lock import Lock as UhomeLock
 
-from .const import DOMAIN, SIGNAL_DEVICE_UPDATE, SIGNAL_NEW_DEVICE
+from .const import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    DOMAIN,
+    SIGNAL_DEVICE_UPDATE,
+    SIGNAL_NEW_CAPABILITIES,
+    SIGNAL_NEW_DEVICE,
+    SIGNAL_PUSH_RECEIVED,
+)
 from .coordinator import UhomeDataUpdateCoordinator
+from .entity import UhomeDeviceEntity
 
 
 async def async_setup_entry(
@@ -33,22 +44,37 @@ async def async_setup_entry(
 
     entities = _create_battery_entities(coordinator)
     entities.append(UhomeLastPushSensor(coordinator))
+    entities.append(UhomePollCircuitSensor(coordinator))
+    entities.append(UhomePushIntervalSensor(coordinator))
+    entities.append(UhomePushLeadSensor(coordinator))
     async_add_entities(entities)
 
     @callback
-    def async_add_sensor_entities() -> None:
-        entities = _create_battery_entities(coordinator, add_only_new=True)
+    def async_add_sensor_entities(device_ids: list[str]) -> None:
+        entities = _create_battery_entities(
+            coordinator, device_ids, add_only_new=True
+        )
         async_add_entities(entities)
 
-    entry.async_on_unload(
-        async_dispatcher_connect(hass, SIGNAL_NEW_DEVICE, async_add_sensor_entities)
-    )
+    for signal in (SIGNAL_NEW_DEVICE, SIGNAL_NEW_CAPABILITIES):
+        entry.async_on_unload(
+            async_dispatcher_connect(
+                hass, f"{signal}_{entry.entry_id}", async_add_sensor_entities
+            )
+        )
+
 
+def _create_battery_entities(coordinator, device_ids=None, add_only_new=False):
+    """Create battery entities for devices with battery capability.
 
-def _create_battery_entities(coordinator, add_only_new=False):
-    """Create battery entities for devices with battery capability."""
+    Only the given device ids are considered (all devices when None), so a
+    discovery that finds a few devices does not rescan the whole account.
+    """
     entities = []
-    for device_id, device in coordinator.devices.items():
+    if device_ids is None:
+        device_ids = list(coordinator.devices)
+    for device_id in device_ids:
+        device = coordinator.devices.get(device_id)
         if hasattr(device, "has_capability") and device.has_capability(
             DeviceCapability.BATTERY_LEVEL
         ):
@@ -64,15 +90,16 @@ def _create_battery_entities(coordinator, add_only_new=False):
     return entities
 
 
-class UhomeBatterySensorEntity(CoordinatorEntity, SensorEntity):
+class UhomeBatterySensorEntity(UhomeDeviceEntity, SensorEntity):
     """Representation of a Uhome battery sensor."""
 
+    _name_suffix = " Battery"
+
     def __init__(self, coordinator: UhomeDataUpdateCoordinator, device_id: str) -> None:
         """Initialize the battery sensor."""
         super().__init__(coordinator)
         self._device = cast(UhomeLock, coordinator.devices[device_id])
         self._attr_unique_id = f"{DOMAIN}_battery_{device_id}"
-        self._attr_name = f"{self._device.name} Battery"
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._device.device_id)},
             name=self._device.name,
@@ -85,12 +112,9 @@ class UhomeBatterySensorEntity(CoordinatorEntity, SensorEntity):
         self._attr_native_unit_of_measurement = PERCENTAGE
 
     @property
-    def available(self) -> bool:
-        """Return True if entity is available.
-
-        Unavailable only when the device is offline or consecutive polls failed.
-        """
-        return self.coordinator.poll_healthy_enough and self._device.available
+    def assumed_state(self) -> bool:
+        """Return True while the value is restored from the startup cache."""
+        return self._device.device_id in self.coordinator.restored_device_ids
 
     @property
     def native_value(self) -> int | None:
@@ -107,9 +131,15 @@ class UhomeBatterySensorEntity(CoordinatorEntity, SensorEntity):
         """Return device state class."""
         return self._attr_state_class
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the update touched this device."""
+        if self.coordinator.device_changed(self._device.device_id):
+            super()._handle_coordinator_update()
+
     async def async_update(self) -> None:
-        """Update device information."""
-        await self._device.update()
+        """Refresh this device's state, joining any fetch already in flight."""
+        await self.coordinator.async_fetch_device_states([self._device.device_id])
 
     async def async_added_to_hass(self):
         """Register callbacks."""
@@ -157,3 +187,141 @@ class UhomeLastPushSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         return self.coordinator.last_push_received
+
+    async def async_added_to_hass(self) -> None:
+        """Register for push notifications; pushes no longer wake listeners."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{SIGNAL_PUSH_RECEIVED}_{self.coordinator.config_entry.entry_id}",
+                self.async_write_ha_state,
+            )
+        )
+
+
+class UhomePollCircuitSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor: state of the coordinator's poll circuit breaker.
+
+    "open" means polling is backing off after repeated cloud failures; the
+    next_attempt attribute says when the next probe poll is due.
+    """
+
+    _attr_has_entity_name = False
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_options = [BREAKER_CLOSED, BREAKER_OPEN, BREAKER_HALF_OPEN]
+
+    def __init__(self, coordinator: UhomeDataUpdateCoordinator) -> None:
+        super().__init__(coordinator)
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{DOMAIN}_poll_circuit_{entry_id}"
+        self._attr_name = "Utec Poll Circuit"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_service")},
+            name="U-Tec Integration",
+            manufacturer="U-Tec",
+        )
+
+    @property
+    def available(self) -> bool:
+        """Stay available while polls fail; that is what this sensor reports."""
+        return True
+
+    @property
+    def native_value(self) -> str:
+        return self.coordinator.breaker_state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        next_attempt = self.coordinator.breaker_next_attempt
+        return {
+            "consecutive_failures": self.coordinator.breaker_failures,
+            "next_attempt": next_attempt.isoformat() if next_attempt else None,
+        }
+
+
+class _UhomePushStatsSensor(CoordinatorEntity, SensorEntity):
+    """Base for diagnostic sensors over the coordinator's rolling push stats.
+
+    The state is the median of a rolling series, in seconds; the other
+    summary figures are attributes. Refreshed on every push and poll.
+    """
+
+    _attr_has_entity_name = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _key: str
+    _name: str
+
+    def __init__(self, coordinator: UhomeDataUpdateCoordinator) -> None:
+        super().__init__(coordinator)
+        entry_id = coordinator.config_entry.entry_id
+        self._attr_unique_id = f"{DOMAIN}_{self._key}_{entry_id}"
+        self._attr_name = self._name
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry_id}_service")},
+            name="U-Tec Integration",
+            manufacturer="U-Tec",
+        )
+
+    @abstractmethod
+    def _summary(self) -> dict[str, Any]:
+        """Return the rolling series summary this sensor reports."""
+
+    @property
+    def native_value(self) -> float | None:
+        return self._summary()["median"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        summary = self._summary()
+        return {
+            "samples": summary["count"],
+            "mean": summary["mean"],
+            "p95": summary["p95"],
+            "max": summary["max"],
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Register for push notifications; pushes no longer wake listeners."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                f"{SIGNAL_PUSH_RECEIVED}_{self.coordinator.config_entry.entry_id}",
+                self.async_write_ha_state,
+            )
+        )
+
+
+class UhomePushIntervalSensor(_UhomePushStatsSensor):
+    """Diagnostic sensor: median time between pushes.
+
+    Per-device push counts grow with the fleet, so they are left to
+    diagnostics rather than written to the state machine on every push.
+    """
+
+    _key = "push_interval"
+    _name = "Utec Push Interval"
+
+    def _summary(self) -> dict[str, Any]:
+        return self.coordinator.push_stats.interarrival
+
+
+class UhomePushLeadSensor(_UhomePushStatsSensor):
+    """Diagnostic sensor: median head start push gave a change over polling.
+
+    For each push that changed a device's state, the time left until the next
+    scheduled poll would have picked it up. Steady samples mean push is
+    revealing changes before polls do, so scan_interval can be raised; few
+    samples while devices change state mean polling is doing the work.
+    """
+
+    _key = "push_lead"
+    _name = "Utec Push Lead Over Poll"
+
+    def _summary(self) -> dict[str, Any]:
+        return self.coordinator.push_stats.lead
@@ -11,7 +11,6 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 from utec_py.devices.switch import Switch as UhomeSwitch
 from utec_py.exceptions import DeviceError
@@ -21,14 +20,19 @@ from .const import (
     DOMAIN,
     OPTIMISTIC_TIMEOUT,
     SIGNAL_DEVICE_UPDATE,
+    SIGNAL_NEW_DEVICE,
     is_optimistic_enabled,
     push_asserts_state,
 )
 from .coordinator import UhomeDataUpdateCoordinator
+from .entity import UhomeOptimisticEntity
 
 # define our own logger so we don't import the private internal logger, and instead use a module logger
 _LOGGER = logging.getLogger(__name__)
 
+# Capability the switch's optimistic state is recorded under in the ledger.
+SWITCH_CAPABILITY = "st.switch"
+
 # The optimistic timeout and push-clear handling below mirrors lock.py, which
 # was verified on real hardware. The switch path uses the same logic but is
 # unverified on a live U-Tec switch. https://github.com/LF2b2w/Uhome-HA/issues/58
@@ -50,19 +54,32 @@ async def async_setup_entry(
         if isinstance(device, UhomeSwitch)
     )
 
+    @callback
+    def async_add_new_devices(device_ids: list[str]) -> None:
+        """Add entities for devices found by a later discovery."""
+        async_add_entities(
+            UhomeSwitchEntity(coordinator, device_id)
+            for device_id in device_ids
+            if isinstance(coordinator.devices.get(device_id), UhomeSwitch)
+        )
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, f"{SIGNAL_NEW_DEVICE}_{entry.entry_id}", async_add_new_devices
+        )
+    )
+
 
-class UhomeSwitchEntity(CoordinatorEntity, SwitchEntity):
+class UhomeSwitchEntity(UhomeOptimisticEntity, SwitchEntity):
     """Representation of a Uhome switch."""
 
-    _optimistic_is_on: bool | None = None
-    _optimistic_set_at: datetime | None = None
+    _optimistic_capability = SWITCH_CAPABILITY
 
     def __init__(self, coordinator: UhomeDataUpdateCoordinator, device_id: str) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
         self._device = cast(UhomeSwitch, coordinator.devices[device_id])
         self._attr_unique_id = f"{DOMAIN}_{device_id}"
-        self._attr_name = self._device.name
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._device.device_id)},
             name=self._device.name,
@@ -71,8 +88,6 @@ class UhomeSwitchEntity(CoordinatorEntity, SwitchEntity):
             hw_version=self._device.hw_version,
         )
         self._attr_has_entity_name = True
-        self._optimistic_is_on: bool | None = None
-        self._optimistic_set_at: datetime | None = None
 
     def _is_optimistic(self) -> bool:
         """Return True if optimistic updates apply to this device."""
@@ -83,12 +98,29 @@ class UhomeSwitchEntity(CoordinatorEntity, SwitchEntity):
         )
 
     @property
-    def available(self) -> bool:
-        """Return True if entity is available.
+    def _optimistic_is_on(self) -> bool | None:
+        """Return the commanded on/off state awaiting confirmation, if any."""
+        entry = self.coordinator.optimistic.get(self._device.device_id, SWITCH_CAPABILITY)
+        return entry.value if entry else None
 
-        Unavailable only when the device is offline or two consecutive polls failed.
-        """
-        return self.coordinator.poll_healthy_enough and self._device.available
+    @_optimistic_is_on.setter
+    def _optimistic_is_on(self, value: bool | None) -> None:
+        self.coordinator.optimistic.update(
+            self._device.device_id, SWITCH_CAPABILITY, value=value
+        )
+
+    @property
+    def _optimistic_set_at(self) -> datetime | None:
+        """Return when the outstanding optimism started."""
+        entry = self.coordinator.optimistic.get(self._device.device_id, SWITCH_CAPABILITY)
+        return entry.set_at if entry else None
+
+    @_optimistic_set_at.setter
+    def _optimistic_set_at(self, value: datetime | None) -> None:
+        if self._optimistic_is_on is not None:
+            self.coordinator.optimistic.update(
+                self._device.device_id, SWITCH_CAPABILITY, set_at=value
+            )
 
     @property
     def is_on(self) -> bool:
@@ -99,7 +131,13 @@ class UhomeSwitchEntity(CoordinatorEntity, SwitchEntity):
 
     @property
     def assumed_state(self) -> bool:
-        """Return True if the current reported state is optimistic and unconfirmed."""
+        """Return True if the reported state is unconfirmed.
+
+        That is an optimistic command result, or state restored from the
+        startup cache that no poll or push has confirmed yet.
+        """
+        if self._device.device_id in self.coordinator.restored_device_ids:
+            return True
         return self._is_optimistic() and self._optimistic_is_on is not None
 
     def _handle_coordinator_update(self) -> None:
@@ -108,34 +146,48 @@ class UhomeSwitchEntity(CoordinatorEntity, SwitchEntity):
         Optimism is held while the device catches up, but only for
         OPTIMISTIC_TIMEOUT -- otherwise a command the device never fulfils
         would pin the entity indefinitely. See lock.py for the reproduced case.
+        The expiry timer releases it on time; the check here only backs it up.
+        The coordinator drops optimism the device confirmed before listeners
+        are told of the update. Updates that did not touch this device are
+        skipped unless optimism is outstanding.
         """
-        if self._optimistic_is_on is not None:
-            if self._optimistic_is_on == self._device.is_on:
-                self._optimistic_is_on = None
-                self._optimistic_set_at = None
-            elif self._optimistic_set_at is None:
-                # Optimistic value with no timestamp: start the clock rather
-                # than clearing, so the grace period is preserved.
-                self._optimistic_set_at = dt_util.utcnow()
-            elif dt_util.utcnow() - self._optimistic_set_at > OPTIMISTIC_TIMEOUT:
-                _LOGGER.debug(
-                    "Optimistic state for %s unconfirmed after %s; trusting device",
-                    self._device.device_id,
-                    OPTIMISTIC_TIMEOUT,
-                )
-                self._optimistic_is_on = None
-                self._optimistic_set_at = None
-            # else: still within the grace period
+        if self._optimistic_is_on is None:
+            self._cancel_optimistic_expiry()
+            if not self.coordinator.device_changed(self._device.device_id):
+                return
+        elif self._optimistic_set_at is None:
+            # Optimistic value with no timestamp: start the clock rather
+            # than clearing, so the grace period is preserved.
+            self._optimistic_set_at = dt_util.utcnow()
+            self._schedule_optimistic_expiry()
+        elif dt_util.utcnow() - self._optimistic_set_at > OPTIMISTIC_TIMEOUT:
+            _LOGGER.debug(
+                "Optimistic state for %s unconfirmed after %s; trusting device",
+                self._device.device_id,
+                OPTIMISTIC_TIMEOUT,
+            )
+            self._clear_optimistic()
+        # else: still within the grace period
         super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
+        if self.coordinator.skip_redundant_command(
+            self._device.device_id, SWITCH_CAPABILITY, self._device.is_on
+        ):
+            self.async_write_ha_state()
+            return
         _LOGGER.debug("Turning on switch %s", self._device.device_id)
         try:
-            await self._device.turn_on()
+            if not await self._async_send(self._device.turn_on()):
+                return
+            self.coordinator.async_confirm_device_state(
+                self._device.device_id, lambda: self._device.is_on
+            )
             if self._is_optimistic():
                 self._optimistic_is_on = True
                 self._optimistic_set_at = dt_util.utcnow()
+                self._schedule_optimistic_expiry()
                 self.async_write_ha_state()
         except DeviceError as err:
             _LOGGER.error(
@@ -145,12 +197,22 @@ class UhomeSwitchEntity(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
+        if self.coordinator.skip_redundant_command(
+            self._device.device_id, SWITCH_CAPABILITY, not self._device.is_on
+        ):
+            self.async_write_ha_state()
+            return
         _LOGGER.debug("Turning off switch %s", self._device.device_id)
         try:
-            await self._device.turn_off()
+            if not await self._async_send(self._device.turn_off()):
+                return
+            self.coordinator.async_confirm_device_state(
+                self._device.device_id, lambda: not self._device.is_on
+            )
             if self._is_optimistic():
                 self._optimistic_is_on = False
                 self._optimistic_set_at = dt_util.utcnow()
+                self._schedule_optimistic_expiry()
                 self.async_write_ha_state()
         except DeviceError as err:
             _LOGGER.error(
@@ -162,6 +224,9 @@ class UhomeSwitchEntity(CoordinatorEntity, SwitchEntity):
         """Register callbacks."""
         await super().async_added_to_hass()
 
+        self.async_on_remove(self._cancel_optimistic_expiry)
+        if self._optimistic_is_on is not None:  # restored mid-command
+            self._schedule_optimistic_expiry()
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
@@ -174,11 +239,12 @@ class UhomeSwitchEntity(CoordinatorEntity, SwitchEntity):
     def _handle_push_update(self, push_data):
         """Update device from push data, clearing optimistic state on disagreement.
 
-        The coordinator applies the push to the device before dispatching, so
-        self._device.is_on reflects the pushed state. We only act when the push
-        actually carried switch state: pushes are full-state replaces and
-        Switch.is_on falls back to False when the switch capability is absent,
-        so a partial push must not be read as a spurious "off". A contradicting
+        The coordinator merges the push into the device's full state and drops
+        optimism it confirmed before dispatching, so self._device.is_on is
+        current. push_data holds only the states the push carried, and we only
+        act when it carried switch state: a partial push leaves the earlier
+        on/off value in place, which must not read as the device contradicting
+        a command in flight. A contradicting
         push then drops the optimism at once rather than waiting out
         OPTIMISTIC_TIMEOUT.
         """
@@ -187,6 +253,7 @@ class UhomeSwitchEntity(CoordinatorEntity, SwitchEntity):
             and push_asserts_state(push_data, "st.switch", "switch")
             and self._optimistic_is_on != self._device.is_on
         ):
-            self._optimistic_is_on = None
-            self._optimistic_set_at = None
+            self._clear_optimistic()
+        elif self._optimistic_is_on is None:
+            self._cancel_optimistic_expiry()
         self.async_write_ha_state()
@@ -68,11 +68,12 @@ def auto_enable_custom_integrations(enable_custom_integrations):
 
 @pytest.fixture
 def mock_uhome_api():
-    """Mock utec_py.api.UHomeApi instance."""
-    from utec_py.api import UHomeApi
+    """Mock UHomeCommandApi (utec_py's UHomeApi plus batched commands)."""
+    from custom_components.u_tec.api import UHomeCommandApi
 
-    api = MagicMock(spec=UHomeApi)
+    api = MagicMock(spec=UHomeCommandApi)
     api.send_command = AsyncMock(return_value={"payload": {"devices": []}})
+    api.send_commands = AsyncMock(return_value={"payload": {"devices": []}})
     api.query_device = AsyncMock(return_value={"payload": {"devices": []}})
     api.get_device_state = AsyncMock(return_value={"payload": {"devices": []}})
     api.discover_devices = AsyncMock(return_value={"payload": {"devices": []}})
@@ -4,67 +4,56 @@ from unittest.mock import MagicMock
 
 from custom_components.u_tec.const import (
     CONF_OPTIMISTIC_LOCKS,
-    DOMAIN,
     MAX_CONSECUTIVE_UPDATE_FAILURES,
 )
+from custom_components.u_tec.coordinator import UhomeDataUpdateCoordinator
 from custom_components.u_tec.lock import UhomeLockEntity
+from custom_components.u_tec.optimistic import OptimisticLedger
 from tests.common import make_config_entry, make_fake_lock
 
 
-def _coord_with_lock():
-    entry = make_config_entry(options={CONF_OPTIMISTIC_LOCKS: True})
+def _coordinator_with_lock():
+    """Exercise the real availability rule without a full HA setup."""
     lock = make_fake_lock("lock-1", is_locked=True)
     lock.available = True
-    coord = MagicMock()
-    coord.devices = {"lock-1": lock}
-    coord.config_entry = entry
-    coord.last_update_success = True
-    coord.consecutive_update_failures = 0
-    coord.poll_healthy_enough = True
-    coord.data = {}
-    return coord, lock
+    c = object.__new__(UhomeDataUpdateCoordinator)
+    c.devices = {"lock-1": lock}
+    c.consecutive_update_failures = 0
+    c.device_update_failures = {}
+    return c, lock
 
 
 def test_available_when_healthy():
-    coord, lock = _coord_with_lock()
-    ent = UhomeLockEntity(coord, "lock-1")
-    assert ent.available is True
+    c, lock = _coordinator_with_lock()
+    assert c.device_available("lock-1") is True
 
 
 def test_available_through_single_poll_failure():
     """One failed poll must not blank the entity."""
-    coord, lock = _coord_with_lock()
-    coord.consecutive_update_failures = 1
-    coord.poll_healthy_enough = (
-        coord.consecutive_update_failures < MAX_CONSECUTIVE_UPDATE_FAILURES
-    )
-    coord.last_update_success = False
-    ent = UhomeLockEntity(coord, "lock-1")
-    assert ent.available is True
+    c, lock = _coordinator_with_lock()
+    c.consecutive_update_failures = 1
+    assert c.device_available("lock-1") is True
 
 
 def test_unavailable_after_two_consecutive_poll_failures():
-    coord, lock = _coord_with_lock()
-    coord.consecutive_update_failures = 2
-    coord.poll_healthy_enough = (
-        coord.consecutive_update_failures < MAX_CONSECUTIVE_UPDATE_FAILURES
-    )
-    coord.last_update_success = False
-    ent = UhomeLockEntity(coord, "lock-1")
-    assert ent.available is False
+    c, lock = _coordinator_with_lock()
+    c.consecutive_update_failures = MAX_CONSECUTIVE_UPDATE_FAILURES
+    assert c.device_available("lock-1") is False
 
 
 def test_unavailable_when_device_offline():
-    coord, lock = _coord_with_lock()
+    c, lock = _coordinator_with_lock()
     lock.available = False
-    ent = UhomeLockEntity(coord, "lock-1")
-    assert ent.available is False
+    assert c.device_available("lock-1") is False
+
+
+def test_unavailable_when_device_unknown():
+    c, lock = _coordinator_with_lock()
+    assert c.device_available("lock-2") is False
 
 
 def test_poll_healthy_enough_property():
     """Coordinator helper mirrors the consecutive-failure threshold."""
-    from custom_components.u_tec.coordinator import UhomeDataUpdateCoordinator
-
     # Exercise the real property without a full HA setup.
     c = object.__new__(UhomeDataUpdateCoordinator)
     c.consecutive_update_failures = 0
@@ -73,3 +62,23 @@ def test_poll_healthy_enough_property():
     assert c.poll_healthy_enough is True
     c.consecutive_update_failures = 2
     assert c.poll_healthy_enough is False
+
+
+def test_unavailable_when_own_poll_chunk_keeps_failing():
+    """A failing poll chunk blanks its own devices even if others succeed."""
+    c, lock = _coordinator_with_lock()
+    c.device_update_failures = {"lock-1": MAX_CONSECUTIVE_UPDATE_FAILURES}
+    assert c.device_available("lock-1") is False
+
+
+def test_entity_availability_comes_from_the_coordinator():
+    lock = make_fake_lock("lock-1", is_locked=True)
+    coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.devices = {"lock-1": lock}
+    coord.config_entry = make_config_entry(options={CONF_OPTIMISTIC_LOCKS: True})
+    coord.device_available.return_value = False
+    ent = UhomeLockEntity(coord, "lock-1")
+
+    assert ent.available is False
+    coord.device_available.assert_called_with("lock-1")
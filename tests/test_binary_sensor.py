@@ -19,6 +19,14 @@ def door_sensor_setup(hass):
     return coord, lock
 
 
+def test_name_follows_the_device(door_sensor_setup):
+    coord, lock = door_sensor_setup
+    ent = UhomeDoorSensor(coord, "lock-1")
+    assert ent.name == "Fake Lock Door"
+    lock.name = "Back Door Lock"
+    assert ent.name == "Back Door Lock Door"
+
+
 def test_is_on_false_when_door_closed(door_sensor_setup):
     coord, lock = door_sensor_setup
     lock.is_door_closed = True
@@ -33,13 +41,15 @@ def test_is_on_true_when_door_open(door_sensor_setup):
     assert ent.is_on is True
 
 
-def test_available_requires_coordinator_and_device(door_sensor_setup):
+def test_available_follows_the_coordinator(door_sensor_setup):
     coord, lock = door_sensor_setup
     ent = UhomeDoorSensor(coord, "lock-1")
+    coord.device_available.return_value = True
     assert ent.available is True
 
-    coord.poll_healthy_enough = False
+    coord.device_available.return_value = False
     assert ent.available is False
+    coord.device_available.assert_called_with("lock-1")
 
 
 async def test_async_setup_entry_only_adds_locks_with_door_sensor(hass):
@@ -64,3 +74,60 @@ async def test_async_setup_entry_only_adds_locks_with_door_sensor(hass):
     await async_setup_entry(hass, entry, _add)
 
     assert len(added) == 1
+
+
+async def test_lock_gaining_door_sensor_gets_one_entity(hass):
+    from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+    from tests.common import make_config_entry
+    from custom_components.u_tec.binary_sensor import async_setup_entry
+    from custom_components.u_tec.const import DOMAIN, SIGNAL_NEW_CAPABILITIES
+
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    lock = make_fake_lock("lock-1", has_door_sensor=False)
+    coord = MagicMock()
+    coord.devices = {"lock-1": lock}
+    coord.added_sensor_entities = set()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coord}
+    added = []
+    await async_setup_entry(hass, entry, lambda entities: added.extend(entities))
+    assert added == []
+
+    lock.has_door_sensor = True
+    for _ in range(2):  # a repeated signal must not duplicate the entity
+        async_dispatcher_send(
+            hass, f"{SIGNAL_NEW_CAPABILITIES}_{entry.entry_id}", ["lock-1"]
+        )
+        await hass.async_block_till_done()
+
+    assert [ent.unique_id for ent in added] == [f"{DOMAIN}_door_lock-1"]
+
+
+def test_coordinator_update_skips_unchanged_device(door_sensor_setup, hass):
+    coord, lock = door_sensor_setup
+    ent = UhomeDoorSensor(coord, "lock-1")
+    ent.hass = hass
+    ent.entity_id = "binary_sensor.fake_lock_door"
+    ent.async_write_ha_state = MagicMock()
+
+    coord.device_changed = MagicMock(return_value=False)
+    ent._handle_coordinator_update()
+    ent.async_write_ha_state.assert_not_called()
+
+    coord.device_changed = MagicMock(return_value=True)
+    ent._handle_coordinator_update()
+    ent.async_write_ha_state.assert_called_once()
+
+
+def test_push_update_writes_state(door_sensor_setup, hass):
+    """Pushes reach the door sensor directly now they no longer wake listeners."""
+    coord, lock = door_sensor_setup
+    ent = UhomeDoorSensor(coord, "lock-1")
+    ent.hass = hass
+    ent.entity_id = "binary_sensor.fake_lock_door"
+    ent.async_write_ha_state = MagicMock()
+
+    ent._handle_push_update({"st.doorSensor": {"sensorState": "open"}})
+
+    ent.async_write_ha_state.assert_called_once()
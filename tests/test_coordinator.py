@@ -1,5 +1,7 @@
 """Tests for UhomeDataUpdateCoordinator."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from custom_components.u_tec.coordinator import UhomeDataUpdateCoordinator
@@ -278,12 +280,53 @@ async def test_discover_bulk_fetches_initial_state_for_new_devices(
         {"id": "S2", "states": []},
     ]}}
     mock_uhome_api.get_device_state.return_value = state_payload
+    coordinator.data = {}  # first refresh already happened
 
     await coordinator.async_discover_devices()
 
     mock_uhome_api.get_device_state.assert_awaited_once_with(["S1", "S2"], None)
 
 
+async def test_discover_sends_one_signal_with_new_ids(hass, coordinator, mock_uhome_api):
+    from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+    from custom_components.u_tec.const import SIGNAL_NEW_DEVICE
+
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [
+            _discovery("utec-switch", "S1"),
+            _discovery("utec-lock", "L1"),
+        ]}
+    }
+    received = []
+    unsub = async_dispatcher_connect(
+        hass,
+        f"{SIGNAL_NEW_DEVICE}_{coordinator.config_entry.entry_id}",
+        received.append,
+    )
+
+    await coordinator.async_discover_devices()
+    await coordinator.async_discover_devices()  # nothing new the second time
+    await hass.async_block_till_done()
+
+    assert received == [["S1", "L1"]]
+    unsub()
+
+
+async def test_discover_before_first_refresh_leaves_state_to_it(
+    coordinator, mock_uhome_api,
+):
+    """Startup discovery does not fetch what the first refresh polls anyway."""
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [_discovery("utec-switch", "S1")]}
+    }
+
+    await coordinator.async_discover_devices()
+
+    assert "S1" in coordinator.devices
+    mock_uhome_api.get_device_state.assert_not_awaited()
+
+
 async def test_discover_invalid_discovery_data_is_noop(coordinator, mock_uhome_api):
     mock_uhome_api.discover_devices.return_value = {}  # no "payload" key
     await coordinator.async_discover_devices()
@@ -298,6 +341,148 @@ async def test_discover_device_missing_id_is_skipped(coordinator, mock_uhome_api
     assert coordinator.devices == {}
 
 
+async def test_discover_unchanged_payload_is_skipped(coordinator, mock_uhome_api):
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [_discovery("utec-switch", "S1")]}
+    }
+    await coordinator.async_discover_devices()
+    coordinator._apply_discovery_record = MagicMock()
+
+    await coordinator.async_discover_devices()
+
+    coordinator._apply_discovery_record.assert_not_called()
+
+
+async def test_discover_applies_renamed_device_in_place(
+    hass, coordinator, mock_uhome_api,
+):
+    from homeassistant.helpers import device_registry as dr
+
+    from custom_components.u_tec.const import DOMAIN
+
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [_discovery("utec-switch", "S1")]}
+    }
+    await coordinator.async_discover_devices()
+    device = coordinator.devices["S1"]
+    entity = UhomeSwitchEntity(coordinator, "S1")
+    dev_reg = dr.async_get(hass)
+    dev_reg.async_get_or_create(
+        config_entry_id=coordinator.config_entry.entry_id,
+        identifiers={(DOMAIN, "S1")},
+        name="Test",
+    )
+
+    renamed = _discovery("utec-switch", "S1") | {"name": "Porch"}
+    mock_uhome_api.discover_devices.return_value = {"payload": {"devices": [renamed]}}
+    await coordinator.async_discover_devices()
+
+    assert coordinator.devices["S1"] is device
+    assert device.name == "Porch"
+    assert entity.name == "Porch"
+    assert dev_reg.async_get_device(identifiers={(DOMAIN, "S1")}).name == "Porch"
+
+
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from custom_components.u_tec.const import (
+    DISCOVERY_MISSES_BEFORE_REMOVAL,
+    SIGNAL_NEW_CAPABILITIES,
+)
+
+
+async def test_discover_removes_vanished_device(hass, coordinator, mock_uhome_api):
+    from homeassistant.helpers import device_registry as dr
+
+    from custom_components.u_tec.const import DOMAIN
+
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [
+            _discovery("utec-switch", "S1"),
+            _discovery("utec-lock", "L1"),
+        ]}
+    }
+    await coordinator.async_discover_devices()
+    coordinator.data = {"S1": {}, "L1": {}}
+    dev_reg = dr.async_get(hass)
+    dev_reg.async_get_or_create(
+        config_entry_id=coordinator.config_entry.entry_id,
+        identifiers={(DOMAIN, "L1")},
+    )
+
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [_discovery("utec-switch", "S1")]}
+    }
+    for _ in range(DISCOVERY_MISSES_BEFORE_REMOVAL - 1):
+        await coordinator.async_discover_devices()
+        assert "L1" in coordinator.devices
+        assert dev_reg.async_get_device(identifiers={(DOMAIN, "L1")}) is not None
+
+    await coordinator.async_discover_devices()
+
+    assert set(coordinator.devices) == {"S1"}
+    assert "L1" not in coordinator.data
+    assert dev_reg.async_get_device(identifiers={(DOMAIN, "L1")}) is None
+
+
+async def test_discover_reappearing_device_resets_its_misses(
+    coordinator, mock_uhome_api,
+):
+    both = {"payload": {"devices": [
+        _discovery("utec-switch", "S1"),
+        _discovery("utec-lock", "L1"),
+    ]}}
+    only_switch = {"payload": {"devices": [_discovery("utec-switch", "S1")]}}
+    mock_uhome_api.discover_devices.return_value = both
+    await coordinator.async_discover_devices()
+
+    for answer in [only_switch] * (DISCOVERY_MISSES_BEFORE_REMOVAL - 1) + [
+        both, only_switch,
+    ]:
+        mock_uhome_api.discover_devices.return_value = answer
+        await coordinator.async_discover_devices()
+
+    assert "L1" in coordinator.devices
+
+
+async def test_discover_signals_capabilities_a_device_gained(
+    hass, coordinator, mock_uhome_api,
+):
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [_discovery("utec-lock", "L1")]}
+    }
+    await coordinator.async_discover_devices()
+    device = coordinator.devices["L1"]
+    signalled = []
+    async_dispatcher_connect(
+        hass,
+        f"{SIGNAL_NEW_CAPABILITIES}_{coordinator.config_entry.entry_id}",
+        signalled.append,
+    )
+
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [_discovery("utec-lock-sensor", "L1")]}
+    }
+    await coordinator.async_discover_devices()
+    await hass.async_block_till_done()
+
+    assert coordinator.devices["L1"] is device
+    assert device.has_door_sensor
+    assert signalled == [["L1"]]
+
+
+async def test_discover_empty_list_keeps_known_devices(coordinator, mock_uhome_api):
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [_discovery("utec-switch", "S1")]}
+    }
+    await coordinator.async_discover_devices()
+
+    mock_uhome_api.discover_devices.return_value = {"payload": {"devices": []}}
+    await coordinator.async_discover_devices()
+
+    assert "S1" in coordinator.devices
+
+
 # --- error-envelope surfacing (U-Tec returns HTTP 200 with payload.error) ---
 
 
@@ -352,3 +537,692 @@ async def test_discover_invalid_token_payload_raises_config_entry_auth_failed(
     }
     with pytest.raises(ConfigEntryAuthFailed):
         await coordinator.async_discover_devices()
+
+
+# --- per-device change sets ---
+
+
+def _switch_with_state(device_id: str, state: dict):
+    sw = make_fake_switch(device_id)
+    sw.get_state_data = lambda: dict(state)
+    return sw
+
+
+async def test_poll_publishes_only_changed_devices(coordinator, mock_uhome_api):
+    state_1 = {"st.switch": {"switch": "on"}}
+    state_2 = {"st.switch": {"switch": "off"}}
+    coordinator.devices["sw-1"] = _switch_with_state("sw-1", state_1)
+    coordinator.devices["sw-2"] = _switch_with_state("sw-2", state_2)
+    coordinator.data = {"sw-1": {"st.switch": {"switch": "off"}}, "sw-2": state_2}
+
+    await coordinator._async_update_data()
+
+    assert coordinator.device_changed("sw-1") is True
+    assert coordinator.device_changed("sw-2") is False
+
+
+async def test_failed_poll_marks_every_device_changed(coordinator, mock_uhome_api):
+    coordinator.devices["sw-1"] = _switch_with_state("sw-1", {})
+    coordinator.data = {"sw-1": {}}
+    await coordinator._async_update_data()
+    assert coordinator.device_changed("sw-1") is False
+
+    mock_uhome_api.get_device_state.side_effect = ApiError(500, "down")
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+
+    assert coordinator.device_changed("sw-1") is True
+
+
+async def test_recovery_after_failures_marks_every_device_changed(
+    coordinator, mock_uhome_api,
+):
+    coordinator.devices["sw-1"] = _switch_with_state("sw-1", {})
+    coordinator.data = {"sw-1": {}}
+    coordinator.consecutive_update_failures = 2
+
+    await coordinator._async_update_data()
+
+    assert coordinator.device_changed("sw-1") is True
+
+
+# --- push-only update path ---
+
+from custom_components.u_tec.const import SIGNAL_DEVICE_UPDATE, SIGNAL_PUSH_RECEIVED
+
+
+async def test_push_does_not_wake_coordinator_listeners(hass, coordinator):
+    coordinator.devices["sw-1"] = _switch_with_state("sw-1", {"st.switch": {"switch": "on"}})
+    coordinator.devices["sw-2"] = _switch_with_state("sw-2", {})
+    coordinator.data = {"sw-1": {}, "sw-2": {}}
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+    device_signal = MagicMock()
+    push_signal = MagicMock()
+    unsub_device = async_dispatcher_connect(
+        hass, f"{SIGNAL_DEVICE_UPDATE}_sw-1", device_signal
+    )
+    unsub_push = async_dispatcher_connect(
+        hass, f"{SIGNAL_PUSH_RECEIVED}_{coordinator.config_entry.entry_id}", push_signal
+    )
+
+    await coordinator.update_push_data([{"id": "sw-1", "states": [
+        {"capability": "st.switch", "name": "switch", "value": "on"},
+    ]}])
+    await hass.async_block_till_done()
+
+    listener.assert_not_called()
+    device_signal.assert_called_once_with({"st.switch": {"switch": "on"}})
+    push_signal.assert_called_once_with()
+    assert coordinator.data["sw-1"] == {"st.switch": {"switch": "on"}}
+    unsub()
+    unsub_device()
+    unsub_push()
+    coordinator._async_unsub_refresh()
+
+
+async def test_push_after_poll_failures_wakes_every_listener(hass, coordinator):
+    coordinator.devices["sw-1"] = _switch_with_state("sw-1", {})
+    coordinator.data = {"sw-1": {}}
+    coordinator.consecutive_update_failures = 2
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    await coordinator.update_push_data([{"id": "sw-1", "states": []}])
+
+    listener.assert_called_once()
+    assert coordinator.device_changed("sw-2") is True
+    unsub()
+    coordinator._async_unsub_refresh()
+
+
+# --- persisted device/state cache ---
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+
+from custom_components.u_tec.const import STORAGE_KEY
+
+_SWITCH_ON = {"id": "S1", "states": [
+    {"capability": "st.switch", "name": "switch", "value": "on"},
+]}
+
+
+async def test_cache_round_trip_restores_devices_and_state(
+    hass, hass_storage, coordinator, mock_uhome_api,
+):
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [_discovery("utec-switch", "S1")]}
+    }
+    mock_uhome_api.get_device_state.return_value = {"payload": {"devices": [_SWITCH_ON]}}
+    coordinator.data = {}
+    await coordinator.async_discover_devices()
+
+    # The debounced save is flushed on shutdown at the latest.
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    key = f"{STORAGE_KEY}.{coordinator.config_entry.entry_id}"
+    assert hass_storage[key]["data"]["states"] == {"S1": _SWITCH_ON}
+
+    restored = UhomeDataUpdateCoordinator(
+        hass, mock_uhome_api, config_entry=coordinator.config_entry,
+    )
+    assert await restored.async_restore_from_cache() is True
+
+    assert isinstance(restored.devices["S1"], UhomeSwitch)
+    assert restored.devices["S1"].is_on is True
+    assert restored.restored_device_ids == {"S1"}
+    assert restored.data == {"S1": {"st.switch": {"switch": "on"}}}
+
+
+async def test_restore_without_cache_returns_false(coordinator):
+    assert await coordinator.async_restore_from_cache() is False
+    assert coordinator.devices == {}
+
+
+async def test_poll_confirms_restored_device_even_if_unchanged(
+    hass, hass_storage, coordinator, mock_uhome_api,
+):
+    hass_storage[f"{STORAGE_KEY}.{coordinator.config_entry.entry_id}"] = {
+        "version": 1,
+        "key": f"{STORAGE_KEY}.{coordinator.config_entry.entry_id}",
+        "data": {
+            "devices": [_discovery("utec-switch", "S1")],
+            "states": {"S1": _SWITCH_ON},
+        },
+    }
+    await coordinator.async_restore_from_cache()
+    mock_uhome_api.get_device_state.return_value = {"payload": {"devices": [_SWITCH_ON]}}
+
+    await coordinator._async_update_data()
+
+    assert coordinator.restored_device_ids == set()
+    assert coordinator.device_changed("S1") is True
+
+
+# --- single-flight state fetches ---
+
+import asyncio
+
+
+async def test_concurrent_fetches_share_one_request(coordinator, mock_uhome_api):
+    coordinator.devices["sw-1"] = _switch_with_state("sw-1", {})
+    coordinator.devices["sw-2"] = _switch_with_state("sw-2", {})
+    release = asyncio.Event()
+
+    async def slow_state(device_ids, custom):
+        await release.wait()
+        return {"payload": {"devices": [{"id": d, "states": []} for d in device_ids]}}
+
+    mock_uhome_api.get_device_state.side_effect = slow_state
+
+    first = asyncio.create_task(coordinator.async_fetch_device_states(["sw-1", "sw-2"]))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coordinator.async_fetch_device_states(["sw-1"]))
+    third = asyncio.create_task(coordinator.async_fetch_device_states(["sw-2", "sw-3"]))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, second, third)
+
+    # sw-1/sw-2 ride on the first request; only sw-3 needed a call of its own.
+    assert [c.args[0] for c in mock_uhome_api.get_device_state.await_args_list] == [
+        ["sw-1", "sw-2"],
+        ["sw-3"],
+    ]
+    assert coordinator._state_fetches == {}
+
+
+async def test_cancelled_first_caller_does_not_cancel_other_waiters(
+    coordinator, mock_uhome_api,
+):
+    coordinator.devices["sw-1"] = _switch_with_state("sw-1", {})
+    release = asyncio.Event()
+
+    async def slow_state(device_ids, custom):
+        await release.wait()
+        return {"payload": {"devices": []}}
+
+    mock_uhome_api.get_device_state.side_effect = slow_state
+
+    first = asyncio.create_task(coordinator.async_fetch_device_states(["sw-1"]))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coordinator.async_fetch_device_states(["sw-1"]))
+    await asyncio.sleep(0)
+    first.cancel()  # e.g. a confirmation poll replaced by a newer command
+    await asyncio.sleep(0)
+    release.set()
+
+    await second
+    assert first.cancelled()
+    mock_uhome_api.get_device_state.assert_awaited_once()
+    assert coordinator._state_fetches == {}
+
+
+async def test_concurrent_fetch_shares_failure(coordinator, mock_uhome_api):
+    coordinator.devices["sw-1"] = _switch_with_state("sw-1", {})
+    release = asyncio.Event()
+
+    async def failing_state(device_ids, custom):
+        await release.wait()
+        raise ApiError(500, "down")
+
+    mock_uhome_api.get_device_state.side_effect = failing_state
+
+    first = asyncio.create_task(coordinator.async_fetch_device_states(["sw-1"]))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coordinator.async_fetch_device_states(["sw-1"]))
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(first, second, return_exceptions=True)
+
+    assert all(isinstance(r, UpdateFailed) for r in results)
+    mock_uhome_api.get_device_state.assert_awaited_once()
+
+
+# --- post-command confirmation polling ---
+
+from unittest.mock import patch
+
+from custom_components.u_tec.const import OPTIMISTIC_TIMEOUT
+
+
+async def test_confirmation_polls_only_device_until_confirmed(
+    hass, coordinator, mock_uhome_api,
+):
+    states = iter([{"st.switch": {"switch": "off"}}, {"st.switch": {"switch": "on"}}])
+    current = {}
+    sw = make_fake_switch("sw-1")
+    sw.get_state_data = lambda: dict(current)
+
+    async def fetch(device_ids, custom):
+        current.clear()
+        current.update(next(states))
+        return {"payload": {"devices": []}}
+
+    coordinator.devices["sw-1"] = sw
+    coordinator.devices["sw-2"] = make_fake_switch("sw-2")
+    coordinator.data = {"sw-1": {"st.switch": {"switch": "off"}}, "sw-2": {}}
+    mock_uhome_api.get_device_state.side_effect = fetch
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+
+    with patch("custom_components.u_tec.coordinator.asyncio.sleep") as sleep:
+        coordinator.async_confirm_device_state(
+            "sw-1", lambda: current.get("st.switch", {}).get("switch") == "on"
+        )
+        await hass.async_block_till_done()
+
+    assert [c.args[0] for c in mock_uhome_api.get_device_state.await_args_list] == [
+        ["sw-1"],
+        ["sw-1"],
+    ]
+    # (async_block_till_done sleeps too; only the backoff delays matter.)
+    assert [c.args[0] for c in sleep.await_args_list if c.args[0]] == [1.0, 2.0]
+    listener.assert_called_once()
+    assert coordinator.device_changed("sw-1") is True
+    assert coordinator.device_changed("sw-2") is False
+    assert coordinator._confirmations == {}
+    unsub()
+    coordinator._async_unsub_refresh()
+
+
+async def test_confirmation_gives_up_after_optimistic_timeout(
+    hass, coordinator, mock_uhome_api, freezer,
+):
+    coordinator.devices["sw-1"] = _switch_with_state("sw-1", {})
+    coordinator.data = {"sw-1": {}}
+
+    async def tick(delay):
+        freezer.tick(delay)
+
+    with patch(
+        "custom_components.u_tec.coordinator.asyncio.sleep", side_effect=tick
+    ) as sleep:
+        coordinator.async_confirm_device_state("sw-1", lambda: False)
+        await hass.async_block_till_done()
+
+    # 1 + 2 + 4 + 8 seconds, then the remainder of the timeout.
+    assert [c.args[0] for c in sleep.await_args_list if c.args[0]] == [
+        1.0, 2.0, 4.0, 8.0, OPTIMISTIC_TIMEOUT.total_seconds() - 15,
+    ]
+    assert mock_uhome_api.get_device_state.await_count == 5
+    assert coordinator._confirmations == {}
+
+
+# --- push coalescing window ---
+
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.u_tec.const import CONF_PUSH_COALESCE_WINDOW
+from custom_components.u_tec.coordinator import _merge_device_states
+
+
+def test_merge_device_states_later_state_wins():
+    merged = _merge_device_states(
+        {"id": "L1", "states": [
+            {"capability": "st.lock", "name": "lockState", "value": "unlocked"},
+            {"capability": "st.battery", "name": "level", "value": 80},
+        ]},
+        {"id": "L1", "states": [
+            {"capability": "st.lock", "name": "lockState", "value": "locked"},
+        ]},
+    )
+
+    assert merged["states"] == [
+        {"capability": "st.lock", "name": "lockState", "value": "locked"},
+        {"capability": "st.battery", "name": "level", "value": 80},
+    ]
+
+
+async def test_push_burst_within_window_is_applied_once(hass, mock_uhome_api):
+    entry = make_config_entry(options={CONF_PUSH_COALESCE_WINDOW: 500})
+    entry.add_to_hass(hass)
+    coordinator = UhomeDataUpdateCoordinator(hass, mock_uhome_api, config_entry=entry)
+    sw = make_fake_switch("sw-1")
+    coordinator.devices["sw-1"] = sw
+
+    await coordinator.update_push_data([{"id": "sw-1", "states": [
+        {"capability": "st.switch", "name": "switch", "value": "on"},
+    ]}])
+    await coordinator.update_push_data([{"id": "sw-1", "states": [
+        {"capability": "st.switch", "name": "switch", "value": "off"},
+        {"capability": "st.battery", "name": "level", "value": 50},
+    ]}])
+    sw.update_state_data.assert_not_awaited()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    sw.update_state_data.assert_awaited_once_with({"id": "sw-1", "states": [
+        {"capability": "st.switch", "name": "switch", "value": "off"},
+        {"capability": "st.battery", "name": "level", "value": 50},
+    ]})
+    assert "sw-1" in coordinator.device_push_received
+
+
+# --- push deduplication ---
+
+_LOCKED = {"id": "sw-1", "states": [
+    {"capability": "st.lock", "name": "lockState", "value": "locked"},
+]}
+_UNLOCKED = {"id": "sw-1", "states": [
+    {"capability": "st.lock", "name": "lockState", "value": "unlocked"},
+]}
+_BATTERY = {"id": "sw-1", "states": [
+    {"capability": "st.battery", "name": "level", "value": 50},
+]}
+
+
+async def test_duplicate_push_is_dropped(coordinator):
+    sw = make_fake_switch("sw-1")
+    coordinator.devices["sw-1"] = sw
+
+    await coordinator.update_push_data([_LOCKED])
+    await coordinator.update_push_data([_BATTERY])
+    await coordinator.update_push_data([_LOCKED])  # redelivery
+    await coordinator.update_push_data([_BATTERY])  # redelivery
+
+    assert sw.update_state_data.await_count == 2
+    assert coordinator.push_duplicates_suppressed == 2
+
+
+async def test_push_returning_to_earlier_state_is_applied(coordinator):
+    sw = make_fake_switch("sw-1")
+    coordinator.devices["sw-1"] = sw
+
+    for payload in (_LOCKED, _UNLOCKED, _LOCKED):
+        await coordinator.update_push_data([payload])
+
+    assert sw.update_state_data.await_count == 3
+    assert coordinator.push_duplicates_suppressed == 0
+
+
+async def test_duplicate_push_outside_window_is_applied(coordinator, freezer):
+    sw = make_fake_switch("sw-1")
+    coordinator.devices["sw-1"] = sw
+
+    await coordinator.update_push_data([_LOCKED])
+    freezer.tick(timedelta(seconds=61))
+    await coordinator.update_push_data([_LOCKED])
+
+    assert sw.update_state_data.await_count == 2
+
+
+# --- push queue ---
+
+from custom_components.u_tec.const import PUSH_QUEUE_SIZE
+
+
+def _switch_push(device_id: str, value: str) -> list[dict]:
+    return [{"id": device_id, "states": [
+        {"capability": "st.switch", "name": "switch", "value": value},
+    ]}]
+
+
+async def test_queued_pushes_are_applied_in_order(hass, coordinator):
+    sw = make_fake_switch("sw-1")
+    coordinator.devices["sw-1"] = sw
+
+    coordinator.enqueue_push_data(_switch_push("sw-1", "on"))
+    coordinator.enqueue_push_data(_switch_push("sw-1", "off"))
+    sw.update_state_data.assert_not_awaited()  # nothing applied inline
+    await hass.async_block_till_done()
+
+    assert [c.args[0] for c in sw.update_state_data.await_args_list] == [
+        _switch_push("sw-1", "on")[0], _switch_push("sw-1", "off")[0],
+    ]
+    assert coordinator.push_queue_metrics()["processed"] == 2
+    coordinator.async_stop_push_consumer()
+
+
+async def test_full_push_queue_drops_oldest(hass, coordinator):
+    devices = [f"sw-{i}" for i in range(PUSH_QUEUE_SIZE + 1)]
+    for device_id in devices:
+        coordinator.devices[device_id] = make_fake_switch(device_id)
+
+    for device_id in devices:
+        coordinator.enqueue_push_data(_switch_push(device_id, "on"))
+    await hass.async_block_till_done()
+
+    coordinator.devices["sw-0"].update_state_data.assert_not_awaited()
+    coordinator.devices[devices[-1]].update_state_data.assert_awaited_once()
+    metrics = coordinator.push_queue_metrics()
+    assert metrics["dropped"] == 1
+    assert metrics["depth"] == 0
+    coordinator.async_stop_push_consumer()
+
+
+# --- push/poll ordering ---
+
+
+async def test_poll_sent_before_push_does_not_regress_pushed_capability(
+    coordinator, mock_uhome_api,
+):
+    sw = make_fake_switch("sw-1")
+    coordinator.devices["sw-1"] = sw
+    pushed = {"id": "sw-1", "states": [
+        {"capability": "st.switch", "name": "switch", "value": "on"},
+    ]}
+
+    async def poll_overtaken_by_push(device_ids, _):
+        await coordinator.update_push_data([pushed])
+        return {"payload": {"devices": [{"id": "sw-1", "states": [
+            {"capability": "st.switch", "name": "switch", "value": "off"},
+            {"capability": "st.battery", "name": "level", "value": 50},
+        ]}]}}
+
+    mock_uhome_api.get_device_state.side_effect = poll_overtaken_by_push
+
+    await coordinator.async_fetch_device_states(["sw-1"])
+
+    assert sw.update_state_data.await_args.args[0] == {"id": "sw-1", "states": [
+        {"capability": "st.battery", "name": "level", "value": 50},
+        {"capability": "st.switch", "name": "switch", "value": "on"},
+    ]}
+
+
+async def test_poll_after_push_applies_every_capability(coordinator, mock_uhome_api):
+    sw = make_fake_switch("sw-1")
+    coordinator.devices["sw-1"] = sw
+    await coordinator.update_push_data(_switch_push("sw-1", "on"))
+    polled = _switch_push("sw-1", "off")[0]
+    mock_uhome_api.get_device_state.return_value = {"payload": {"devices": [polled]}}
+
+    await coordinator.async_fetch_device_states(["sw-1"])
+
+    sw.update_state_data.assert_awaited_with(polled)
+
+
+# --- partial push merge ---
+
+
+async def test_partial_push_is_merged_into_known_state(hass, coordinator):
+    from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+    from custom_components.u_tec.const import SIGNAL_DEVICE_UPDATE
+
+    sw = UhomeSwitch(_discovery("utec-switch", "sw-1"), coordinator.api)
+    coordinator.devices["sw-1"] = sw
+    await coordinator.update_push_data(_switch_push("sw-1", "on"))
+    device_signal = MagicMock()
+    unsub = async_dispatcher_connect(
+        hass, f"{SIGNAL_DEVICE_UPDATE}_sw-1", device_signal
+    )
+
+    await coordinator.update_push_data([_BATTERY])
+    await hass.async_block_till_done()
+
+    assert sw.is_on is True
+    assert sw.get_state_data() == {
+        "st.switch": {"switch": "on"},
+        "st.battery": {"level": 50},
+    }
+    # Entities are told what the push carried, not the merged state.
+    device_signal.assert_called_once_with({"st.battery": {"level": 50}})
+    unsub()
+
+
+# --- push statistics ---
+
+
+async def test_push_changing_state_records_lead_over_next_poll(coordinator, freezer):
+    coordinator.devices["sw-1"] = UhomeSwitch(
+        _discovery("utec-switch", "sw-1"), coordinator.api
+    )
+    coordinator.data = {"sw-1": {}}
+    coordinator.last_poll_started = dt_util.utcnow()
+    freezer.tick(timedelta(seconds=4))
+
+    await coordinator.update_push_data(_switch_push("sw-1", "on"))
+    await coordinator.update_push_data(_switch_push("sw-1", "on"))  # no change
+
+    assert coordinator.push_stats.lead["count"] == 1
+    assert coordinator.push_stats.lead["max"] == 6.0  # 10s interval - 4s
+    assert coordinator.push_stats.device_pushes["sw-1"] == 1  # duplicate dropped
+    assert coordinator.push_stats.device_duplicates["sw-1"] == 1
+    assert coordinator.push_stats.interarrival["count"] == 1
+
+
+async def test_push_signal_follows_the_recorded_lead(coordinator, hass):
+    coordinator.devices["sw-1"] = UhomeSwitch(
+        _discovery("utec-switch", "sw-1"), coordinator.api
+    )
+    coordinator.data = {"sw-1": {}}
+    coordinator.last_poll_started = dt_util.utcnow()
+    leads = []
+    unsub = async_dispatcher_connect(
+        hass,
+        f"{SIGNAL_PUSH_RECEIVED}_{coordinator.config_entry.entry_id}",
+        lambda: leads.append(coordinator.push_stats.lead["count"]),
+    )
+
+    await coordinator.update_push_data(_switch_push("sw-1", "on"))
+
+    # The last signal is what the lead sensor reads; it must see the new lead.
+    assert leads[-1] == 1
+    unsub()
+
+
+# --- optimistic ledger ---
+
+from custom_components.u_tec.switch import UhomeSwitchEntity
+
+
+async def test_push_confirms_optimistic_entry(coordinator):
+    coordinator.devices["sw-1"] = UhomeSwitch(
+        _discovery("utec-switch", "sw-1"), coordinator.api
+    )
+    coordinator.optimistic.update("sw-1", "st.switch", value=True)
+
+    await coordinator.update_push_data(_switch_push("sw-1", "off"))
+    assert coordinator.optimistic.get("sw-1", "st.switch").value is True
+
+    await coordinator.update_push_data(_switch_push("sw-1", "on"))
+    assert coordinator.optimistic.get("sw-1", "st.switch") is None
+
+
+async def test_optimistic_ledger_survives_restart(
+    hass, hass_storage, coordinator, mock_uhome_api,
+):
+    mock_uhome_api.discover_devices.return_value = {
+        "payload": {"devices": [_discovery("utec-switch", "S1")]}
+    }
+    mock_uhome_api.get_device_state.return_value = {"payload": {"devices": [_SWITCH_ON]}}
+    coordinator.data = {}
+    await coordinator.async_discover_devices()
+    set_at = dt_util.utcnow()
+    coordinator.optimistic.update("S1", "st.switch", value=False, set_at=set_at)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+
+    restored = UhomeDataUpdateCoordinator(
+        hass, mock_uhome_api, config_entry=coordinator.config_entry,
+    )
+    await restored.async_restore_from_cache()
+
+    entry = restored.optimistic.get("S1", "st.switch")
+    assert (entry.value, entry.set_at) == (False, set_at)
+
+
+# --- redundant command skipping ---
+
+
+async def test_redundant_command_skipped_only_when_enabled_and_fresh(
+    hass, coordinator, freezer
+):
+    coordinator.devices["sw-1"] = UhomeSwitch(
+        _discovery("utec-switch", "sw-1"), coordinator.api
+    )
+    await coordinator.update_push_data(_switch_push("sw-1", "on"))
+    assert not coordinator.skip_redundant_command("sw-1", "st.switch", True)
+
+    hass.config_entries.async_update_entry(
+        coordinator.config_entry,
+        options={"skip_redundant_commands": True, "confirmed_state_max_age": 30},
+    )
+    assert not coordinator.skip_redundant_command("sw-1", "st.switch", False)
+    assert coordinator.skip_redundant_command("sw-1", "st.switch", True)
+
+    coordinator.optimistic.update("sw-1", "st.switch", value=False)
+    assert not coordinator.skip_redundant_command("sw-1", "st.switch", True)
+    coordinator.optimistic.clear("sw-1")
+
+    coordinator._capability_received["sw-1"]["st.switch"] -= 31  # state aged out
+    assert not coordinator.skip_redundant_command("sw-1", "st.switch", True)
+    assert coordinator.commands_skipped == 1
+
+
+async def test_poll_confirming_a_no_op_command_clears_assumed_state(
+    hass, coordinator, mock_uhome_api,
+):
+    coordinator.devices["S1"] = UhomeSwitch(
+        _discovery("utec-switch", "S1"), coordinator.api
+    )
+    await coordinator.devices["S1"].update_state_data(_SWITCH_ON)
+    coordinator.data = coordinator._snapshot()
+    entity = UhomeSwitchEntity(coordinator, "S1")
+    entity.hass = hass
+    entity.async_write_ha_state = MagicMock()
+    # "Turn on" a switch that is already on: the poll changes nothing.
+    coordinator.optimistic.update("S1", "st.switch", value=True, set_at=dt_util.utcnow())
+    assert entity.assumed_state is True
+    mock_uhome_api.get_device_state.return_value = {"payload": {"devices": [_SWITCH_ON]}}
+
+    coordinator.async_set_updated_data(await coordinator._async_update_data())
+
+    assert coordinator.device_changed("S1") is True
+    entity._handle_coordinator_update()
+    assert entity.assumed_state is False
+    entity.async_write_ha_state.assert_called_once()
+    coordinator._async_unsub_refresh()
+
+
+async def test_no_skip_while_a_push_waits_in_the_coalescing_window(
+    hass, mock_uhome_api,
+):
+    entry = make_config_entry(options={
+        CONF_PUSH_COALESCE_WINDOW: 500,
+        "skip_redundant_commands": True,
+        "confirmed_state_max_age": 30,
+    })
+    entry.add_to_hass(hass)
+    coordinator = UhomeDataUpdateCoordinator(hass, mock_uhome_api, config_entry=entry)
+    coordinator.devices["sw-1"] = UhomeSwitch(
+        _discovery("utec-switch", "sw-1"), coordinator.api
+    )
+    await coordinator.async_fetch_device_states(["sw-1"])  # nothing fresh yet
+    await coordinator._async_apply_push("sw-1", _switch_push("sw-1", "on")[0])
+    assert coordinator.skip_redundant_command("sw-1", "st.switch", True)
+
+    # An "off" push is queued; the device still reads on until it applies.
+    await coordinator.update_push_data(_switch_push("sw-1", "off"))
+    assert coordinator.devices["sw-1"].is_on is True
+    assert not coordinator.skip_redundant_command("sw-1", "st.switch", True)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert coordinator.devices["sw-1"].is_on is False
+    assert coordinator.commands_skipped == 1
@@ -94,3 +94,182 @@ async def test_successful_push_resets_failure_counter(coordinator):
     assert coordinator.consecutive_update_failures == 0
     assert coordinator.poll_healthy_enough is True
     sw.update_state_data.assert_awaited_once()
+
+
+# --- chunked polling ---
+
+
+@pytest.fixture
+async def chunked_coordinator(hass, mock_uhome_api):
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    coord = UhomeDataUpdateCoordinator(
+        hass,
+        mock_uhome_api,
+        config_entry=entry,
+        scan_interval=10,
+        discovery_interval=300,
+        poll_chunk_size=2,
+        poll_concurrency=2,
+    )
+    for device_id in ("sw-1", "sw-2", "sw-3", "sw-4", "sw-5"):
+        sw = make_fake_switch(device_id)
+        sw.get_state_data = lambda: {}
+        coord.devices[device_id] = sw
+    return coord
+
+
+def _state_response(device_ids, _custom=None):
+    return {"payload": {"devices": [{"id": d, "states": []} for d in device_ids]}}
+
+
+async def test_poll_is_split_into_chunks(chunked_coordinator, mock_uhome_api):
+    mock_uhome_api.get_device_state.side_effect = _state_response
+
+    await chunked_coordinator._async_update_data()
+
+    requested = [c.args[0] for c in mock_uhome_api.get_device_state.await_args_list]
+    assert sorted(requested) == [["sw-1", "sw-2"], ["sw-3", "sw-4"], ["sw-5"]]
+    for device in chunked_coordinator.devices.values():
+        device.update_state_data.assert_awaited_once()
+
+
+async def test_failed_chunk_only_counts_against_its_devices(
+    chunked_coordinator, mock_uhome_api,
+):
+    async def _get_state(device_ids, _custom):
+        if "sw-3" in device_ids:
+            raise ApiError(500, "chunk down")
+        return _state_response(device_ids)
+
+    mock_uhome_api.get_device_state.side_effect = _get_state
+
+    for _ in range(MAX_CONSECUTIVE_UPDATE_FAILURES):
+        await chunked_coordinator._async_update_data()
+
+    assert chunked_coordinator.consecutive_update_failures == 0
+    assert chunked_coordinator.poll_healthy_enough is True
+    assert chunked_coordinator.device_poll_healthy("sw-3") is False
+    assert chunked_coordinator.device_poll_healthy("sw-4") is False
+    assert chunked_coordinator.device_poll_healthy("sw-1") is True
+    assert chunked_coordinator.device_poll_healthy("sw-5") is True
+    chunked_coordinator.devices["sw-3"].update_state_data.assert_not_awaited()
+
+    mock_uhome_api.get_device_state.side_effect = _state_response
+    await chunked_coordinator._async_update_data()
+    assert chunked_coordinator.device_poll_healthy("sw-3") is True
+
+
+async def test_every_chunk_failing_counts_as_poll_failure(
+    chunked_coordinator, mock_uhome_api,
+):
+    mock_uhome_api.get_device_state.side_effect = ApiError(500, "down")
+
+    with pytest.raises(UpdateFailed):
+        await chunked_coordinator._async_update_data()
+
+    assert chunked_coordinator.consecutive_update_failures == 1
+
+
+async def test_auth_failure_in_any_chunk_fails_the_poll(
+    chunked_coordinator, mock_uhome_api,
+):
+    async def _get_state(device_ids, _custom):
+        if "sw-5" in device_ids:
+            raise AuthenticationError("bad token")
+        return _state_response(device_ids)
+
+    mock_uhome_api.get_device_state.side_effect = _get_state
+
+    with pytest.raises(ConfigEntryAuthFailed):
+        await chunked_coordinator._async_update_data()
+
+    assert chunked_coordinator.poll_healthy_enough is False
+
+
+# --- poll circuit breaker ---
+
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.u_tec.const import (
+    BREAKER_CLOSED,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_OPEN,
+)
+
+
+async def _fail_polls(coordinator, count):
+    for _ in range(count):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+
+async def test_breaker_opens_after_threshold_with_jittered_backoff(
+    coordinator, mock_uhome_api,
+):
+    coordinator.devices["sw-1"] = make_fake_switch("sw-1")
+    mock_uhome_api.get_device_state.side_effect = TimeoutError()
+
+    await _fail_polls(coordinator, BREAKER_FAILURE_THRESHOLD - 1)
+    assert coordinator.breaker_state == BREAKER_CLOSED
+
+    await _fail_polls(coordinator, 1)
+    assert coordinator.breaker_state == BREAKER_OPEN
+    # First backoff: between half and all of twice the 10s base interval.
+    assert timedelta(seconds=10) <= coordinator.update_interval <= timedelta(seconds=20)
+    assert coordinator.breaker_next_attempt > dt_util.utcnow()
+
+
+async def test_open_breaker_short_circuits_until_next_attempt(
+    coordinator, mock_uhome_api,
+):
+    coordinator.devices["sw-1"] = make_fake_switch("sw-1")
+    mock_uhome_api.get_device_state.side_effect = ApiError(503, "down")
+    await _fail_polls(coordinator, BREAKER_FAILURE_THRESHOLD)
+    calls = mock_uhome_api.get_device_state.await_count
+
+    with pytest.raises(UpdateFailed, match="paused"):
+        await coordinator._async_update_data()
+
+    assert mock_uhome_api.get_device_state.await_count == calls
+
+
+async def test_half_open_probe_failure_backs_off_further(
+    coordinator, mock_uhome_api,
+):
+    coordinator.devices["sw-1"] = make_fake_switch("sw-1")
+    mock_uhome_api.get_device_state.side_effect = ApiError(503, "down")
+    await _fail_polls(coordinator, BREAKER_FAILURE_THRESHOLD)
+    coordinator.breaker_next_attempt = dt_util.utcnow()
+
+    await _fail_polls(coordinator, 1)
+
+    assert coordinator.breaker_state == BREAKER_OPEN
+    assert coordinator.breaker_failures == BREAKER_FAILURE_THRESHOLD + 1
+    assert timedelta(seconds=20) <= coordinator.update_interval <= timedelta(seconds=40)
+
+
+async def test_half_open_probe_success_closes_and_polls_fleet(
+    coordinator, mock_uhome_api,
+):
+    for device_id in ("sw-1", "sw-2"):
+        sw = make_fake_switch(device_id)
+        sw.get_state_data = lambda: {}
+        coordinator.devices[device_id] = sw
+    mock_uhome_api.get_device_state.side_effect = ApiError(503, "down")
+    await _fail_polls(coordinator, BREAKER_FAILURE_THRESHOLD)
+    coordinator.breaker_next_attempt = dt_util.utcnow()
+    mock_uhome_api.get_device_state.side_effect = None
+    mock_uhome_api.get_device_state.reset_mock()
+
+    await coordinator._async_update_data()
+
+    assert [c.args[0] for c in mock_uhome_api.get_device_state.await_args_list] == [
+        ["sw-1"],
+        ["sw-1", "sw-2"],
+    ]
+    assert coordinator.breaker_state == BREAKER_CLOSED
+    assert coordinator.breaker_failures == 0
+    assert coordinator.update_interval == coordinator.base_update_interval
@@ -0,0 +1,124 @@
+"""Tests for UhomeOptimisticEntity's optimistic expiry timer."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from utec_py.exceptions import DeviceError
+
+from custom_components.u_tec.const import OPTIMISTIC_TIMEOUT
+from custom_components.u_tec.entity import UhomeOptimisticEntity
+from custom_components.u_tec.governor import CommandSuperseded
+from custom_components.u_tec.optimistic import OptimisticLedger
+
+
+class _OptimisticEntity(UhomeOptimisticEntity):
+    """Minimal concrete entity owning the device's st.switch optimism."""
+
+    _optimistic_capability = "st.switch"
+
+    def __init__(self, coordinator) -> None:
+        super().__init__(coordinator)
+        self._device = MagicMock(device_id="dev-1")
+
+    @property
+    def _optimistic_set_at(self):
+        entry = self.coordinator.optimistic.get("dev-1", "st.switch")
+        return entry.set_at if entry else None
+
+
+@pytest.fixture
+def entity(hass):
+    coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    ent = _OptimisticEntity(coord)
+    ent.hass = hass
+    ent.entity_id = "switch.dev_1"
+    ent.async_write_ha_state = MagicMock()
+    return ent
+
+
+async def test_optimism_expires_on_timer_without_a_poll(entity, hass, freezer):
+    """Expiry must not wait for the next coordinator update."""
+    ledger = entity.coordinator.optimistic
+    ledger.update("dev-1", "st.switch", value=True, set_at=dt_util.utcnow())
+    entity._schedule_optimistic_expiry()
+
+    freezer.tick(OPTIMISTIC_TIMEOUT + timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert ledger.get("dev-1", "st.switch") is None
+    assert entity._optimistic_expiry is None
+    entity.async_write_ha_state.assert_called_once()
+
+
+async def test_restored_optimism_expires_after_the_remaining_time(
+    entity, hass, freezer,
+):
+    ledger = entity.coordinator.optimistic
+    set_at = dt_util.utcnow() - OPTIMISTIC_TIMEOUT + timedelta(seconds=2)
+    ledger.update("dev-1", "st.switch", value=True, set_at=set_at)
+    entity._schedule_optimistic_expiry()
+
+    freezer.tick(timedelta(seconds=3))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert ledger.get("dev-1", "st.switch") is None
+
+
+async def test_expiry_writes_state_when_optimism_already_gone(entity, hass, freezer):
+    """Optimism dropped without a write must not leave assumed_state stale."""
+    ledger = entity.coordinator.optimistic
+    ledger.update("dev-1", "st.switch", value=True, set_at=dt_util.utcnow())
+    entity._schedule_optimistic_expiry()
+    ledger.clear("dev-1")
+
+    freezer.tick(OPTIMISTIC_TIMEOUT + timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    entity.async_write_ha_state.assert_called_once()
+
+
+async def test_clear_cancels_timer_and_keeps_other_capabilities(entity):
+    ledger = entity.coordinator.optimistic
+    ledger.update("dev-1", "st.switch", value=True, set_at=dt_util.utcnow())
+    ledger.update("dev-1", "st.switchLevel", value=50)
+    entity._schedule_optimistic_expiry()
+
+    entity._clear_optimistic()
+
+    assert entity._optimistic_expiry is None
+    assert ledger.get("dev-1", "st.switch") is None
+    assert ledger.get("dev-1", "st.switchLevel") is not None
+
+
+def test_schedule_waits_until_added_to_hass():
+    coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    ent = _OptimisticEntity(coord)
+
+    ent._schedule_optimistic_expiry()
+
+    assert ent._optimistic_expiry is None
+
+
+async def _raise(err: Exception) -> None:
+    raise err
+
+
+async def test_send_reports_a_superseded_command(entity):
+    superseded = DeviceError("superseded")
+    superseded.__cause__ = CommandSuperseded()
+
+    assert await entity._async_send(_raise(superseded)) is False
+
+
+async def test_send_reraises_other_device_errors(entity):
+    with pytest.raises(DeviceError):
+        await entity._async_send(_raise(DeviceError("offline")))
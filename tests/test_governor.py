@@ -0,0 +1,241 @@
+"""Tests for the U-Tec API rate governor."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from utec_py.exceptions import ApiError
+
+from custom_components.u_tec.governor import (
+    LANE_BACKGROUND,
+    LANE_COMMAND,
+    LANE_CONFIRM,
+    LANE_POLL,
+    ApiGovernor,
+    CommandSuperseded,
+    GovernedUHomeApi,
+    api_lane,
+)
+
+
+async def test_burst_is_not_delayed():
+    governor = ApiGovernor(rate=1, burst=3)
+    for _ in range(3):
+        await governor.acquire(LANE_POLL)
+
+    lane = governor.metrics()["lanes"][LANE_POLL]
+    assert lane["requests"] == 3
+    assert lane["queued"] == 0
+    assert lane["max_wait"] == 0.0
+
+
+async def test_queued_requests_released_by_lane_priority():
+    governor = ApiGovernor(rate=100, burst=1)
+    await governor.acquire(LANE_POLL)  # drain the bucket
+    order = []
+
+    async def request(lane):
+        await governor.acquire(lane)
+        order.append(lane)
+
+    tasks = [
+        asyncio.create_task(request(lane))
+        for lane in (LANE_BACKGROUND, LANE_POLL, LANE_CONFIRM, LANE_COMMAND)
+    ]
+    await asyncio.sleep(0)
+    assert governor.queue_depth(LANE_BACKGROUND) == 1
+    await asyncio.gather(*tasks)
+
+    assert order == [LANE_COMMAND, LANE_CONFIRM, LANE_POLL, LANE_BACKGROUND]
+    metrics = governor.metrics()["lanes"]
+    assert metrics[LANE_BACKGROUND]["queued"] == 1
+    assert metrics[LANE_BACKGROUND]["max_wait"] >= metrics[LANE_COMMAND]["max_wait"]
+    assert metrics[LANE_COMMAND]["queue_depth"] == 0
+
+
+async def test_stop_cancels_queued_requests():
+    governor = ApiGovernor(rate=0.01, burst=1)
+    await governor.acquire(LANE_POLL)
+    waiter = asyncio.create_task(governor.acquire(LANE_BACKGROUND))
+    await asyncio.sleep(0)
+
+    governor.async_stop()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+async def test_governed_api_uses_method_lane_unless_overridden(mock_uhome_api):
+    api = GovernedUHomeApi(mock_uhome_api, ApiGovernor(rate=1, burst=10))
+
+    await api.send_command("lock-1", "st.lock", "lock", None)
+    await api.get_device_state(["lock-1"], None)
+    with api_lane(LANE_CONFIRM):
+        await api.get_device_state(["lock-1"], None)
+    await api.discover_devices()
+
+    lanes = api.governor.metrics()["lanes"]
+    assert lanes[LANE_COMMAND]["requests"] == 1
+    assert lanes[LANE_POLL]["requests"] == 1
+    assert lanes[LANE_CONFIRM]["requests"] == 1
+    assert lanes[LANE_BACKGROUND]["requests"] == 1
+    mock_uhome_api.send_command.assert_awaited_once_with(
+        "lock-1", "st.lock", "lock", None
+    )
+    # Methods the wrapper does not govern pass straight through.
+    assert api.async_create_request is mock_uhome_api.async_create_request
+
+
+async def test_commands_in_one_window_share_a_request(mock_uhome_api):
+    mock_uhome_api.send_commands = AsyncMock(return_value={
+        "payload": {"devices": [
+            {"id": "sw-1"},
+            {"id": "sw-2", "error": {"code": "DEVICE_OFFLINE", "message": "offline"}},
+        ]}
+    })
+    api = GovernedUHomeApi(
+        mock_uhome_api, ApiGovernor(rate=1, burst=10), command_batch_window=0.01
+    )
+
+    results = await asyncio.gather(
+        api.send_command("sw-1", "st.switch", "off", None),
+        api.send_command("sw-2", "st.switch", "off", None),
+        return_exceptions=True,
+    )
+
+    mock_uhome_api.send_command.assert_not_awaited()
+    assert mock_uhome_api.send_commands.await_args.args[0] == [
+        {"id": "sw-1", "command": {"capability": "st.switch", "name": "off"}},
+        {"id": "sw-2", "command": {"capability": "st.switch", "name": "off"}},
+    ]
+    assert isinstance(results[0], dict)
+    assert isinstance(results[1], ApiError)
+    assert api.governor.metrics()["lanes"][LANE_COMMAND]["requests"] == 1
+    assert (api.command_batches, api.batched_commands) == (1, 2)
+
+
+async def test_send_commands_is_one_command_request():
+    from custom_components.u_tec.api import UHomeCommandApi
+
+    client = UHomeCommandApi(MagicMock())
+    client._async_make_request = AsyncMock(return_value={"payload": {}})
+    commands = [
+        {"id": "sw-1", "command": {"capability": "st.switch", "name": "on"}},
+        {"id": "sw-2", "command": {"capability": "st.switch", "name": "on"}},
+    ]
+
+    await client.send_commands(commands)
+
+    request = client._async_make_request.await_args.kwargs["json"]
+    assert request["header"]["name"] == "Command"
+    assert request["payload"] == {"devices": commands}
+
+
+@pytest.mark.parametrize("window", [0, 0.01])
+async def test_single_command_error_envelope_raises(mock_uhome_api, window):
+    """A lone command fails on a per-device error just as a batched one does."""
+    mock_uhome_api.send_command.return_value = {"payload": {"devices": [
+        {"id": "lock-1", "error": {"code": "DEVICE_OFFLINE", "message": "offline"}},
+    ]}}
+    api = GovernedUHomeApi(
+        mock_uhome_api, ApiGovernor(rate=1, burst=10), command_batch_window=window
+    )
+
+    with pytest.raises(ApiError, match="DEVICE_OFFLINE"):
+        await api.send_command("lock-1", "st.lock", "lock", None)
+
+
+async def test_stop_cancels_the_batch_being_sent(mock_uhome_api):
+    sending = asyncio.Event()
+
+    async def send_commands(commands):
+        sending.set()
+        await asyncio.Event().wait()
+
+    mock_uhome_api.send_commands.side_effect = send_commands
+    api = GovernedUHomeApi(
+        mock_uhome_api, ApiGovernor(rate=1, burst=10), command_batch_window=0.01
+    )
+    calls = [
+        asyncio.create_task(api.send_command(device_id, "st.lock", "lock", None))
+        for device_id in ("lock-1", "lock-2")
+    ]
+    await sending.wait()
+    sender = api._command_sender
+
+    api.async_stop()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    await asyncio.sleep(0)
+    assert sender.cancelled()
+
+
+async def test_commands_for_one_device_keep_their_order(mock_uhome_api):
+    api = GovernedUHomeApi(
+        mock_uhome_api, ApiGovernor(rate=1, burst=10), command_batch_window=0.01
+    )
+
+    await asyncio.gather(
+        api.send_command("light-1", "st.switch", "on", None),
+        api.send_command("light-1", "st.brightness", "level", {"level": 40}),
+    )
+
+    assert [c.args[2] for c in mock_uhome_api.send_command.await_args_list] == [
+        "on", "level",
+    ]
+
+
+async def test_failed_batch_fails_every_caller(mock_uhome_api):
+    mock_uhome_api.send_commands = AsyncMock(side_effect=ApiError(500, "down"))
+    api = GovernedUHomeApi(
+        mock_uhome_api, ApiGovernor(rate=1, burst=10), command_batch_window=0.01
+    )
+
+    results = await asyncio.gather(
+        api.send_command("lock-1", "st.lock", "lock", None),
+        api.send_command("lock-2", "st.lock", "lock", None),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ApiError) for result in results)
+
+
+async def test_waiting_brightness_commands_are_superseded(mock_uhome_api):
+    release = asyncio.Event()
+    sent = []
+
+    async def send_command(device_id, capability, command, arguments):
+        sent.append(arguments["level"])
+        await release.wait()
+        return {"payload": {}}
+
+    mock_uhome_api.send_command.side_effect = send_command
+    api = GovernedUHomeApi(mock_uhome_api, ApiGovernor(rate=1, burst=10))
+
+    calls = [
+        asyncio.create_task(
+            api.send_command("light-1", "st.switchLevel", "setLevel", {"level": level})
+        )
+        for level in (10, 20, 30, 40)
+    ]
+    await asyncio.sleep(0)
+    assert sent == [10]  # 20 and 30 queued, then replaced by 40
+    release.set()
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert sent == [10, 40]
+    assert results[0] == results[3] == {"payload": {}}
+    assert all(isinstance(r, CommandSuperseded) for r in results[1:3])
+    assert api.superseded_commands == 2
+
+
+async def test_switch_commands_are_never_superseded(mock_uhome_api):
+    api = GovernedUHomeApi(mock_uhome_api, ApiGovernor(rate=1, burst=10))
+
+    await asyncio.gather(
+        api.send_command("light-1", "st.switch", "on", None),
+        api.send_command("light-1", "st.switch", "off", None),
+    )
+
+    assert mock_uhome_api.send_command.await_count == 2
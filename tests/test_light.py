@@ -14,6 +14,7 @@ from custom_components.u_tec.const import (
     SIGNAL_DEVICE_UPDATE,
 )
 from custom_components.u_tec.light import UhomeLightEntity
+from custom_components.u_tec.optimistic import OptimisticLedger
 from tests.common import make_config_entry, make_fake_light
 
 
@@ -23,6 +24,8 @@ def coord_with_light(hass):
     entry.add_to_hass(hass)
     light = make_fake_light("light-1", is_on=False)
     coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"light-1": light}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -71,6 +74,21 @@ async def test_async_turn_off_sets_optimistic_and_calls_device(coord_with_light,
     assert ent._optimistic_is_on is False
 
 
+async def test_skipped_turn_on_still_writes_state(coord_with_light, hass):
+    coord, light = coord_with_light
+    coord.skip_redundant_command.return_value = True
+    light.is_on = True
+    ent = UhomeLightEntity(coord, "light-1")
+    ent.hass = hass
+    ent.entity_id = "light.fake_light"
+    ent.async_write_ha_state = MagicMock()
+
+    await ent.async_turn_on()
+
+    light.turn_on.assert_not_awaited()
+    ent.async_write_ha_state.assert_called_once()
+
+
 async def test_turn_on_with_brightness_sets_pending(coord_with_light, hass):
     coord, light = coord_with_light
     ent = UhomeLightEntity(coord, "light-1")
@@ -97,6 +115,7 @@ def test_coordinator_update_clears_optimistic_when_device_confirms(coord_with_li
     ent.async_write_ha_state = MagicMock()
     light.is_on = True  # device now reports the same
 
+    coord.optimistic.confirm("light-1", light)  # as the coordinator does
     ent._handle_coordinator_update()
 
     assert ent._optimistic_is_on is None
@@ -122,6 +141,7 @@ def test_brightness_pending_clears_only_on_exact_match(coord_with_light):
     ent.async_write_ha_state = MagicMock()
     light.brightness = 80  # device caught up
 
+    coord.optimistic.confirm("light-1", light)  # as the coordinator does
     ent._handle_coordinator_update()
 
     assert ent._optimistic_brightness is None
@@ -157,6 +177,8 @@ def test_assumed_state_false_when_optimistic_disabled(hass):
     entry.add_to_hass(hass)
     light = make_fake_light("light-1")
     coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"light-1": light}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -214,6 +236,10 @@ async def test_setup_entry_filters_non_light_devices(hass):
     switch = make_fake_switch("sw-1")
 
     coord = MagicMock()
+
+    coord.optimistic = OptimisticLedger()
+
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"light-1": light, "sw-1": switch}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -324,6 +350,7 @@ def test_coordinator_update_clears_optimistic_is_on_on_match(coord_with_light):
     ent.async_write_ha_state = MagicMock()
     light.is_on = False  # device now confirms off
 
+    coord.optimistic.confirm("light-1", light)  # as the coordinator does
     ent._handle_coordinator_update()
 
     assert ent._optimistic_is_on is None
@@ -341,6 +368,7 @@ def test_coordinator_update_clears_brightness_on_exact_match(coord_with_light):
     ent.async_write_ha_state = MagicMock()
     light.brightness = 70  # device confirmed the 70 we sent
 
+    coord.optimistic.confirm("light-1", light)  # as the coordinator does
     ent._handle_coordinator_update()
 
     assert ent._optimistic_brightness is None
@@ -407,6 +435,28 @@ async def test_turn_on_device_error_logs_and_raises(coord_with_light, hass):
     assert ent._optimistic_is_on is None
 
 
+async def test_superseded_turn_on_records_nothing(coord_with_light, hass):
+    """A brightness command replaced before it was sent is not a success."""
+    from utec_py.exceptions import DeviceError
+
+    from custom_components.u_tec.governor import CommandSuperseded
+
+    coord, light = coord_with_light
+    light.turn_on.side_effect = DeviceError("superseded")
+    light.turn_on.side_effect.__cause__ = CommandSuperseded()
+    ent = UhomeLightEntity(coord, "light-1")
+    ent.hass = hass
+    ent.entity_id = "light.fake_light"
+    ent.async_write_ha_state = MagicMock()
+
+    await ent.async_turn_on(brightness=128)
+
+    assert ent._optimistic_is_on is None
+    assert ent._optimistic_brightness is None
+    coord.async_confirm_device_state.assert_not_called()
+    ent.async_write_ha_state.assert_not_called()
+
+
 # --- turn_on with optimistic disabled skips optimistic writes ---
 
 
@@ -416,6 +466,8 @@ async def test_turn_on_no_optimistic_write_when_disabled(hass):
     entry.add_to_hass(hass)
     light = make_fake_light("light-1")
     coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"light-1": light}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -594,6 +646,7 @@ def test_light_brightness_confirms_normally(coord_with_light):
     light.brightness = 80  # device reached target
     ent._optimistic_set_at = dt_util.utcnow()
 
+    coord.optimistic.confirm("light-1", light)  # as the coordinator does
     ent._handle_coordinator_update()
     assert ent._optimistic_brightness is None
     assert ent._pending_brightness_utec is None
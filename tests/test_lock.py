@@ -16,12 +16,14 @@ from custom_components.u_tec.const import (
     DOMAIN,
     OPTIMISTIC_TIMEOUT,
     SIGNAL_DEVICE_UPDATE,
+    SIGNAL_NEW_DEVICE,
 )
 from custom_components.u_tec.lock import (
     PASSAGE_MODE,
     UhomeLockEntity,
     async_setup_entry,
 )
+from custom_components.u_tec.optimistic import OptimisticLedger
 from tests.common import make_config_entry, make_fake_lock, make_fake_switch
 
 
@@ -31,6 +33,8 @@ def coord_with_lock(hass):
     entry.add_to_hass(hass)
     lock = make_fake_lock("lock-1", is_locked=True)
     coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"lock-1": lock}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -112,6 +116,10 @@ async def test_setup_entry_excludes_non_lock_devices(hass):
     switch = make_fake_switch("sw-1")
 
     coord = MagicMock()
+
+    coord.optimistic = OptimisticLedger()
+
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"lock-1": lock, "sw-1": switch}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -129,23 +137,41 @@ async def test_setup_entry_excludes_non_lock_devices(hass):
     assert added[0]._device.device_id == "lock-1"
 
 
+async def test_setup_entry_adds_locks_from_new_device_signal(hass):
+    """A later discovery's batched signal adds entities for just those ids."""
+    from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
+    coord.devices = {"lock-1": make_fake_lock("lock-1")}
+    coord.config_entry = entry
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coord}
+    added = []
+
+    await async_setup_entry(hass, entry, lambda ents: added.extend(list(ents)))
+    coord.devices["lock-2"] = make_fake_lock("lock-2")
+    coord.devices["sw-1"] = make_fake_switch("sw-1")
+    async_dispatcher_send(
+        hass, f"{SIGNAL_NEW_DEVICE}_{entry.entry_id}", ["lock-2", "sw-1"]
+    )
+    await hass.async_block_till_done()
+
+    assert [ent._device.device_id for ent in added] == ["lock-1", "lock-2"]
+
+
 # ---------------------------------------------------------------------------
 # available: device offline OR consecutive poll failures threshold
 # ---------------------------------------------------------------------------
 
-def test_available_false_when_consecutive_polls_failed(coord_with_lock):
+def test_available_false_when_coordinator_says_so(coord_with_lock):
     coord, lock = coord_with_lock
-    coord.poll_healthy_enough = False
-    coord.last_update_success = False
-    ent = UhomeLockEntity(coord, "lock-1")
-    assert ent.available is False
-
-
-def test_available_false_when_device_unavailable(coord_with_lock):
-    coord, lock = coord_with_lock
-    lock.available = False
+    coord.device_available.return_value = False
     ent = UhomeLockEntity(coord, "lock-1")
     assert ent.available is False
+    coord.device_available.assert_called_with("lock-1")
 
 
 # ---------------------------------------------------------------------------
@@ -206,6 +232,7 @@ def test_handle_coordinator_update_clears_optimistic_when_confirmed(coord_with_l
     ent.async_write_ha_state = MagicMock()
     ent._optimistic_is_locked = True
 
+    coord.optimistic.confirm("lock-1", lock)  # as the coordinator does
     ent._handle_coordinator_update()
 
     assert ent._optimistic_is_locked is None
@@ -220,6 +247,7 @@ def test_handle_coordinator_update_clears_optimistic_unlocked_confirmed(coord_wi
     ent.async_write_ha_state = MagicMock()
     ent._optimistic_is_locked = False
 
+    coord.optimistic.confirm("lock-1", lock)  # as the coordinator does
     ent._handle_coordinator_update()
 
     assert ent._optimistic_is_locked is None
@@ -460,6 +488,7 @@ def test_confirm_clears_stamp_so_next_command_gets_fresh_clock(coord_with_lock):
     ent._optimistic_set_at = dt_util.utcnow()
     lock.is_locked = True  # device confirms
 
+    coord.optimistic.confirm("lock-1", lock)  # as the coordinator does
     ent._handle_coordinator_update()
 
     assert ent._optimistic_is_locked is None
@@ -484,6 +513,7 @@ async def test_optimistic_clears_once_device_confirms(coord_with_lock, hass):
     assert ent.assumed_state is True
 
     lock.is_locked = True  # device catches up
+    coord.optimistic.confirm("lock-1", lock)  # as the coordinator does
     ent._handle_coordinator_update()
 
     assert ent._optimistic_is_locked is None
@@ -550,6 +580,24 @@ def test_missing_stamp_starts_the_clock_rather_than_clearing(coord_with_lock):
     assert ent._optimistic_is_locked is None
 
 
+async def test_confirmation_cancels_expiry_timer(coord_with_lock, hass):
+    coord, lock = coord_with_lock
+    lock.is_locked = False
+    ent = UhomeLockEntity(coord, "lock-1")
+    ent.hass = hass
+    ent.entity_id = "lock.fake_lock"
+    ent.async_write_ha_state = MagicMock()
+
+    await ent.async_lock()
+    assert ent._optimistic_expiry is not None
+
+    lock.is_locked = True
+    coord.optimistic.confirm("lock-1", lock)  # as the coordinator does
+    ent._handle_coordinator_update()
+
+    assert ent._optimistic_expiry is None
+
+
 # ---------------------------------------------------------------------------
 # Passage mode ignores lock commands, so optimism there is always wrong
 # ---------------------------------------------------------------------------
@@ -713,3 +761,37 @@ async def test_passage_mode_lock_emits_real_state_event(coord_with_lock, hass):
     matching = [e for e in events if e.data["entity_id"] == "lock.fake_lock"]
     assert matching, "an identical state must still emit state_changed when forced"
     assert matching[0].data["new_state"].state == before.state
+
+
+async def test_redundant_lock_is_skipped(coord_with_lock, hass):
+    coord, lock = coord_with_lock
+    coord.skip_redundant_command.return_value = True
+    lock.lock_state = "Locked"
+    ent = UhomeLockEntity(coord, "lock-1")
+    ent.hass = hass
+    forced = []
+    ent.async_write_ha_state = MagicMock(
+        side_effect=lambda: forced.append(ent.force_update)
+    )
+
+    await ent.async_lock()
+
+    lock.lock.assert_not_awaited()
+    coord.skip_redundant_command.assert_called_once_with("lock-1", "st.lock", True)
+    # A skipped lock still emits an event, or HomeKit hangs on "Locking...".
+    assert forced == [True]
+
+
+async def test_passage_mode_lock_is_never_skipped(coord_with_lock, hass):
+    coord, lock = coord_with_lock
+    coord.skip_redundant_command.return_value = True
+    lock.lock_mode = PASSAGE_MODE
+    ent = UhomeLockEntity(coord, "lock-1")
+    ent.hass = hass
+    ent.entity_id = "lock.fake_lock"
+    ent.async_write_ha_state = MagicMock()
+
+    await ent.async_lock()
+
+    lock.lock.assert_awaited_once()
+    coord.skip_redundant_command.assert_not_called()
@@ -1,4 +1,7 @@
-"""Unit tests for the optimistic-update resolver."""
+"""Unit tests for the optimistic-update resolver and ledger."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
 
 import pytest
 
@@ -7,6 +10,8 @@ from custom_components.u_tec.optimistic import (
     CONF_OPTIMISTIC_LOCKS,
     CONF_OPTIMISTIC_SWITCHES,
     DEFAULT_OPTIMISTIC,
+    OptimisticEntry,
+    OptimisticLedger,
     is_optimistic_enabled,
     push_asserts_state,
 )
@@ -73,3 +78,41 @@ def test_different_keys_resolve_independently():
     assert is_optimistic_enabled(options, CONF_OPTIMISTIC_SWITCHES, "dev-1") is False
     assert is_optimistic_enabled(options, CONF_OPTIMISTIC_LOCKS, "dev-1") is True
     assert is_optimistic_enabled(options, CONF_OPTIMISTIC_LOCKS, "dev-2") is False
+
+
+def test_ledger_confirms_only_matching_entries():
+    changes = []
+    ledger = OptimisticLedger(on_change=lambda: changes.append(1))
+    ledger.update("light-1", "st.switch", value=True)
+    ledger.update("light-1", "st.switchLevel", value=80, display=204)
+    device = SimpleNamespace(is_on=True, brightness=40)
+
+    assert ledger.confirm("light-1", device) == ["st.switch"]
+    assert ledger.get("light-1", "st.switch") is None
+    assert ledger.get("light-1", "st.switchLevel").display == 204
+    assert len(ledger) == 1
+    assert len(changes) == 3
+
+
+def test_ledger_drops_entry_with_nothing_left_to_show():
+    ledger = OptimisticLedger()
+    ledger.update("light-1", "st.switchLevel", value=80, display=204)
+
+    ledger.update("light-1", "st.switchLevel", value=None, display=None)
+
+    assert ledger.entries("light-1") == {}
+
+
+def test_ledger_round_trips_through_storage_form():
+    ledger = OptimisticLedger()
+    set_at = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    ledger.update("lock-1", "st.lock", value=False, set_at=set_at)
+    ledger.update("gone-1", "st.lock", value=True)
+
+    restored = OptimisticLedger()
+    restored.load(ledger.as_dict(), {"lock-1"})
+
+    assert restored.get("lock-1", "st.lock") == OptimisticEntry(
+        value=False, set_at=set_at
+    )
+    assert restored.get("gone-1", "st.lock") is None
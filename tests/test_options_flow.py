@@ -56,6 +56,23 @@ async def test_init_step_routes_to_update_push(hass):
     assert result["step_id"] == "update_push"
 
 
+async def test_update_push_saves_coalesce_window(hass):
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"next_step_id": "update_push"},
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={"push_enabled": False, "push_coalesce_window": 300.0},
+    )
+
+    assert result["type"] == "create_entry"
+    assert entry.options["push_coalesce_window"] == 300
+
+
 # --- Optimistic picker: all-mode ---
 
 
@@ -98,6 +115,30 @@ async def test_optimistic_all_for_every_type(hass):
     assert result["data"][CONF_OPTIMISTIC_LOCKS] is True
 
 
+async def test_optimistic_updates_saves_redundant_command_skipping(hass):
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"next_step_id": "optimistic_updates"},
+    )
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            "lights_mode": "all",
+            "switches_mode": "all",
+            "locks_mode": "all",
+            "skip_redundant_commands": True,
+            "confirmed_state_max_age": 15.0,
+        },
+    )
+
+    assert result["type"] == "create_entry"
+    assert entry.options["skip_redundant_commands"] is True
+    assert entry.options["confirmed_state_max_age"] == 15
+
+
 # --- Optimistic picker: custom-mode ---
 
 
@@ -0,0 +1,46 @@
+"""Unit tests for the rolling push statistics."""
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.u_tec.push_stats import PushStats
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_empty_stats_have_no_figures():
+    stats = PushStats()
+    assert stats.interarrival == {
+        "count": 0, "mean": None, "median": None, "p95": None, "max": None,
+    }
+
+
+def test_interarrival_between_consecutive_pushes():
+    stats = PushStats()
+    for seconds in (0, 2, 6, 16):
+        stats.record_push(_T0 + timedelta(seconds=seconds))
+
+    assert stats.interarrival == {
+        "count": 3, "mean": 5.33, "median": 4.0, "p95": 10.0, "max": 10.0,
+    }
+
+
+def test_series_are_bounded():
+    stats = PushStats(samples=2)
+    for lead in (1, 2, 3):
+        stats.record_lead(lead)
+
+    assert stats.lead["count"] == 2
+    assert stats.lead["max"] == 3
+
+
+def test_device_counts_and_forget():
+    stats = PushStats()
+    stats.record_device_push("lock-1")
+    stats.record_device_push("lock-1")
+    stats.record_device_push("sw-1")
+    stats.record_device_duplicate("lock-1")
+    stats.record_device_duplicate("sw-1")
+    stats.forget_device("sw-1")
+
+    assert stats.as_dict()["pushes_per_device"] == {"lock-1": 2}
+    assert stats.as_dict()["duplicates_per_device"] == {"lock-1": 1}
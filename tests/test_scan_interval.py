@@ -39,3 +39,190 @@ def test_resolve_clamps_yaml_below_minimum(hass):
 def test_resolve_clamps_above_maximum(hass):
     entry = make_config_entry(options={CONF_SCAN_INTERVAL: 99999})
     assert _resolve_scan_interval(hass, entry) == MAX_SCAN_INTERVAL
+
+
+# --- push-aware adaptive polling ---
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.u_tec.const import (
+    CONF_PUSH_ENABLED,
+    POLL_REASON_NO_PUSH,
+    POLL_REASON_PARTIAL_PUSH,
+    POLL_REASON_PUSH_DISABLED,
+    POLL_REASON_PUSH_HEALTHY,
+    POLL_REASON_PUSH_STALE,
+    PUSH_STALE_AFTER,
+)
+from custom_components.u_tec.coordinator import UhomeDataUpdateCoordinator
+from tests.common import make_fake_switch
+
+
+@pytest.fixture
+def adaptive_coordinator(hass, mock_uhome_api):
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    coord = UhomeDataUpdateCoordinator(
+        hass,
+        mock_uhome_api,
+        config_entry=entry,
+        scan_interval=10,
+        discovery_interval=300,
+        max_poll_interval=60,
+    )
+    sw = make_fake_switch("sw-1")
+    sw.get_state_data = lambda: {}
+    coord.devices["sw-1"] = sw
+    return coord
+
+
+async def test_interval_stays_at_base_without_push(adaptive_coordinator):
+    await adaptive_coordinator._async_update_data()
+    assert adaptive_coordinator.effective_scan_interval == 10
+    assert adaptive_coordinator.poll_interval_reason == POLL_REASON_NO_PUSH
+
+
+async def test_interval_stretches_to_ceiling_while_push_healthy(adaptive_coordinator):
+    adaptive_coordinator.last_push_received = dt_util.utcnow()
+
+    seen = []
+    for _ in range(4):
+        await adaptive_coordinator._async_update_data()
+        seen.append(adaptive_coordinator.effective_scan_interval)
+
+    assert seen == [20, 40, 60, 60]
+    assert adaptive_coordinator.poll_interval_reason == POLL_REASON_PUSH_HEALTHY
+
+
+async def test_interval_snaps_back_when_push_goes_stale(adaptive_coordinator):
+    adaptive_coordinator.update_interval = timedelta(seconds=60)
+    adaptive_coordinator.last_push_received = dt_util.utcnow() - PUSH_STALE_AFTER
+
+    await adaptive_coordinator._async_update_data()
+
+    assert adaptive_coordinator.effective_scan_interval == 10
+    assert adaptive_coordinator.poll_interval_reason == POLL_REASON_PUSH_STALE
+
+
+async def test_stretch_never_outlives_push_freshness(adaptive_coordinator):
+    """The next poll must land no later than the moment push turns stale."""
+    adaptive_coordinator.max_update_interval = timedelta(hours=1)
+    adaptive_coordinator.update_interval = timedelta(minutes=30)
+    adaptive_coordinator.last_push_received = (
+        dt_util.utcnow() - PUSH_STALE_AFTER + timedelta(seconds=30)
+    )
+
+    await adaptive_coordinator._async_update_data()
+
+    assert adaptive_coordinator.effective_scan_interval <= 30
+
+
+async def test_interval_stays_fast_for_devices_outside_push(adaptive_coordinator):
+    other = make_fake_switch("sw-2")
+    other.get_state_data = lambda: {}
+    adaptive_coordinator.devices["sw-2"] = other
+    adaptive_coordinator.push_devices = ["sw-1"]
+    adaptive_coordinator.last_push_received = dt_util.utcnow()
+
+    await adaptive_coordinator._async_update_data()
+
+    assert adaptive_coordinator.effective_scan_interval == 10
+    assert adaptive_coordinator.poll_interval_reason == POLL_REASON_PARTIAL_PUSH
+
+
+async def test_interval_stays_at_base_when_push_disabled(hass, mock_uhome_api):
+    entry = make_config_entry(options={CONF_PUSH_ENABLED: False})
+    entry.add_to_hass(hass)
+    coord = UhomeDataUpdateCoordinator(
+        hass, mock_uhome_api, config_entry=entry, scan_interval=10, max_poll_interval=60,
+    )
+    sw = make_fake_switch("sw-1")
+    sw.get_state_data = lambda: {}
+    coord.devices["sw-1"] = sw
+    coord.last_push_received = dt_util.utcnow()
+
+    await coord._async_update_data()
+
+    assert coord.effective_scan_interval == 10
+    assert coord.poll_interval_reason == POLL_REASON_PUSH_DISABLED
+
+
+async def test_set_scan_interval_resets_to_base(adaptive_coordinator):
+    adaptive_coordinator.update_interval = timedelta(seconds=60)
+
+    adaptive_coordinator.set_scan_interval(30, 600)
+
+    assert adaptive_coordinator.effective_scan_interval == 30
+    assert adaptive_coordinator.max_update_interval == timedelta(seconds=600)
+
+
+# --- push-aware polling (skip recently-pushed devices) ---
+
+from custom_components.u_tec.const import (
+    CONF_PUSH_AWARE_POLLING,
+    PUSH_FALLBACK_POLL_INTERVAL,
+)
+
+
+@pytest.fixture
+def push_aware_coordinator(hass, mock_uhome_api):
+    entry = make_config_entry(options={CONF_PUSH_AWARE_POLLING: True})
+    entry.add_to_hass(hass)
+    coord = UhomeDataUpdateCoordinator(
+        hass, mock_uhome_api, config_entry=entry, scan_interval=10,
+    )
+    for device_id in ("sw-1", "sw-2"):
+        sw = make_fake_switch(device_id)
+        sw.get_state_data = lambda: {}
+        coord.devices[device_id] = sw
+    return coord
+
+
+async def test_push_aware_poll_skips_recently_pushed_device(
+    push_aware_coordinator, mock_uhome_api,
+):
+    now = dt_util.utcnow()
+    push_aware_coordinator.device_push_received["sw-1"] = now
+    push_aware_coordinator.device_polled_at["sw-1"] = now
+
+    await push_aware_coordinator._async_update_data()
+
+    mock_uhome_api.get_device_state.assert_awaited_once_with(["sw-2"], None)
+
+
+async def test_push_aware_poll_rechecks_pushed_device_on_fallback(
+    push_aware_coordinator, mock_uhome_api,
+):
+    now = dt_util.utcnow()
+    push_aware_coordinator.device_push_received["sw-1"] = now
+    push_aware_coordinator.device_polled_at["sw-1"] = now - PUSH_FALLBACK_POLL_INTERVAL
+
+    await push_aware_coordinator._async_update_data()
+
+    mock_uhome_api.get_device_state.assert_awaited_once_with(["sw-1", "sw-2"], None)
+
+
+async def test_push_aware_poll_skips_api_when_everything_pushed(
+    push_aware_coordinator, mock_uhome_api,
+):
+    now = dt_util.utcnow()
+    for device_id in ("sw-1", "sw-2"):
+        push_aware_coordinator.device_push_received[device_id] = now
+        push_aware_coordinator.device_polled_at[device_id] = now
+
+    result = await push_aware_coordinator._async_update_data()
+
+    mock_uhome_api.get_device_state.assert_not_called()
+    assert set(result) == {"sw-1", "sw-2"}
+
+
+async def test_default_poll_includes_pushed_devices(adaptive_coordinator, mock_uhome_api):
+    adaptive_coordinator.device_push_received["sw-1"] = dt_util.utcnow()
+    adaptive_coordinator.device_polled_at["sw-1"] = dt_util.utcnow()
+
+    await adaptive_coordinator._async_update_data()
+
+    mock_uhome_api.get_device_state.assert_awaited_once_with(["sw-1"], None)
@@ -34,10 +34,11 @@ def test_battery_sensor_unique_id(coord_with_locks):
     ent = UhomeBatterySensorEntity(coord, "lock-1")
     assert "lock-1" in ent.unique_id
     assert "battery" in ent.unique_id.lower()
+    assert ent.name == "Fake Lock Battery"
 
 
 async def test_async_setup_entry_adds_one_per_lock(hass, coord_with_locks):
-    """Initial setup should add battery sensors for all locks plus one last-push sensor."""
+    """Initial setup adds battery sensors for all locks plus the service sensors."""
     from custom_components.u_tec.sensor import UhomeBatterySensorEntity, async_setup_entry
 
     coord, entry = coord_with_locks
@@ -50,7 +51,7 @@ async def test_async_setup_entry_adds_one_per_lock(hass, coord_with_locks):
     await async_setup_entry(hass, entry, _add)
     battery_sensors = [e for e in added if isinstance(e, UhomeBatterySensorEntity)]
     assert len(battery_sensors) == 2
-    assert len(added) == 3  # 2 battery + 1 last-push
+    assert len(added) == 6  # 2 battery + last-push + poll circuit + push stats
     assert coord.added_sensor_entities == {"u_tec_battery_lock-1", "u_tec_battery_lock-2"}
 
 
@@ -72,7 +73,7 @@ async def test_async_setup_entry_dispatch_adds_new_devices(hass, coord_with_lock
 
     # Add a new lock, then dispatch
     coord.devices["lock-3"] = make_fake_lock("lock-3", battery_level=50)
-    async_dispatcher_send(hass, SIGNAL_NEW_DEVICE)
+    async_dispatcher_send(hass, f"{SIGNAL_NEW_DEVICE}_{entry.entry_id}", ["lock-3"])
     await hass.async_block_till_done()
 
     assert len(added) == initial_count + 1
@@ -94,7 +95,9 @@ async def test_dispatch_does_not_double_add(hass, coord_with_locks):
     await async_setup_entry(hass, entry, _add)
     initial = len(added)
 
-    async_dispatcher_send(hass, SIGNAL_NEW_DEVICE)
+    async_dispatcher_send(
+        hass, f"{SIGNAL_NEW_DEVICE}_{entry.entry_id}", ["lock-1", "lock-2"]
+    )
     await hass.async_block_till_done()
 
     # Same devices -> no additions
@@ -130,3 +133,45 @@ async def test_last_push_sensor_native_value_and_class(hass, coord_with_locks):
     stamp = dt_util.utcnow()
     coord.last_push_received = stamp
     assert sensor.native_value == stamp
+
+
+def test_poll_circuit_sensor_reports_breaker(coord_with_locks):
+    from datetime import datetime, timezone
+
+    from custom_components.u_tec.sensor import UhomePollCircuitSensor
+
+    coord, _ = coord_with_locks
+    coord.last_update_success = False
+    coord.breaker_state = "open"
+    coord.breaker_failures = 4
+    coord.breaker_next_attempt = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    sensor = UhomePollCircuitSensor(coord)
+
+    assert sensor.available is True
+    assert sensor.native_value == "open"
+    assert sensor.extra_state_attributes == {
+        "consecutive_failures": 4,
+        "next_attempt": "2026-01-01T00:00:00+00:00",
+    }
+
+
+def test_push_interval_sensor_reports_median_without_device_counts(coord_with_locks):
+    from datetime import timedelta
+
+    from homeassistant.util import dt as dt_util
+
+    from custom_components.u_tec.push_stats import PushStats
+    from custom_components.u_tec.sensor import UhomePushIntervalSensor
+
+    coord, _ = coord_with_locks
+    coord.push_stats = PushStats()
+    start = dt_util.utcnow()
+    for seconds in (0, 4, 10):
+        coord.push_stats.record_push(start + timedelta(seconds=seconds))
+    coord.push_stats.record_device_push("lock-1")
+    sensor = UhomePushIntervalSensor(coord)
+
+    assert sensor.native_value == 5.0
+    assert sensor.extra_state_attributes["samples"] == 2
+    # Unbounded per-device counts stay in diagnostics.
+    assert "pushes_per_device" not in sensor.extra_state_attributes
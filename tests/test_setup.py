@@ -17,8 +17,8 @@ from tests.common import make_config_entry
 
 @pytest.fixture
 def patched_uhomeapi():
-    """Replace UHomeApi with a mock for setup-entry tests."""
-    with patch("custom_components.u_tec.UHomeApi") as mock_cls:
+    """Replace UHomeCommandApi with a mock for setup-entry tests."""
+    with patch("custom_components.u_tec.UHomeCommandApi") as mock_cls:
         instance = MagicMock()
         instance.discover_devices = AsyncMock(return_value={"payload": {"devices": []}})
         instance.get_device_state = AsyncMock(return_value={"payload": {"devices": []}})
@@ -100,6 +100,28 @@ async def test_setup_entry_registers_webhook_when_push_enabled(
     mock_register.assert_awaited_once()
 
 
+async def test_setup_entry_from_cache_reconciles_in_background(
+    hass, patched_uhomeapi,
+):
+    """A warm cache skips the blocking discovery/first refresh at startup."""
+    entry = make_config_entry(options={CONF_PUSH_ENABLED: False})
+    entry.add_to_hass(hass)
+    coordinator_cls = "custom_components.u_tec.coordinator.UhomeDataUpdateCoordinator"
+
+    with _patched_setup_env(hass), patch(
+        f"{coordinator_cls}.async_restore_from_cache",
+        new=AsyncMock(return_value=True),
+    ), patch(
+        f"{coordinator_cls}.async_reconcile_cache",
+        new=AsyncMock(return_value=None),
+    ) as mock_reconcile:
+        assert await async_setup_entry(hass, entry) is True
+        patched_uhomeapi.discover_devices.assert_not_awaited()
+        await hass.async_block_till_done()
+
+    mock_reconcile.assert_awaited_once()
+
+
 async def test_async_update_options_toggles_webhook_on(hass, patched_uhomeapi):
     entry = make_config_entry(options={CONF_PUSH_ENABLED: False})
     entry.add_to_hass(hass)
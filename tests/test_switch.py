@@ -13,6 +13,7 @@ from custom_components.u_tec.const import (
     OPTIMISTIC_TIMEOUT,
     SIGNAL_DEVICE_UPDATE,
 )
+from custom_components.u_tec.optimistic import OptimisticLedger
 from custom_components.u_tec.switch import UhomeSwitchEntity
 from tests.common import make_config_entry, make_fake_lock, make_fake_switch
 
@@ -23,6 +24,8 @@ def coord_with_switch(hass):
     entry.add_to_hass(hass)
     sw = make_fake_switch("sw-1", is_on=False)
     coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"sw-1": sw}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -63,6 +66,20 @@ async def test_turn_off_sets_optimistic(coord_with_switch, hass):
     assert ent._optimistic_is_on is False
 
 
+async def test_skipped_turn_off_still_writes_state(coord_with_switch, hass):
+    coord, sw = coord_with_switch
+    coord.skip_redundant_command.return_value = True
+    ent = UhomeSwitchEntity(coord, "sw-1")
+    ent.hass = hass
+    ent.entity_id = "switch.fake_switch"
+    ent.async_write_ha_state = MagicMock()
+
+    await ent.async_turn_off()
+
+    sw.turn_off.assert_not_awaited()
+    ent.async_write_ha_state.assert_called_once()
+
+
 async def test_coordinator_update_clears_optimistic_on_confirm(coord_with_switch, hass):
     coord, sw = coord_with_switch
     ent = UhomeSwitchEntity(coord, "sw-1")
@@ -71,6 +88,7 @@ async def test_coordinator_update_clears_optimistic_on_confirm(coord_with_switch
     ent._optimistic_is_on = True
     sw.is_on = True
 
+    coord.optimistic.confirm("sw-1", sw)  # as the coordinator does
     ent._handle_coordinator_update()
 
     assert ent._optimistic_is_on is None
@@ -95,6 +113,8 @@ async def test_assumed_state_respects_optimistic_config(hass):
     entry.add_to_hass(hass)
     sw = make_fake_switch("sw-1")
     coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"sw-1": sw}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -119,6 +139,10 @@ async def test_setup_entry_filters_non_switch_devices(hass):
     lock = make_fake_lock("lock-1")
 
     coord = MagicMock()
+
+    coord.optimistic = OptimisticLedger()
+
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"sw-1": sw, "lock-1": lock}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -142,15 +166,17 @@ async def test_setup_entry_filters_non_switch_devices(hass):
 
 
 def test_available_false_when_coordinator_failed(hass):
-    """coordinator.poll_healthy_enough=False → available is False."""
+    """coordinator.device_available() False → available is False."""
     entry = make_config_entry()
     entry.add_to_hass(hass)
     sw = make_fake_switch("sw-1", available=True)
     coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"sw-1": sw}
     coord.config_entry = entry
     coord.last_update_success = False
-    coord.poll_healthy_enough = False
+    coord.device_available.return_value = False
 
     ent = UhomeSwitchEntity(coord, "sw-1")
     assert ent.available is False
@@ -200,6 +226,8 @@ async def test_turn_on_no_optimistic_when_disabled(hass):
     entry.add_to_hass(hass)
     sw = make_fake_switch("sw-1")
     coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"sw-1": sw}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -226,6 +254,8 @@ async def test_turn_off_no_optimistic_when_disabled(hass):
     entry.add_to_hass(hass)
     sw = make_fake_switch("sw-1")
     coord = MagicMock()
+    coord.optimistic = OptimisticLedger()
+    coord.skip_redundant_command.return_value = False
     coord.devices = {"sw-1": sw}
     coord.config_entry = entry
     coord.last_update_success = True
@@ -437,3 +467,52 @@ async def test_switch_commands_stamp_optimistic_set_at(coord_with_switch, hass):
     sw.is_on = True
     await ent.async_turn_off()
     assert ent._optimistic_set_at is not None
+
+
+def test_coordinator_update_skips_unchanged_device(coord_with_switch, hass):
+    """Updates that did not touch this device must not write state."""
+    coord, sw = coord_with_switch
+    coord.device_changed = MagicMock(return_value=False)
+    ent = UhomeSwitchEntity(coord, "sw-1")
+    ent.hass = hass
+    ent.entity_id = "switch.fake_switch"
+    ent.async_write_ha_state = MagicMock()
+
+    ent._handle_coordinator_update()
+
+    ent.async_write_ha_state.assert_not_called()
+    coord.device_changed.assert_called_with("sw-1")
+
+
+def test_coordinator_update_still_expires_optimism_when_unchanged(
+    coord_with_switch, hass,
+):
+    """Outstanding optimism is evaluated even when the device did not change."""
+    coord, sw = coord_with_switch
+    coord.device_changed = MagicMock(return_value=False)
+    ent = UhomeSwitchEntity(coord, "sw-1")
+    ent.hass = hass
+    ent.entity_id = "switch.fake_switch"
+    ent.async_write_ha_state = MagicMock()
+    ent._optimistic_is_on = True
+    ent._optimistic_set_at = dt_util.utcnow() - OPTIMISTIC_TIMEOUT - timedelta(seconds=1)
+
+    ent._handle_coordinator_update()
+
+    assert ent._optimistic_is_on is None
+    ent.async_write_ha_state.assert_called_once()
+
+
+async def test_turn_on_schedules_confirmation_poll(coord_with_switch, hass):
+    coord, sw = coord_with_switch
+    ent = UhomeSwitchEntity(coord, "sw-1")
+    ent.hass = hass
+    ent.entity_id = "switch.fake"
+
+    await ent.async_turn_on()
+
+    device_id, confirmed = coord.async_confirm_device_state.call_args.args
+    assert device_id == "sw-1"
+    assert confirmed() is False
+    sw.is_on = True
+    assert confirmed() is True
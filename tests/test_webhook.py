@@ -56,7 +56,7 @@ def webhook_handler(hass, mock_uhome_api):
     h._push_secret = "correct-secret"
     # Wire up hass.data so _handle_webhook can find the coordinator
     coord = MagicMock()
-    coord.update_push_data = AsyncMock()
+    coord.enqueue_push_data = MagicMock()
     hass.data[DOMAIN] = {"entry-1": {"coordinator": coord}}
     return h, coord
 
@@ -99,7 +99,20 @@ async def test_accepts_correct_bearer_token(webhook_handler, hass):
     )
     resp = await h._handle_webhook(hass, "wh-id", req)
     assert resp.status == 200
-    coord.update_push_data.assert_awaited_once()
+    coord.enqueue_push_data.assert_called_once()
+
+
+async def test_local_request_body_is_read_and_parsed_once(webhook_handler, hass):
+    h, coord = webhook_handler
+    req = _make_request(
+        body=b'{"payload": {"devices": []}}',
+        headers={"Authorization": "Bearer correct-secret"},
+    )
+    resp = await h._handle_webhook(hass, "wh-id", req)
+    assert resp.status == 200
+    req.read.assert_awaited_once()
+    req.json.assert_not_awaited()
+    coord.enqueue_push_data.assert_called_once_with({"payload": {"devices": []}})
 
 
 async def test_accepts_cloudhook_style_request_without_read(webhook_handler, hass):
@@ -112,7 +125,7 @@ async def test_accepts_cloudhook_style_request_without_read(webhook_handler, has
     )
     resp = await h._handle_webhook(hass, "wh-id", req)
     assert resp.status == 200
-    coord.update_push_data.assert_awaited_once()
+    coord.enqueue_push_data.assert_called_once()
 
 
 async def test_accepts_cloudhook_list_payload_without_read(webhook_handler, hass):
@@ -126,7 +139,7 @@ async def test_accepts_cloudhook_list_payload_without_read(webhook_handler, hass
     )
     resp = await h._handle_webhook(hass, "wh-id", req)
     assert resp.status == 200
-    coord.update_push_data.assert_awaited_once_with(list_payload)
+    coord.enqueue_push_data.assert_called_once_with(list_payload)
 
 
 async def test_accepts_list_payload_via_read_fallback(webhook_handler, hass):
@@ -140,8 +153,8 @@ async def test_accepts_list_payload_via_read_fallback(webhook_handler, hass):
     )
     resp = await h._handle_webhook(hass, "wh-id", req)
     assert resp.status == 200
-    coord.update_push_data.assert_awaited_once()
-    args = coord.update_push_data.await_args.args[0]
+    coord.enqueue_push_data.assert_called_once()
+    args = coord.enqueue_push_data.call_args.args[0]
     assert isinstance(args, list)
     assert args[0]["id"] == "lock-1"
 
@@ -156,7 +169,7 @@ async def test_rejects_scalar_json_body(webhook_handler, hass):
     )
     resp = await h._handle_webhook(hass, "wh-id", req)
     assert resp.status == 400
-    coord.update_push_data.assert_not_awaited()
+    coord.enqueue_push_data.assert_not_called()
 
 
 async def test_rejects_null_json_body(webhook_handler, hass):
@@ -171,7 +184,7 @@ async def test_rejects_null_json_body(webhook_handler, hass):
     req.json = AsyncMock(return_value=None)
     resp = await h._handle_webhook(hass, "wh-id", req)
     assert resp.status == 400
-    coord.update_push_data.assert_not_awaited()
+    coord.enqueue_push_data.assert_not_called()
 
 
 async def test_rejects_unknown_entry_id(hass, mock_uhome_api):
@@ -201,7 +214,7 @@ async def test_rejects_when_push_secret_not_initialised(hass, mock_uhome_api):
     h = AsyncPushUpdateHandler(hass, mock_uhome_api, entry_id="entry-1")
     h._push_secret = None
     coord = MagicMock()
-    coord.update_push_data = AsyncMock()
+    coord.enqueue_push_data = MagicMock()
     hass.data[DOMAIN] = {"entry-1": {"coordinator": coord}}
 
     req = _make_request(
@@ -210,7 +223,7 @@ async def test_rejects_when_push_secret_not_initialised(hass, mock_uhome_api):
     )
     resp = await h._handle_webhook(hass, "wh-id", req)
     assert resp.status == 401
-    coord.update_push_data.assert_not_awaited()
+    coord.enqueue_push_data.assert_not_called()
 
 
 async def test_unregister_always_attempts_cloudhook_delete(hass, mock_uhome_api):
@@ -245,3 +258,27 @@ async def test_unregister_deletes_cloudhook_when_used(hass, mock_uhome_api):
     mock_delete.assert_awaited_once()
     assert h._used_cloudhook is False
     assert h._unregister_webhook is None
+
+
+async def test_previous_secret_accepted_only_during_grace(
+    webhook_handler, hass, freezer,
+):
+    from datetime import timedelta
+
+    from homeassistant.util import dt as dt_util
+
+    h, coord = webhook_handler
+    h._previous_secret = "old-secret"
+    h._previous_secret_expires = dt_util.utcnow() + timedelta(minutes=5)
+    req = _make_request(
+        body=b'{"payload": {"devices": []}}',
+        headers={"Authorization": "Bearer old-secret"},
+    )
+
+    resp = await h._handle_webhook(hass, "wh-id", req)
+    assert resp.status == 200
+
+    freezer.tick(timedelta(minutes=6))
+    resp = await h._handle_webhook(hass, "wh-id", req)
+    assert resp.status == 403
+    coord.enqueue_push_data.assert_called_once()
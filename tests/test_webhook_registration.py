@@ -277,3 +277,75 @@ async def test_24h_reregister_timer_does_not_raise(hass, mock_uhome_api):
         # Clean up the (now re-armed) timer so the lingering-timer guard in
         # pytest-homeassistant-custom-component's teardown doesn't fail us.
         await h.unregister_webhook()
+
+
+async def test_daily_rotation_reregisters_with_a_fresh_secret(
+    hass, mock_uhome_api,
+):
+    h = AsyncPushUpdateHandler(hass, mock_uhome_api, entry_id="e1")
+    cloudhook_url = "https://hooks.nabu.casa/abc123"
+
+    with patch(
+        _TRY_CLOUDHOOK, new_callable=AsyncMock, return_value=cloudhook_url
+    ), patch(
+        "custom_components.u_tec.api.webhook.async_register",
+        return_value=None,
+    ) as mock_register, patch(
+        "custom_components.u_tec.api.webhook.async_unregister",
+    ), patch.object(h, "_delete_cloudhook", new_callable=AsyncMock):
+        await h.async_register_webhook(auth_data=MagicMock())
+        first_secret = h._push_secret
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=24, minutes=1))
+        await hass.async_block_till_done()
+
+        assert mock_uhome_api.set_push_status.await_count == 2
+        url, secret = mock_uhome_api.set_push_status.await_args.args
+        assert url == cloudhook_url
+        assert secret == h._push_secret != first_secret
+        assert h._is_valid_secret(first_secret)  # still in its grace period
+        mock_register.assert_called_once()
+
+        await h.unregister_webhook()
+
+
+async def test_daily_rotation_registers_a_changed_url(hass, mock_uhome_api):
+    h = AsyncPushUpdateHandler(hass, mock_uhome_api, entry_id="e1")
+    new_url = "https://hooks.nabu.casa/new"
+
+    with patch(
+        _TRY_CLOUDHOOK,
+        new_callable=AsyncMock,
+        side_effect=["https://hooks.nabu.casa/old", new_url],
+    ), patch(
+        "custom_components.u_tec.api.webhook.async_register",
+        return_value=None,
+    ), patch(
+        "custom_components.u_tec.api.webhook.async_unregister",
+    ), patch.object(h, "_delete_cloudhook", new_callable=AsyncMock):
+        await h.async_register_webhook(auth_data=MagicMock())
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(hours=24, minutes=1))
+        await hass.async_block_till_done()
+
+        assert mock_uhome_api.set_push_status.await_args.args[0] == new_url
+        assert h.webhook_url == new_url
+
+        await h.unregister_webhook()
+
+
+async def test_failed_rotation_keeps_current_secret(hass, mock_uhome_api):
+    from utec_py.exceptions import ApiError
+
+    h = AsyncPushUpdateHandler(hass, mock_uhome_api, entry_id="e1")
+    h.webhook_url = "https://hooks.nabu.casa/abc123"
+    h._push_secret = "current"
+    mock_uhome_api.set_push_status.side_effect = ApiError(500, "down")
+
+    with patch(
+        _TRY_CLOUDHOOK, new_callable=AsyncMock, return_value=h.webhook_url
+    ):
+        assert await h.async_register_webhook(MagicMock()) is False
+
+    assert h._push_secret == "current"
+    assert h._previous_secret is None